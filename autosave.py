@@ -0,0 +1,265 @@
+"""
+Crash-safe autosave of the session in progress
+The GUI packs the engine state into a compact struct-packed snapshot after every batch of
+events and hands it to a background writer. The writer keeps only the newest snapshot, writes
+at most once per interval through a temp file and rename, and removes the file once the
+session is over. On the next launch the snapshot is unpacked straight back into the engine:
+
+    python game.py                                   # resumes an unfinished session
+    python game.py --autosave-file class.save        # or --no-autosave
+
+The secret of the round in progress is not stored; it is drawn again from the session seed.
+The seed is stored, though, and it determines every secret, so the file is no protection
+against a player who wants to peek.
+"""
+
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+from engine import GameRound
+from leaderboard import write_bytes_atomic
+from round_history import RoundHistory
+from secret_stream import SecretNumberStream
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".number_guessing_game", "autosave.dat")
+
+# Seconds between writes; snapshots submitted in between replace each other
+AUTOSAVE_INTERVAL = 1.0
+
+# File layout: header, session, current round and its guesses, then the finished rounds
+MAGIC = b"NGAS"
+VERSION = 2
+HEADER = struct.Struct("<4sHI")
+# seed, whether the seed was chosen, range, attempts, hints, total rounds, current round, wins,
+# session attempts, secrets handed out, finished rounds, their guesses
+SESSION = struct.Struct("<16sBiiIIIIIIQIQ")
+# range, possible range, hint range, attempts left, hints left, hint level, active, won, guesses
+ROUND = struct.Struct("<iiiiiiIIIBBI")
+SEED_BYTES = 16
+
+_NOTHING = object()
+
+
+class AutosaveError(ValueError):
+    """A snapshot that cannot be resumed"""
+
+
+def _array_bytes(values):
+    """Little-endian bytes of an array"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode, data, offset, count):
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    if end > len(data):
+        raise AutosaveError("Snapshot is truncated")
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+
+def pack_session(session):
+    """Snapshot of a session in progress, or None when there is nothing to resume"""
+    game_round = session.round
+    history = session.history
+    if game_round is None or (not game_round.active and len(history) >= session.total_rounds):
+        return None
+    stream = session.secret_stream
+    rules = session.rules
+    try:
+        seed = stream.seed.to_bytes(SEED_BYTES, "little", signed=True)
+    except OverflowError:
+        # Seeds this large are never picked by the game itself
+        return None
+
+    # Guesses of finished rounds in one run
+    guesses = array("h")
+    for slab in history.slabs:
+        guesses.extend(slab)
+    parts = [
+        SESSION.pack(seed, session.seed is not None, rules.low, rules.high, rules.attempts, rules.hints,
+                     session.total_rounds, session.current_round, session.wins, session.session_attempts,
+                     stream.handed_out, len(history), history.total_guesses),
+        ROUND.pack(game_round.low, game_round.high, game_round.min_possible,
+                   game_round.max_possible, game_round.hint_range[0], game_round.hint_range[1],
+                   game_round.attempts_left, game_round.hints_left, game_round.hint_level,
+                   game_round.active, game_round.won, len(game_round.previous_guesses)),
+        struct.pack(f"<{len(game_round.previous_guesses)}i", *game_round.previous_guesses),
+        _array_bytes(history.secrets),
+        _array_bytes(history.hints_used),
+        _array_bytes(history.won),
+        _array_bytes(history.offsets),
+        _array_bytes(guesses),
+    ]
+    body = b"".join(parts)
+    return HEADER.pack(MAGIC, VERSION, zlib.crc32(body)) + body
+
+
+def unpack_session(data):
+    """Decode a snapshot into a dict of session, round and history fields"""
+    if len(data) < HEADER.size:
+        raise AutosaveError("Snapshot is truncated")
+    magic, version, checksum = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise AutosaveError("Not an autosave file")
+    if version != VERSION:
+        raise AutosaveError(f"Unsupported autosave version {version}")
+    body = memoryview(data)[HEADER.size:]
+    if zlib.crc32(body) != checksum:
+        raise AutosaveError("Snapshot is corrupted")
+    if len(body) < SESSION.size + ROUND.size:
+        raise AutosaveError("Snapshot is truncated")
+
+    (seed, seed_chosen, low, high, attempts, hints, total_rounds, current_round, wins, session_attempts,
+     handed_out, rounds, history_guesses) = SESSION.unpack_from(body, 0)
+    if handed_out == 0:
+        raise AutosaveError("Snapshot has no round in progress")
+    offset = SESSION.size
+    round_fields = ROUND.unpack_from(body, offset)
+    offset += ROUND.size
+    previous_guesses, offset = _read_array("i", body, offset, round_fields[-1])
+
+    secrets, offset = _read_array("h", body, offset, rounds)
+    hints_used, offset = _read_array("b", body, offset, rounds)
+    won, offset = _read_array("b", body, offset, rounds)
+    offsets, offset = _read_array("q", body, offset, rounds)
+    guesses, offset = _read_array("h", body, offset, history_guesses)
+    if offset != len(body):
+        raise AutosaveError("Snapshot has trailing data")
+    return {
+        "seed": int.from_bytes(seed, "little", signed=True),
+        "seed_chosen": bool(seed_chosen),
+        "rules": (low, high, attempts, hints),
+        "total_rounds": total_rounds,
+        "current_round": current_round,
+        "wins": wins,
+        "session_attempts": session_attempts,
+        "handed_out": handed_out,
+        "round": round_fields[:-1] + (previous_guesses.tolist(),),
+        "history": (secrets, hints_used, won, offsets, guesses),
+    }
+
+
+def restore_session(session, state):
+    """Put an unpacked snapshot back into a GameSession without publishing any events"""
+    rules = session.rules
+    if state["rules"] != (rules.low, rules.high, rules.attempts, rules.hints):
+        raise AutosaveError("The snapshot was saved under different rules")
+
+    # A fresh stream with the same seed skips the secrets already used; the last of them
+    # belongs to the round in progress
+    stream = SecretNumberStream(rules.low, rules.high, state["seed"])
+    stream.prefetch(max(state["total_rounds"], state["handed_out"]))
+    secret = stream.take(state["handed_out"])[-1]
+
+    (low, high, min_possible, max_possible, hint_low, hint_high, attempts_left,
+     hints_left, hint_level, active, won, previous_guesses) = state["round"]
+    game_round = GameRound(secret, attempts_left, hints_left, low, high, rules)
+    game_round.hint_level = hint_level
+    game_round.active = bool(active)
+    game_round.won = bool(won)
+    game_round.min_possible = min_possible
+    game_round.max_possible = max_possible
+    game_round.previous_guesses = previous_guesses
+    game_round.hint_range = (hint_low, hint_high)
+
+    history = RoundHistory(session.history.slab_size)
+    secrets, hints_used, round_won, offsets, guesses = state["history"]
+    history.secrets = secrets
+    history.hints_used = hints_used
+    history.won = round_won
+    history.offsets = offsets
+    history.slabs = [guesses[start:start + history.slab_size]
+                     for start in range(0, len(guesses), history.slab_size)] or [array("h")]
+    history.total_guesses = len(guesses)
+
+    # Later sessions draw a fresh seed unless the saved one was chosen
+    session.seed = state["seed"] if state["seed_chosen"] else None
+    session.total_rounds = state["total_rounds"]
+    session.current_round = state["current_round"]
+    session.wins = state["wins"]
+    session.session_attempts = state["session_attempts"]
+    session.secret_stream = stream
+    session.round = game_round
+    session.history = history
+
+
+def resume_session(session, path=DEFAULT_PATH):
+    """Restore the session saved at path; returns False when there is none"""
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except FileNotFoundError:
+        return False
+    restore_session(session, unpack_session(data))
+    return True
+
+
+class Autosaver:
+    """Background writer that keeps only the newest snapshot and writes at most once per interval"""
+
+    def __init__(self, path=DEFAULT_PATH, interval=AUTOSAVE_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.writes = 0
+        self.coalesced = 0
+        self.last_error = None
+
+        self._pending = _NOTHING
+        self._closing = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, data):
+        """Queue a snapshot (None removes the save); replaces one that is not written yet"""
+        with self._condition:
+            if self._pending is not _NOTHING:
+                self.coalesced += 1
+            self._pending = data
+            self._condition.notify()
+
+    def close(self):
+        """Write the last snapshot now and stop the writer"""
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        condition = self._condition
+        while True:
+            with condition:
+                condition.wait_for(lambda: self._pending is not _NOTHING or self._closing)
+                data = self._pending
+                self._pending = _NOTHING
+            if data is not _NOTHING:
+                self._write(data)
+            with condition:
+                if self._closing and self._pending is _NOTHING:
+                    return
+                # Later snapshots wait out the interval unless the game is closing
+                condition.wait_for(lambda: self._closing, timeout=self.interval)
+
+    def _write(self, data):
+        try:
+            if data is None:
+                try:
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+            else:
+                write_bytes_atomic(self.path, data)
+            self.writes += 1
+            self.last_error = None
+        except OSError as error:
+            self.last_error = error
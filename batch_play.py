@@ -0,0 +1,252 @@
+"""
+Non-interactive batch play
+Streams commands line by line from a file or stdin through validate_guess and the engine's
+GameRound, and writes one JSON result per command to stdout:
+
+    python batch_play.py guesses.txt --seed 7 > results.jsonl
+    cat guesses.txt | python game.py --batch -
+
+Each line is a guess as a player would type it, "hint" for a hint, or "new" to abandon the
+round. Blank lines and lines starting with "#" are skipped. A new round starts automatically
+with the next command after a round is won or lost.
+
+The pipeline is a chain of generators over fixed-size chunks, so memory stays constant no
+matter how large the input is: read_chunks -> play -> write_results.
+
+Throughput falls short of the 1M commands per second target on the machines it was measured
+on; most of the time goes to GameRound.guess and to building each JSON line.
+"""
+
+import argparse
+import json
+import sys
+
+from engine import DANGEROUS_CHARS, GameRound, validate_guess
+from rules import active_rules
+from secret_stream import SecretNumberStream
+
+READ_SIZE = 1 << 16
+
+# Secrets drawn from the stream at a time
+SECRET_BLOCK = 4096
+
+# Overlong lines keep this many characters from each end
+LINE_EDGE = 64
+
+# Distinct inputs remembered by the validation cache before it is cleared
+CACHE_SIZE = 65536
+
+HINT_COMMAND = "hint"
+NEW_ROUND_COMMAND = "new"
+NO_HINTS_ERROR = "❌ No hints left!"
+
+
+class _OverlongLine:
+    """Summary of a line too long to keep in memory
+
+    sanitize_input rejects any dangerous character first, then any stripped input longer than
+    the rules' input length limit, so the middle of a long line is reduced to whether it holds a dangerous
+    character, its surrounding whitespace (capped) and its non-whitespace core while short.
+    """
+
+    def __init__(self, head):
+        # Anything longer than this is "too long" to sanitize_input
+        self.limit = active_rules().max_input_length + 1
+        self.head = head
+        self.dangerous = False
+        self.long = False
+        self.lead = 0
+        self.core = ""
+        self.trail = ""
+
+    def add_middle(self, text):
+        if not self.dangerous:
+            self.dangerous = any(char in text for char in DANGEROUS_CHARS)
+        if self.long:
+            return
+        if not self.core:
+            stripped = text.lstrip()
+            self.lead += len(text) - len(stripped)
+            text = stripped
+            if not text:
+                return
+        body = text.rstrip()
+        if body:
+            self.core += self.trail + body
+            self.trail = text[len(body):][:self.limit]
+        else:
+            self.trail = (self.trail + text)[:self.limit]
+        if len(self.core) > self.limit:
+            self.long = True
+
+    def text(self, tail):
+        if self.dangerous:
+            middle = DANGEROUS_CHARS[0]
+        elif self.long:
+            middle = "x" * self.limit
+        else:
+            middle = " " * min(self.lead, self.limit) + self.core + self.trail
+        return self.head + middle + tail
+
+
+def read_chunks(handle, read_size=READ_SIZE):
+    """Yield lists of lines (without line endings) from a text handle, in constant memory"""
+    carry = ""
+    overlong = None
+    while True:
+        chunk = handle.read(read_size)
+        if not chunk:
+            break
+        lines = (carry + chunk).split("\n")
+        carry = lines.pop()
+        if lines:
+            if overlong is not None:
+                lines[0] = overlong.text(lines[0])
+                overlong = None
+            if "\r" in chunk:
+                lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+            yield lines
+
+        # A line without an end in sight keeps only its two edges
+        if len(carry) > 4 * LINE_EDGE:
+            if overlong is None:
+                overlong = _OverlongLine(carry[:LINE_EDGE])
+                carry = carry[LINE_EDGE:]
+            overlong.add_middle(carry[:-LINE_EDGE])
+            carry = carry[-LINE_EDGE:]
+
+    if overlong is not None:
+        carry = overlong.text(carry)
+    if carry:
+        yield [carry[:-1] if carry.endswith("\r") else carry]
+
+
+def _invalid_text(error_message):
+    """End of the JSON result for a rejected command"""
+    return f'"result": "invalid", "error": {json.dumps(error_message, ensure_ascii=False)}}}'
+
+
+def _classify(line, rules):
+    """(kind, number, end of the JSON result for rejected input) for one command line"""
+    command = line.strip().lower()
+    if command == HINT_COMMAND:
+        return _HINT, None, None
+    if command == NEW_ROUND_COMMAND:
+        return _NEW_ROUND, None, None
+    number, error_message = validate_guess(line, rules=rules)
+    if error_message:
+        return _INVALID, None, _invalid_text(error_message)
+    return _GUESS, number, None
+
+
+_GUESS, _INVALID, _HINT, _NEW_ROUND = range(4)
+
+
+def play(chunks, seed=None, rules=None):
+    """Play chunks of command lines and yield a list of JSON lines per chunk"""
+    rules = rules or active_rules()
+    secrets = SecretNumberStream(rules.low, rules.high, seed)
+    pending = iter(())
+    game_round = None
+    round_number = 0
+
+    # Inputs repeat a lot (there are only so many numbers), so classification is cached
+    classified = {}
+    no_hints = _invalid_text(NO_HINTS_ERROR)
+    hint_texts = {}
+    guess_texts = {}
+    round_text = ""
+
+    line_number = 0
+    for lines in chunks:
+        results = []
+        append = results.append
+        for line in lines:
+            line_number += 1
+            if not line or line[0] == "#":
+                continue
+
+            if game_round is None or not game_round.active:
+                secret = next(pending, None)
+                if secret is None:
+                    # Secrets are drawn in blocks; the stream yields the same sequence either way
+                    pending = iter(secrets.take(SECRET_BLOCK))
+                    secret = next(pending)
+                game_round = GameRound(secret, rules=rules)
+                round_number += 1
+                round_text = f', "round": {round_number}, '
+
+            entry = classified.get(line)
+            if entry is None:
+                if len(classified) >= CACHE_SIZE:
+                    classified.clear()
+                entry = classified[line] = _classify(line, rules)
+            kind, number, text = entry
+
+            if kind == _GUESS:
+                result = game_round.guess(number)
+                if game_round.active:
+                    # Only a few hundred distinct guess results exist, so their text is cached
+                    key = (number, result, game_round.attempts_left)
+                    text = guess_texts.get(key)
+                    if text is None:
+                        text = guess_texts[key] = (f'"guess": {number}, "result": "{result}", '
+                                                   f'"attempts_left": {game_round.attempts_left}}}')
+                else:
+                    text = (f'"guess": {number}, "result": "{result}", '
+                            f'"attempts_left": {game_round.attempts_left}, '
+                            f'"secret": {game_round.secret_number}, '
+                            f'"won": {"true" if game_round.won else "false"}}}')
+            elif kind == _HINT:
+                if game_round.hints_left == 0:
+                    text = no_hints
+                else:
+                    message, bounds = game_round.hint()
+                    text = hint_texts.get(message)
+                    if text is None:
+                        text = hint_texts[message] = (f'"result": "hint", '
+                                                      f'"hint": {json.dumps(message, ensure_ascii=False)}, '
+                                                      f'"hints_left": {game_round.hints_left}}}')
+            elif kind == _NEW_ROUND:
+                text = f'"result": "abandoned", "secret": {game_round.secret_number}}}'
+                game_round.active = False
+            append(f'{{"line": {line_number}{round_text}{text}')
+        if results:
+            yield results
+
+
+def write_results(batches, output):
+    """Write lists of JSON lines and return how many were written"""
+    written = 0
+    for results in batches:
+        output.write("\n".join(results))
+        output.write("\n")
+        written += len(results)
+    return written
+
+
+def run_batch(path, seed=None, output=None):
+    """Play a command file ("-" for stdin) and write the results to output (default stdout)"""
+    if output is None:
+        # Results are UTF-8 JSON lines whatever the locale
+        sys.stdout.reconfigure(encoding="utf-8")
+        output = sys.stdout
+    if path == "-":
+        # Bad input bytes never stop a run
+        sys.stdin.reconfigure(encoding="utf-8", errors="replace", newline="")
+        return write_results(play(read_chunks(sys.stdin), seed), output)
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as handle:
+        return write_results(play(read_chunks(handle), seed), output)
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Play guess and hint commands from a file or stdin")
+    parser.add_argument("path", nargs="?", default="-", help="Command file (default: stdin)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the secret numbers")
+    args = parser.parse_args()
+    run_batch(args.path, args.seed)
+
+
+if __name__ == "__main__":
+    main()
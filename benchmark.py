@@ -0,0 +1,389 @@
+"""
+Performance baseline for the game rules
+Replays a fixed corpus of seeded (or recorded) sessions through validate_guess and GameSession,
+records per-sample timings and the tracemalloc peak into a versioned results file, and compares
+them with an earlier results file:
+
+    python benchmark.py --output old.json
+    python benchmark.py --output new.json --baseline old.json --tolerance 0.25
+
+Timings drift from one process to the next by more than most code changes, so every benchmark
+is timed in several fresh processes and each process contributes one sample: the median of its
+runs. A benchmark only counts as a regression when the median of those samples is slower than
+the tolerance allows and a one-sided Mann-Whitney U test over them says the slowdown is
+significant. Any regression exits with 1.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from bots import StrategyTipPlayer, play_round
+from engine import GameSession, validate_guess
+from rules import active_rules
+
+# Bumped whenever the layout of the results file changes
+RESULTS_FORMAT = 2
+
+# Fresh processes per measurement; each one adds a single sample to the comparison
+DEFAULT_PROCESSES = 6
+
+# Allowed slowdown of the median; identical code run twice differs by up to about 20% here
+DEFAULT_TOLERANCE = 0.25
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".number_guessing_game", "benchmarks")
+
+# Raw inputs mixed into the seeded corpus so the rejection paths are timed too
+INVALID_INPUTS = ("", "abc", "12;", "1000", "4-2", "<b>", "--5", "99999999999", "-7", "101")
+
+HINT_COMMAND = "hint"
+
+
+def build_corpus(sessions=200, seed=0, max_rounds=5):
+    """Record seeded sessions played by the Strategy Tip bot, with some invalid input mixed in"""
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(sessions):
+        session_seed = seed * 1000003 + index
+        rounds = rng.randint(1, max_rounds)
+        session = GameSession(seed=session_seed)
+        session.new_session(rounds)
+        player = StrategyTipPlayer()
+        commands = []
+        player.new_round(session.round.low, session.round.high,
+                         session.round.attempts_left, session.round.hints_left)
+
+        while len(session.history) < rounds:
+            if not session.game_active:
+                session.start_round()
+                player.new_round(session.round.low, session.round.high,
+                                 session.round.attempts_left, session.round.hints_left)
+
+            if rng.random() < 0.1:
+                commands.append(rng.choice(INVALID_INPUTS))
+                continue
+
+            action = player.next_action()
+            if action[0] == HINT_COMMAND:
+                commands.append(HINT_COMMAND)
+                session.get_hint()
+                player.observe({"type": "hint", "bounds": session.round.hint_range})
+            else:
+                # Pad some guesses with whitespace like a player would
+                commands.append(f" {action[1]} " if rng.random() < 0.2 else str(action[1]))
+                result = session.make_guess(action[1])
+                player.observe({"type": result, "guess": action[1]})
+
+        corpus.append({"seed": session_seed, "rounds": rounds, "commands": commands})
+    return corpus
+
+
+def load_corpus(path):
+    """Read a recorded corpus: one {"seed", "rounds", "commands"} object per line"""
+    corpus = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                entry = json.loads(line)
+                corpus.append({"seed": entry["seed"], "rounds": entry["rounds"],
+                               "commands": list(entry["commands"])})
+    return corpus
+
+
+def save_corpus(corpus, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        for entry in corpus:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def corpus_digest(corpus):
+    """Fingerprint of the corpus; results are only comparable when the digests match"""
+    data = json.dumps(corpus, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def replay_session(entry):
+    """Replay one corpus session through the real rules and return (wins, attempts)"""
+    session = GameSession(seed=entry["seed"])
+    session.new_session(entry["rounds"])
+    for command in entry["commands"]:
+        if len(session.history) == session.total_rounds:
+            break
+        if not session.game_active:
+            session.start_round()
+        if command == HINT_COMMAND:
+            session.get_hint()
+            continue
+        number, error_message = validate_guess(command)
+        if error_message:
+            session.reject_guess(command, error_message)
+        else:
+            session.make_guess(number)
+    return session.wins, session.session_attempts
+
+
+def _bench_replay(corpus):
+    wins = 0
+    for entry in corpus:
+        wins += replay_session(entry)[0]
+    return wins
+
+
+def _bench_validate(corpus):
+    valid = 0
+    for entry in corpus:
+        for command in entry["commands"]:
+            if validate_guess(command)[1] is None:
+                valid += 1
+    return valid
+
+
+def _bench_rounds(corpus):
+    player = StrategyTipPlayer()
+    rules = active_rules()
+    size = rules.high - rules.low + 1
+    wins = 0
+    for entry in corpus:
+        for secret in range(rules.low + entry["seed"] % size, rules.high + 1, 17):
+            wins += play_round(player, secret).won
+    return wins
+
+
+BENCHMARKS = {
+    "replay": _bench_replay,
+    "validate": _bench_validate,
+    "rounds": _bench_rounds,
+}
+
+
+def _time_benchmarks(corpus, samples, names):
+    """Time every benchmark in this process; returns {name: (checksum, timings)}"""
+    timed = {}
+    for name in names:
+        workload = BENCHMARKS[name]
+        # Warm-up run, so caches and allocator pools are primed before timing
+        checksum = workload(corpus)
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            workload(corpus)
+            timings.append(time.perf_counter() - start)
+        timed[name] = (checksum, timings)
+    return timed
+
+
+def _time_in_process(job):
+    return _time_benchmarks(*job)
+
+
+def measure(corpus, samples=15, names=None, processes=DEFAULT_PROCESSES):
+    """Time every benchmark in fresh processes, one after another, then measure peak memory here
+
+    "runs" keeps every timing per process and "samples" the median of each process's runs,
+    which is what compare() tests.
+    """
+    names = list(names or BENCHMARKS)
+    # Spawned processes start from nothing, so each sees its own hash seed and memory layout
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        timed = pool.map(_time_in_process, [(corpus, samples, names)] * processes, chunksize=1)
+
+    results = {}
+    for name in names:
+        runs = [process[name][1] for process in timed]
+        # tracemalloc slows allocations down, so it never runs while timing
+        tracemalloc.start()
+        try:
+            BENCHMARKS[name](corpus)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        results[name] = {"samples": [statistics.median(timings) for timings in runs], "runs": runs,
+                         "peak_bytes": peak, "checksum": timed[0][name][0]}
+    return results
+
+
+def current_label():
+    """Name for this build: the git revision when available"""
+    try:
+        output = subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                                text=True, timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return output.stdout.strip() or "unknown"
+
+
+def run(corpus, samples=15, label=None, names=None, processes=DEFAULT_PROCESSES):
+    """Measure the corpus and return a results document"""
+    return {
+        "format": RESULTS_FORMAT,
+        "label": label or current_label(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {"digest": corpus_digest(corpus), "sessions": len(corpus),
+                   "commands": sum(len(entry["commands"]) for entry in corpus)},
+        "benchmarks": measure(corpus, samples, names, processes),
+    }
+
+
+def save_results(results, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+        handle.write("\n")
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as handle:
+        results = json.load(handle)
+    if results.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"Unsupported results format {results.get('format')!r} in {path}")
+    return results
+
+
+def mann_whitney_greater(current, baseline):
+    """One-sided p-value that current samples tend to be larger than baseline samples
+
+    Uses the normal approximation of the U statistic with tie and continuity corrections,
+    which is accurate enough from about eight samples per side.
+    """
+    n1 = len(current)
+    n2 = len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    rank_sum = 0.0
+    tie_term = 0
+    position = 0
+    while position < len(combined):
+        end = position
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[position][0]:
+            end += 1
+        ties = end - position + 1
+        # Tied values share the average of their ranks (ranks start at 1)
+        average_rank = (position + end) / 2 + 1
+        rank_sum += average_rank * sum(1 for _, group in combined[position:end + 1] if group == 0)
+        tie_term += ties ** 3 - ties
+        position = end + 1
+
+    u_statistic = rank_sum - n1 * (n1 + 1) / 2
+    total = n1 + n2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (u_statistic - n1 * n2 / 2 - 0.5) / variance ** 0.5
+    return 1 - statistics.NormalDist().cdf(z_score)
+
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE, alpha=0.01, memory_tolerance=0.10):
+    """Compare two results documents and return one row per benchmark they share"""
+    if baseline["corpus"]["digest"] != current["corpus"]["digest"]:
+        raise ValueError("Results were measured on different corpora and cannot be compared")
+
+    rows = []
+    for name, now in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            continue
+        before_median = statistics.median(before["samples"])
+        now_median = statistics.median(now["samples"])
+        ratio = now_median / before_median if before_median > 0 else 1.0
+        p_value = mann_whitney_greater(now["samples"], before["samples"])
+        memory_ratio = now["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else 1.0
+        rows.append({
+            "benchmark": name,
+            "baseline_median": before_median,
+            "current_median": now_median,
+            "ratio": ratio,
+            "p_value": p_value,
+            "slower": ratio > 1 + tolerance and p_value < alpha,
+            "memory_ratio": memory_ratio,
+            # Peak memory is deterministic for a fixed corpus, so no test is needed
+            "bigger": memory_ratio > 1 + memory_tolerance,
+        })
+    return rows
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the game rules against a baseline")
+    parser.add_argument("--output", help="Results file to write (default: ~/.number_guessing_game/benchmarks/LABEL.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--corpus", help="Recorded corpus to replay (JSON lines) instead of the seeded one")
+    parser.add_argument("--write-corpus", help="Save the corpus used as JSON lines")
+    parser.add_argument("--sessions", type=int, default=200, help="Sessions in the seeded corpus")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the seeded corpus")
+    parser.add_argument("--samples", type=int, default=15, help="Timed runs per benchmark in each process")
+    parser.add_argument("--processes", type=int, default=DEFAULT_PROCESSES,
+                        help="Fresh processes to time the benchmarks in (one sample each)")
+    parser.add_argument("--benchmarks", nargs="+", choices=sorted(BENCHMARKS), default=None,
+                        help="Benchmarks to run (default: all)")
+    parser.add_argument("--label", help="Name stored with the results (default: git revision)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown of the median time, as a fraction")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10,
+                        help="Allowed growth of the peak memory, as a fraction")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the test")
+    args = parser.parse_args()
+    if args.processes < 1 or args.samples < 1:
+        parser.error("--processes and --samples must be at least 1")
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus(args.sessions, args.seed)
+    if args.write_corpus:
+        save_corpus(corpus, args.write_corpus)
+
+    baseline = load_results(args.baseline) if args.baseline else None
+    results = run(corpus, args.samples, args.label, args.benchmarks, args.processes)
+    output = args.output or os.path.join(DEFAULT_DIR, f"{results['label']}.json")
+    save_results(results, output)
+
+    print(f"{'Benchmark':<10} {'Median ms':>10} {'Peak KiB':>10}")
+    for name, stats in results["benchmarks"].items():
+        print(f"{name:<10} {statistics.median(stats['samples']) * 1000:>10.2f} {stats['peak_bytes'] / 1024:>10.1f}")
+    print(f"\n💾 Results for {results['label']} written to {output}")
+
+    if baseline is None:
+        return
+
+    try:
+        rows = compare(baseline, results, args.tolerance, args.alpha, args.memory_tolerance)
+    except ValueError as error:
+        print(f"❌ {error}")
+        sys.exit(2)
+
+    print(f"\nAgainst {baseline['label']}:")
+    print(f"{'Benchmark':<10} {'Time':>8} {'p-value':>9} {'Memory':>8}")
+    regressions = []
+    for row in rows:
+        flags = []
+        if row["slower"]:
+            flags.append("slower")
+        if row["bigger"]:
+            flags.append("more memory")
+        if flags:
+            regressions.append(row["benchmark"])
+        print(f"{row['benchmark']:<10} {row['ratio'] - 1:>+7.1%} {row['p_value']:>9.4f} "
+              f"{row['memory_ratio'] - 1:>+7.1%}  {', '.join(flags)}")
+
+    if regressions:
+        print(f"\n❌ Regressions in: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
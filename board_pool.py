@@ -0,0 +1,191 @@
+"""
+Many independent game boards driven by one update loop
+Each board owns its round state and a short message buffer but no widgets; the pool funnels
+every board's events into one queue and keeps one timer heap for all next-round delays, so a
+single periodic tick serves every board. Cost per board can be measured from the command line:
+
+    python board_pool.py --boards 50 --rounds 20
+"""
+
+import argparse
+import heapq
+import time
+import tracemalloc
+from collections import deque
+
+from engine import GameSession, optimal_guess
+from events import (EventBus, GuessEvaluated, HintGiven, InvalidGuess, RoundEnded,
+                    RoundStarted, SessionEnded, SessionStarted)
+
+NEXT_ROUND_DELAY = 3.0
+MAX_BOARD_MESSAGES = 200
+
+
+def describe_event(event):
+    """Return the (message, event kind) lines a board shows for an engine event"""
+    if isinstance(event, SessionStarted):
+        return [(f"🎮 New session started with {event.total_rounds} rounds!", event.kind),
+                (f"🎲 Session seed: {event.seed}", "info")]
+    if isinstance(event, RoundStarted):
+        return [(f"🎮 Round {event.round_number} of {event.total_rounds} started!", event.kind)]
+    if isinstance(event, InvalidGuess):
+        return [(event.error, event.kind)]
+    if isinstance(event, GuessEvaluated):
+        if event.result == "correct":
+            return [(f"🎉 Correct! You won! The number was {event.guess}", "win")]
+        arrow = "📈" if event.result == "low" else "📉"
+        lines = [(f"{arrow} {event.guess} is too {event.result}!", event.kind)]
+        if event.attempts_left > 0:
+            range_size = event.max_possible - event.min_possible + 1
+            lines.append((f"🔍 Possible range: {event.min_possible} to {event.max_possible} "
+                          f"({range_size} numbers left)", "info"))
+        return lines
+    if isinstance(event, HintGiven):
+        return [(f"💡 Hint: {event.message}", event.kind)]
+    if isinstance(event, RoundEnded):
+        lines = []
+        if not event.won:
+            lines.append((f"💀 Game Over! The number was {event.secret_number}", "loss"))
+        if event.has_next_round:
+            lines.append(("⏳ Starting next round in 3 seconds...", "info"))
+        return lines
+    if isinstance(event, SessionEnded):
+        return [(f"🏁 Session complete! {event.wins} of {event.total_rounds} rounds won", event.kind)]
+    return []
+
+
+class Board:
+    """One player's game: a session and its recent messages, without any widgets"""
+
+    def __init__(self, board_id, seed=None, max_messages=MAX_BOARD_MESSAGES):
+        self.board_id = board_id
+        self.engine = GameSession(EventBus(), seed)
+        # (timestamp, message, event kind); total_messages keeps counting past the buffer size
+        self.messages = deque(maxlen=max_messages)
+        self.total_messages = 0
+        self.next_round_at = None
+
+    def add_message(self, message, event="info", timestamp=None):
+        self.messages.append((time.time() if timestamp is None else timestamp, message, event))
+        self.total_messages += 1
+
+    def status(self):
+        """Short one-line summary for the board overview"""
+        engine = self.engine
+        if engine.round is None:
+            return "not started"
+        if engine.game_active:
+            return f"R{engine.current_round}/{engine.total_rounds} · {engine.round.attempts_left} left"
+        return f"{engine.wins}/{engine.total_rounds} won"
+
+
+class BoardPool:
+    """Independent boards sharing one event queue and one timer heap"""
+
+    def __init__(self, count, seed=None, next_round_delay=NEXT_ROUND_DELAY, clock=time.monotonic):
+        self.next_round_delay = next_round_delay
+        self.clock = clock
+        self.pending = deque()
+        self.timers = []
+        self._timer_sequence = 0
+        self.boards = []
+        for board_id in range(count):
+            board = Board(board_id, None if seed is None else seed + board_id)
+            board.engine.bus.subscribe_all(lambda event, board=board: self.pending.append((board, event)))
+            self.boards.append(board)
+
+    def __len__(self):
+        return len(self.boards)
+
+    def new_session(self, board_id, total_rounds):
+        """Start a new session on one board, dropping any pending next round"""
+        board = self.boards[board_id]
+        board.next_round_at = None
+        board.engine.new_session(total_rounds)
+
+    def drain(self):
+        """Turn queued events into board messages; returns the ids of boards that changed"""
+        changed = set()
+        now = time.time()
+        while self.pending:
+            board, event = self.pending.popleft()
+            for message, kind in describe_event(event):
+                board.add_message(message, kind, now)
+            if isinstance(event, RoundEnded) and event.has_next_round:
+                self.schedule_next_round(board)
+            changed.add(board.board_id)
+        return changed
+
+    def schedule_next_round(self, board):
+        board.next_round_at = self.clock() + self.next_round_delay
+        self._timer_sequence += 1
+        heapq.heappush(self.timers, (board.next_round_at, self._timer_sequence, board.board_id))
+
+    def run_due(self):
+        """Start the next round on every board whose delay has passed"""
+        now = self.clock()
+        while self.timers and self.timers[0][0] <= now:
+            deadline, sequence, board_id = heapq.heappop(self.timers)
+            board = self.boards[board_id]
+            # A new session since scheduling makes the timer stale
+            if board.next_round_at != deadline:
+                continue
+            board.next_round_at = None
+            board.engine.start_round()
+
+    def tick(self):
+        """One pass of the shared update loop"""
+        self.run_due()
+        return self.drain()
+
+
+def measure(count=50, rounds=10, seed=0):
+    """Play every board with the Strategy Tip policy and report memory and drain cost per board"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    pool = BoardPool(count, seed, next_round_delay=0)
+    for board_id in range(count):
+        pool.new_session(board_id, rounds)
+    pool.drain()
+    setup_bytes = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+
+    drain_seconds = 0.0
+    drains = 0
+    while any(board.engine.round.active or board.next_round_at is not None for board in pool.boards):
+        for board in pool.boards:
+            game_round = board.engine.round
+            if game_round.active:
+                board.engine.make_guess(optimal_guess(game_round.min_possible, game_round.max_possible,
+                                                      game_round.previous_guesses))
+        started = time.perf_counter()
+        pool.tick()
+        drain_seconds += time.perf_counter() - started
+        drains += 1
+
+    total_bytes = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    tracemalloc.stop()
+    return {
+        "boards": count,
+        "setup_bytes_per_board": setup_bytes / count,
+        "bytes_per_board": total_bytes / count,
+        "tick_ms": drain_seconds / max(drains, 1) * 1000,
+        "ticks": drains,
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure the cost of many concurrent boards")
+    parser.add_argument("--boards", type=int, default=50, help="Number of boards")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds per board")
+    args = parser.parse_args()
+
+    report = measure(args.boards, args.rounds)
+    print(f"📏 {report['boards']} boards")
+    print(f"   Memory per board after setup: {report['setup_bytes_per_board'] / 1024:.1f} KiB")
+    print(f"   Memory per board after {args.rounds} rounds: {report['bytes_per_board'] / 1024:.1f} KiB")
+    print(f"   Shared tick for all boards: {report['tick_ms']:.3f} ms over {report['ticks']} ticks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Automated players for the Number Guessing Game
+Bots play the headless rules from engine.py and can be evaluated in parallel:
+
+    python bots.py --bots binary strategy random --rounds 100000 --workers 4
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import GameRound, optimal_guess
+from rules import active_rules
+from secret_stream import SecretNumberStream
+
+# Actions a player can return from next_action
+GUESS = "guess"
+HINT = "hint"
+
+
+class Player:
+    """Base class for automated players
+
+    A player is told about a new round, then repeatedly asked for its next action
+    (("guess", number) or ("hint",)) and shown the feedback for that action.
+    Feedback is a dict with a "type" of "low", "high", "correct" or "hint".
+    """
+
+    name = "player"
+
+    def new_round(self, low, high, attempts, hints):
+        """Reset any per-round state"""
+        self.min_possible = low
+        self.max_possible = high
+        self.attempts_left = attempts
+        self.hints_left = hints
+        self.previous_guesses = []
+
+    def observe(self, feedback):
+        """Narrow the known range from the feedback of the last action"""
+        kind = feedback["type"]
+        if kind == "low":
+            self.previous_guesses.append(feedback["guess"])
+            self.attempts_left -= 1
+            self.min_possible = max(self.min_possible, feedback["guess"] + 1)
+        elif kind == "high":
+            self.previous_guesses.append(feedback["guess"])
+            self.attempts_left -= 1
+            self.max_possible = min(self.max_possible, feedback["guess"] - 1)
+        elif kind == "hint":
+            self.hints_left -= 1
+            bucket_low, bucket_high = feedback["bounds"]
+            self.min_possible = max(self.min_possible, bucket_low)
+            self.max_possible = min(self.max_possible, bucket_high)
+
+    def next_action(self):
+        """Return ("guess", number) or ("hint",)"""
+        raise NotImplementedError
+
+
+class BinarySearchPlayer(Player):
+    """Always guesses the midpoint of the remaining range and never uses hints"""
+
+    name = "binary"
+
+    def next_action(self):
+        return (GUESS, (self.min_possible + self.max_possible) // 2)
+
+
+class StrategyTipPlayer(Player):
+    """Follows the Strategy Tip suggestion and asks for a hint when a win is not guaranteed"""
+
+    name = "strategy"
+
+    def next_action(self):
+        range_size = self.max_possible - self.min_possible + 1
+        # Binary search can always finish ranges up to 2**attempts - 1
+        if self.hints_left > 0 and range_size > (1 << self.attempts_left) - 1:
+            return (HINT,)
+        return (GUESS, optimal_guess(self.min_possible, self.max_possible, self.previous_guesses))
+
+
+class RandomPlayer(Player):
+    """Guesses a random number from the remaining range"""
+
+    name = "random"
+
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+
+    def next_action(self):
+        return (GUESS, self._rng.randint(self.min_possible, self.max_possible))
+
+
+BOTS = {
+    BinarySearchPlayer.name: BinarySearchPlayer,
+    StrategyTipPlayer.name: StrategyTipPlayer,
+    RandomPlayer.name: RandomPlayer,
+}
+
+
+def play_round(player, secret_number, attempts=None, hints=None, low=None, high=None, rules=None):
+    """Play one round with a player and return the finished GameRound"""
+    game_round = GameRound(secret_number, attempts, hints, low, high, rules)
+    player.new_round(game_round.low, game_round.high, game_round.attempts_left, game_round.hints_left)
+
+    while game_round.active:
+        action = player.next_action()
+        if action[0] == HINT:
+            message, bounds = game_round.hint()
+            player.observe({"type": "hint", "message": message, "bounds": bounds})
+        elif action[0] == GUESS:
+            result = game_round.guess(action[1])
+            player.observe({"type": result, "guess": action[1]})
+        else:
+            raise ValueError(f"Unknown action: {action!r}")
+
+    return game_round
+
+
+def _play_chunk(bot_name, seed, rounds, rules):
+    """Worker entry point: play a batch of rounds and return the totals"""
+    # The random bot gets its own stream so it cannot mirror the secret numbers
+    player = RandomPlayer(f"player-{seed}") if bot_name == RandomPlayer.name else BOTS[bot_name]()
+    secrets = SecretNumberStream(rules.low, rules.high, seed).prefetch(rounds)
+
+    wins = 0
+    attempts = 0
+    for secret in secrets:
+        game_round = play_round(player, secret, rules=rules)
+        wins += game_round.won
+        attempts += game_round.attempts_used
+
+    return wins, attempts, rounds
+
+
+def evaluate(bot_name, rounds=10000, seed=0, workers=None, chunk_size=5000, rules=None):
+    """Evaluate a bot over many rounds across a process pool"""
+    if bot_name not in BOTS:
+        raise ValueError(f"Unknown bot: {bot_name}")
+    # Workers get the rules with every chunk; a spawned worker would only know the defaults
+    rules = rules or active_rules()
+
+    workers = workers or os.cpu_count() or 1
+    chunks = []
+    remaining = rounds
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        # Each chunk gets its own derived seed so results do not depend on scheduling
+        chunks.append((bot_name, seed * 1000003 + len(chunks), size, rules))
+        remaining -= size
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_play_chunk(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_play_chunk, *zip(*chunks)))
+    elapsed = time.perf_counter() - start
+
+    wins = sum(result[0] for result in results)
+    attempts = sum(result[1] for result in results)
+    played = sum(result[2] for result in results)
+
+    return {
+        "bot": bot_name,
+        "rounds": played,
+        "win_rate": (wins / played) * 100 if played else 0.0,
+        "mean_attempts": attempts / played if played else 0.0,
+        "rounds_per_sec": played / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    """Command line entry point for evaluating bots"""
+    parser = argparse.ArgumentParser(description="Evaluate automated players")
+    parser.add_argument("--bots", nargs="+", choices=sorted(BOTS), default=sorted(BOTS),
+                        help="Bots to evaluate")
+    parser.add_argument("--rounds", type=int, default=10000, help="Rounds per bot")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the secret numbers")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    print(f"{'Bot':<10} {'Rounds':>10} {'Win rate':>10} {'Attempts':>10} {'Rounds/sec':>12}")
+    for bot_name in args.bots:
+        report = evaluate(bot_name, args.rounds, args.seed, args.workers)
+        print(f"{report['bot']:<10} {report['rounds']:>10} {report['win_rate']:>9.1f}% "
+              f"{report['mean_attempts']:>10.2f} {report['rounds_per_sec']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
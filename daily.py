@@ -0,0 +1,364 @@
+"""
+Daily challenge: one secret number per day, the same for everyone
+The secret comes from a seed derived from the date, so every machine with the same rules draws
+the same number. The midpoint solution, the shortest Strategy Tip path to each day's secret
+over how many hints are taken first, is solved once and cached on disk, and results are kept
+as two bytes per day so streaks over years of history are found with a few bytes operations:
+
+    python game.py --daily
+    python daily.py --precompute 365
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from engine import optimal_guess
+from leaderboard import write_bytes_atomic
+from rules import active_rules
+from secret_stream import SecretNumberStream
+
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".number_guessing_game")
+DEFAULT_SOLUTIONS_PATH = os.path.join(DATA_DIR, "daily_solutions.dat")
+DEFAULT_RESULTS_PATH = os.path.join(DATA_DIR, "daily_results.dat")
+
+SEED_PREFIX = "number-guessing-daily"
+
+# Solutions file: header, then one fixed-size record per day and rules
+SOLUTIONS_MAGIC = b"NGDS"
+SOLUTIONS_VERSION = 1
+SOLUTIONS_HEADER = struct.Struct("<4sHI")
+# day ordinal, rules key, secret, attempts, hints used, guesses in the path, the path
+MAX_PATH = 20
+SOLUTION = struct.Struct(f"<IIhBBB{MAX_PATH}hx")
+
+# Results file: header with the first day, then attempts and flags for every day since
+RESULTS_MAGIC = b"NGDR"
+RESULTS_VERSION = 1
+RESULTS_HEADER = struct.Struct("<4sHI")
+WON_FLAG = 0x80
+HINTS_MASK = 0x7F
+# Maps a flags byte to 1 when the day was won
+WON_TABLE = bytes(1 if flags & WON_FLAG else 0 for flags in range(256))
+
+
+def daily_seed(day):
+    """Seed shared by everyone playing on day"""
+    digest = hashlib.sha256(f"{SEED_PREFIX}:{day.isoformat()}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def daily_secret(day, rules=None):
+    """The day's secret number: the first one a session seeded with daily_seed draws"""
+    rules = rules or active_rules()
+    return SecretNumberStream(rules.low, rules.high, daily_seed(day)).next_secret()
+
+
+def rules_key(rules):
+    """Fingerprint of the rules a solution depends on"""
+    return zlib.crc32(repr((rules.low, rules.high, rules.hints, rules.hint_cuts)).encode("ascii"))
+
+
+@dataclass(frozen=True)
+class Solution:
+    """Midpoint solution: fewest attempts the Strategy Tip needs for a day's secret, and how
+
+    This is not the fewest guesses possible; a player who guesses the secret first time beats it.
+    """
+    day: date
+    secret: int
+    attempts: int
+    hints: int
+    guesses: tuple
+
+    def hint_messages(self, rules=None):
+        rules = rules or active_rules()
+        return [rules.hint_message(self.secret, level) for level in range(self.hints)]
+
+    def describe(self):
+        """Short summary such as "2 hints, then 50 → 37 → 40" """
+        path = " → ".join(str(guess) for guess in self.guesses)
+        if not self.hints:
+            return path
+        return f"{self.hints} hint{'s' if self.hints != 1 else ''}, then {path}"
+
+
+def strategy_path(secret, low, high):
+    """Guesses the Strategy Tip suggests until it finds secret in [low, high]"""
+    guesses = []
+    while True:
+        guess = optimal_guess(low, high, guesses)
+        guesses.append(guess)
+        if guess == secret:
+            return guesses
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def solve(day, rules=None):
+    """Midpoint solution: the shortest Strategy Tip path over how many hints are taken first
+
+    Hints cost no attempts but a narrower bucket does not always shorten the search, so every
+    number of hints is tried; ties go to fewer hints.
+    """
+    rules = rules or active_rules()
+    secret = daily_secret(day, rules)
+    best = None
+    # Hints past the last level reveal nothing new
+    for hints in range(min(rules.hints, len(rules.hint_cuts)) + 1):
+        low, high = rules.hint_bounds(secret, hints - 1) if hints else (rules.low, rules.high)
+        guesses = strategy_path(secret, low, high)
+        if best is None or len(guesses) < len(best.guesses):
+            best = Solution(day, secret, len(guesses), hints, tuple(guesses))
+    return best
+
+
+class SolutionCache:
+    """Solved days kept on disk so a player's result is compared without solving anything"""
+
+    def __init__(self):
+        self._solutions = {}
+        # Records read from disk stay raw until their day is asked for
+        self._records = {}
+        self.changed = False
+
+    def __len__(self):
+        return len(self._solutions.keys() | self._records.keys())
+
+    def get(self, day, rules=None):
+        """The day's solution, solved and cached on first use"""
+        rules = rules or active_rules()
+        key = (day.toordinal(), rules_key(rules))
+        solution = self._solutions.get(key)
+        if solution is None:
+            record = self._records.pop(key, None)
+            if record is not None:
+                secret, attempts, hints, length, *path = record
+                solution = Solution(day, secret, attempts, hints, tuple(path[:length]))
+            else:
+                solution = solve(day, rules)
+                self.changed = True
+            self._solutions[key] = solution
+        return solution
+
+    def precompute(self, first_day, days, rules=None):
+        """Solve days days starting at first_day; returns how many were new"""
+        before = len(self)
+        for offset in range(days):
+            self.get(first_day + timedelta(days=offset), rules)
+        return len(self) - before
+
+    def to_bytes(self):
+        pack = SOLUTION.pack
+        records = dict(self._records)
+        for key, solution in self._solutions.items():
+            path = solution.guesses + (0,) * (MAX_PATH - len(solution.guesses))
+            records[key] = (solution.secret, solution.attempts, solution.hints, len(solution.guesses)) + path
+        parts = [SOLUTIONS_HEADER.pack(SOLUTIONS_MAGIC, SOLUTIONS_VERSION, len(records))]
+        parts.extend(pack(*key, *record) for key, record in sorted(records.items()))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, count = SOLUTIONS_HEADER.unpack_from(data)
+        if magic != SOLUTIONS_MAGIC or version != SOLUTIONS_VERSION:
+            raise ValueError("Not a daily solutions file")
+        end = SOLUTIONS_HEADER.size + count * SOLUTION.size
+        if len(data) < end:
+            raise ValueError("Daily solutions file is truncated")
+
+        cache = cls()
+        cache._records = {(record[0], record[1]): record[2:]
+                          for record in SOLUTION.iter_unpack(data[SOLUTIONS_HEADER.size:end])}
+        return cache
+
+    def save(self, path=DEFAULT_SOLUTIONS_PATH):
+        write_bytes_atomic(path, self.to_bytes())
+        self.changed = False
+
+    @classmethod
+    def load(cls, path=DEFAULT_SOLUTIONS_PATH):
+        """Load the cache, returning an empty one when the file is missing or unreadable"""
+        try:
+            with open(path, "rb") as handle:
+                return cls.from_bytes(handle.read())
+        except (OSError, ValueError, struct.error):
+            return cls()
+
+
+class DailyResults:
+    """A player's daily results, two bytes per day: attempts (0 = not played) and flags"""
+
+    def __init__(self, first_day=None, data=b""):
+        self.first_day = first_day
+        self._data = bytearray(data)
+
+    def _index(self, day):
+        """Byte offset of day, growing the table in either direction as needed"""
+        if self.first_day is None:
+            self.first_day = day
+        offset = day.toordinal() - self.first_day.toordinal()
+        if offset < 0:
+            self._data[:0] = bytes(-2 * offset)
+            self.first_day = day
+            offset = 0
+        if 2 * offset >= len(self._data):
+            self._data.extend(bytes(2 * offset + 2 - len(self._data)))
+        return 2 * offset
+
+    def result(self, day):
+        """(won, attempts, hints) for day, or None when it was not played"""
+        if self.first_day is None:
+            return None
+        offset = day.toordinal() - self.first_day.toordinal()
+        if not 0 <= 2 * offset < len(self._data) or not self._data[2 * offset]:
+            return None
+        attempts, flags = self._data[2 * offset:2 * offset + 2]
+        return bool(flags & WON_FLAG), attempts, flags & HINTS_MASK
+
+    def record(self, day, won, attempts, hints):
+        """Store the first result of a day; replays return False and change nothing"""
+        if self.result(day) is not None:
+            return False
+        index = self._index(day)
+        self._data[index] = max(1, min(attempts, 255))
+        self._data[index + 1] = (WON_FLAG if won else 0) | min(hints, HINTS_MASK)
+        return True
+
+    def _won_days(self):
+        """One byte per day since first_day: 1 when won"""
+        return bytes(self._data[1::2]).translate(WON_TABLE)
+
+    def current_streak(self, today):
+        """Days won in a row up to today (or yesterday while today is still open)"""
+        if self.first_day is None:
+            return 0
+        won = self._won_days()
+        end = today.toordinal() - self.first_day.toordinal() + 1
+        if end <= 0:
+            return 0
+        if end > len(won):
+            # Days after the last result were not played
+            if end - len(won) > 1:
+                return 0
+            end = len(won)
+        elif not self._data[2 * (end - 1)]:
+            end -= 1
+        return end - (won.rfind(b"\0", 0, end) + 1)
+
+    def best_streak(self):
+        won = self._won_days()
+        return max(map(len, won.split(b"\0"))) if won else 0
+
+    def summary(self, today):
+        played = len(self._data) // 2 - self._data[0::2].count(0)
+        wins = self._won_days().count(1)
+        return {
+            "played": played,
+            "wins": wins,
+            "current_streak": self.current_streak(today),
+            "best_streak": self.best_streak(),
+        }
+
+    def to_bytes(self):
+        first = self.first_day.toordinal() if self.first_day is not None else 0
+        return RESULTS_HEADER.pack(RESULTS_MAGIC, RESULTS_VERSION, first) + bytes(self._data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, first = RESULTS_HEADER.unpack_from(data)
+        if magic != RESULTS_MAGIC or version != RESULTS_VERSION:
+            raise ValueError("Not a daily results file")
+        body = data[RESULTS_HEADER.size:]
+        # A torn last day is dropped
+        body = body[:len(body) - len(body) % 2]
+        return cls(date.fromordinal(first) if first else None, body)
+
+    def save(self, path=DEFAULT_RESULTS_PATH):
+        write_bytes_atomic(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path=DEFAULT_RESULTS_PATH):
+        """Load results, returning empty ones when the file is missing or unreadable"""
+        try:
+            with open(path, "rb") as handle:
+                return cls.from_bytes(handle.read())
+        except (OSError, ValueError, struct.error):
+            return cls()
+
+
+class DailyPlay:
+    """The daily challenge inside a game: only the first round of the date-seeded session is scored
+
+    Later rounds of that session, or a restarted first round, can draw the day's number again
+    without being the challenge.
+    """
+
+    def __init__(self, day, solution, results):
+        self.day = day
+        self.solution = solution
+        self.results = results
+        self.finished = False
+
+    def is_daily_round(self, event):
+        return (not self.finished and event.round_number == 1
+                and event.secret_number == self.solution.secret)
+
+    def finish(self, event):
+        """Score a finished daily round; returns True when it was the day's first play"""
+        self.finished = True
+        return self.results.record(self.day, event.won, event.attempts_used, event.hints_used)
+
+
+def compare(solution, won, attempts):
+    """One-line comparison of a result with the day's solution"""
+    if not won:
+        return f"📅 The midpoint solution needed {solution.attempts}: {solution.describe()}"
+    if attempts <= solution.attempts:
+        return f"📅 You took {attempts}, the midpoint solution took {solution.attempts} - perfect!"
+    return f"📅 You took {attempts}, the midpoint solution took {solution.attempts} ({solution.describe()})"
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Daily challenge solutions and streaks")
+    parser.add_argument("--date", type=date.fromisoformat, default=None,
+                        help="Day to show (YYYY-MM-DD, default today)")
+    parser.add_argument("--precompute", type=int, default=0, metavar="DAYS",
+                        help="Solve and cache this many days starting at --date")
+    parser.add_argument("--reveal", action="store_true", help="Show the day's secret and midpoint solution")
+    args = parser.parse_args()
+
+    day = args.date or date.today()
+    cache = SolutionCache.load()
+    if args.precompute:
+        added = cache.precompute(day, args.precompute)
+        print(f"🧮 Solved {added} new days ({len(cache)} cached)")
+    solution = cache.get(day)
+    if cache.changed:
+        cache.save()
+
+    print(f"📅 Daily challenge {day.isoformat()} (seed {daily_seed(day)})")
+    if args.reveal:
+        print(f"🎯 Secret {solution.secret}; midpoint solution {solution.attempts} attempts: {solution.describe()}")
+        for message in solution.hint_messages():
+            print(f"💡 {message}")
+
+    results = DailyResults.load()
+    result = results.result(day)
+    if result is not None:
+        won, attempts, hints = result
+        print(compare(solution, won, attempts))
+    summary = results.summary(date.today())
+    print(f"🔥 Streak {summary['current_streak']} (best {summary['best_streak']}), "
+          f"{summary['wins']} wins in {summary['played']} days played")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Headless rules for the Number Guessing Game
+Everything here runs without Tk so bots, simulations and tests can play real rounds
+"""
+
+from bisect import bisect_right
+
+from events import (EventBus, GuessEvaluated, HintGiven, InvalidGuess, RoundEnded,
+                    RoundStarted, SessionEnded, SessionStarted)
+from round_history import RoundHistory
+from rules import DEFAULT_RULES, active_rules
+from secret_stream import SecretNumberStream
+
+# Limits of the default rules profile; game code reads the active Rules tables instead
+MIN_NUMBER = DEFAULT_RULES.low
+MAX_NUMBER = DEFAULT_RULES.high
+MAX_ATTEMPTS = DEFAULT_RULES.attempts
+MAX_HINTS = DEFAULT_RULES.hints
+
+# Bucket boundaries used by each hint level (the last entry covers every deeper level)
+HINT_CUTS = DEFAULT_RULES.hint_cuts
+
+# Characters rejected by sanitize_input
+DANGEROUS_CHARS = ('<', '>', '&', '"', "'", '\\', '/', ';', '|', '`', '$')
+
+# Guesses accepted by sanitize_input before the game range is applied
+MIN_INPUT = DEFAULT_RULES.min_input
+MAX_INPUT = DEFAULT_RULES.max_input
+MAX_INPUT_LENGTH = DEFAULT_RULES.max_input_length
+
+
+def generate_hint(number, hint_level, rules=None):
+    """Generate a hint based on the hint level - improved for better strategy"""
+    return (rules or active_rules()).hint_message(number, hint_level)
+
+
+def hint_bounds(number, hint_level, low=None, high=None, rules=None):
+    """Return the inclusive (low, high) bucket a hint reveals for the number"""
+    rules = rules or active_rules()
+    if (low is None or low == rules.low) and (high is None or high == rules.high):
+        return rules.hint_bounds(number, hint_level)
+
+    # A round with its own range: the rules' cuts still apply, its own ends replace the outer ones
+    low = rules.low if low is None else low
+    high = rules.high if high is None else high
+    cuts = rules.hint_cuts[min(hint_level, len(rules.hint_cuts) - 1)]
+    index = bisect_right(cuts, number)
+    bucket_low = cuts[index - 1] if index > 0 else low
+    bucket_high = cuts[index] - 1 if index < len(cuts) else high
+    return bucket_low, bucket_high
+
+
+def optimal_guess(min_possible, max_possible, previous_guesses):
+    """Binary search suggestion used by the Strategy Tip button"""
+    optimal = (min_possible + max_possible) // 2
+
+    # Check if this guess was already made
+    if optimal in previous_guesses:
+        # Find the next best guess
+        if optimal + 1 <= max_possible and optimal + 1 not in previous_guesses:
+            optimal = optimal + 1
+        elif optimal - 1 >= min_possible and optimal - 1 not in previous_guesses:
+            optimal = optimal - 1
+        else:
+            # Find any number in range not guessed yet
+            for num in range(min_possible, max_possible + 1):
+                if num not in previous_guesses:
+                    optimal = num
+                    break
+
+    return optimal
+
+
+def sanitize_input(user_input, rules=None):
+    """Sanitize and validate user input"""
+    rules = rules or active_rules()
+    if not user_input:
+        return None, "❌ Input cannot be empty!"
+
+    # Remove whitespace and convert to string
+    sanitized = str(user_input).strip()
+
+    # Check for malicious characters or patterns
+    if any(char in sanitized for char in DANGEROUS_CHARS):
+        return None, "❌ Invalid characters detected!"
+
+    # Check length limit
+    if len(sanitized) > rules.max_input_length:
+        return None, rules.messages["too_long"]
+
+    # Remove non-numeric characters except minus sign
+    cleaned = ''.join(char for char in sanitized if char.isdigit() or char == '-')
+
+    if not cleaned:
+        return None, "❌ Please enter a valid number!"
+
+    try:
+        # Convert to integer
+        number = int(cleaned)
+
+        # Validate range
+        if number < rules.min_input or number > rules.max_input:
+            return None, "❌ Number out of acceptable range!"
+
+        return number, None
+
+    except ValueError:
+        return None, "❌ Please enter a valid integer!"
+
+
+def sanitize_rounds_input(user_input, rules=None):
+    """Sanitize input for number of rounds"""
+    rules = rules or active_rules()
+    if not user_input:
+        return None, "❌ Please enter number of rounds!"
+
+    # Remove whitespace and convert to string
+    sanitized = str(user_input).strip()
+
+    # Check for dangerous characters
+    if not sanitized.isdigit():
+        return None, "❌ Please enter only numbers!"
+
+    # Check length limit
+    if len(sanitized) > rules.max_rounds_digits:
+        return None, rules.messages["too_many_rounds"]
+
+    try:
+        rounds = int(sanitized)
+
+        # Validate range
+        if rounds < 1:
+            return None, "❌ Must be at least 1 round!"
+        elif rounds > rules.max_rounds:
+            return None, rules.messages["too_many_rounds"]
+
+        return rounds, None
+
+    except ValueError:
+        return None, "❌ Please enter a valid number!"
+
+
+def validate_guess(user_input, low=None, high=None, rules=None):
+    """Sanitize a guess and check it against the game range, as make_guess does"""
+    rules = rules or active_rules()
+    number, error_message = sanitize_input(user_input, rules)
+    if error_message:
+        return None, error_message
+    low = rules.low if low is None else low
+    high = rules.high if high is None else high
+    if number < low or number > high:
+        return None, rules.range_message(low, high)
+    return number, None
+
+
+class GameRound:
+    """State and rules for a single round, independent of any GUI"""
+
+    def __init__(self, secret_number, attempts=None, hints=None, low=None, high=None, rules=None):
+        self.rules = rules or active_rules()
+        self.secret_number = secret_number
+        self.low = self.rules.low if low is None else low
+        self.high = self.rules.high if high is None else high
+        self.attempts_left = self.rules.attempts if attempts is None else attempts
+        self.hints_left = self.rules.hints if hints is None else hints
+        self.hint_level = 0
+        self.active = True
+        self.won = False
+
+        # Strategy tracking
+        self.min_possible = self.low
+        self.max_possible = self.high
+        self.previous_guesses = []
+        # Bucket revealed by the latest hint (hints are nested, so it holds all hint knowledge)
+        self.hint_range = (self.low, self.high)
+
+    def guess(self, number):
+        """Apply a guess and return "correct", "low" or "high" """
+        if not self.active:
+            raise ValueError("Round is already over")
+        if number < self.low or number > self.high:
+            raise ValueError(f"Number must be between {self.low} and {self.high}")
+
+        self.previous_guesses.append(number)
+        self.attempts_left -= 1
+
+        if number == self.secret_number:
+            self.won = True
+            self.active = False
+            return "correct"
+
+        if number < self.secret_number:
+            self.min_possible = max(self.min_possible, number + 1)
+            result = "low"
+        else:
+            self.max_possible = min(self.max_possible, number - 1)
+            result = "high"
+
+        if self.attempts_left == 0:
+            self.active = False
+        return result
+
+    def hint(self):
+        """Spend a hint and return (message, (low, high)) for the revealed bucket"""
+        if not self.active:
+            raise ValueError("Round is already over")
+        if self.hints_left == 0:
+            raise ValueError("No hints left")
+
+        message = generate_hint(self.secret_number, self.hint_level, self.rules)
+        bounds = hint_bounds(self.secret_number, self.hint_level, self.low, self.high, self.rules)
+        self.hint_range = (max(self.hint_range[0], bounds[0]), min(self.hint_range[1], bounds[1]))
+        self.hints_left -= 1
+        self.hint_level += 1
+        return message, bounds
+
+    @property
+    def attempts_used(self):
+        """Number of guesses made so far"""
+        return len(self.previous_guesses)
+
+
+class GameSession:
+    """A multi-round session that publishes its progress on an event bus"""
+
+    def __init__(self, bus=None, seed=None, total_rounds=1, rules=None):
+        self.rules = rules or active_rules()
+        self.bus = bus if bus is not None else EventBus()
+        self.seed = seed
+        self.total_rounds = total_rounds
+        self.current_round = 1
+        self.wins = 0
+        self.session_attempts = 0
+        self.secret_stream = SecretNumberStream(self.rules.low, self.rules.high, seed)
+        self.round = None
+        # Every finished round of the current session
+        self.history = RoundHistory()
+
+    @property
+    def game_active(self):
+        """True while the current round accepts guesses"""
+        return self.round is not None and self.round.active
+
+    def new_session(self, total_rounds):
+        """Reset the statistics and start the first round of a new session"""
+        self.total_rounds = total_rounds
+        self.current_round = 1
+        self.wins = 0
+        self.session_attempts = 0
+        self.history.clear()
+
+        # Fresh secret stream for the session, with every round drawn up front
+        self.secret_stream = SecretNumberStream(self.rules.low, self.rules.high, self.seed)
+        self.secret_stream.prefetch(total_rounds)
+
+        self.bus.publish(SessionStarted(total_rounds, self.secret_stream.seed))
+        self.start_round()
+
+    def start_round(self):
+        """Start (or restart) the current round with the next secret number"""
+        self.round = GameRound(self.secret_stream.next_secret(), rules=self.rules)
+        self.bus.publish(RoundStarted(self.current_round, self.total_rounds))
+
+    def reject_guess(self, raw_input, error):
+        """Report input that failed validation"""
+        self.bus.publish(InvalidGuess(self.current_round, str(raw_input), error))
+
+    def make_guess(self, number):
+        """Apply a sanitized guess; returns "correct", "low", "high" or None if rejected"""
+        if not self.game_active:
+            return None
+
+        game_round = self.round
+        if number < game_round.low or number > game_round.high:
+            self.reject_guess(number, self.rules.range_message(game_round.low, game_round.high))
+            return None
+
+        result = game_round.guess(number)
+        self.session_attempts += 1
+        if result == "correct":
+            self.wins += 1
+
+        self.bus.publish(GuessEvaluated(
+            self.current_round, number, result, game_round.attempts_left,
+            game_round.min_possible, game_round.max_possible
+        ))
+
+        if not game_round.active:
+            self._end_round()
+        return result
+
+    def get_hint(self):
+        """Spend a hint; returns the hint message or None when none can be given"""
+        if not self.game_active or self.round.hints_left == 0:
+            return None
+
+        level = self.round.hint_level
+        message, bounds = self.round.hint()
+        self.bus.publish(HintGiven(self.current_round, level, message, self.round.hints_left))
+        return message
+
+    def _end_round(self):
+        game_round = self.round
+        has_next_round = self.current_round < self.total_rounds
+        self.history.record_round(game_round)
+
+        self.bus.publish(RoundEnded(
+            self.current_round, game_round.won, game_round.secret_number,
+            game_round.attempts_used, game_round.hint_level, has_next_round
+        ))
+
+        if has_next_round:
+            # The caller decides when to start the next round
+            self.current_round += 1
+        else:
+            self.bus.publish(SessionEnded(self.wins, self.total_rounds, self.session_attempts))
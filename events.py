@@ -0,0 +1,112 @@
+"""
+In-process event bus for the Number Guessing Game
+The engine publishes typed events; the GUI, loggers and other consumers subscribe to them
+"""
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SessionStarted:
+    """A new session with a fixed number of rounds began"""
+    total_rounds: int
+    seed: int
+    kind = "session_start"
+
+
+@dataclass(frozen=True)
+class RoundStarted:
+    """A new round began"""
+    round_number: int
+    total_rounds: int
+    kind = "round_start"
+
+
+@dataclass(frozen=True)
+class InvalidGuess:
+    """A guess was rejected before it used an attempt"""
+    round_number: int
+    raw_input: str
+    error: str
+    kind = "invalid_input"
+
+
+@dataclass(frozen=True)
+class GuessEvaluated:
+    """A valid guess was compared with the secret number"""
+    round_number: int
+    guess: int
+    result: str
+    attempts_left: int
+    min_possible: int
+    max_possible: int
+    kind = "guess"
+
+
+@dataclass(frozen=True)
+class HintGiven:
+    """A hint was spent"""
+    round_number: int
+    hint_level: int
+    message: str
+    hints_left: int
+    kind = "hint"
+
+
+@dataclass(frozen=True)
+class RoundEnded:
+    """A round was won or lost"""
+    round_number: int
+    won: bool
+    secret_number: int
+    attempts_used: int
+    hints_used: int
+    has_next_round: bool
+    kind = "round_end"
+
+
+@dataclass(frozen=True)
+class SessionEnded:
+    """The last round of a session finished"""
+    wins: int
+    total_rounds: int
+    attempts: int
+    kind = "session_end"
+
+
+class EventBus:
+    """Synchronous publish/subscribe dispatcher keyed by event class"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers = {}
+        self._catch_all = ()
+
+    def subscribe(self, event_type, handler):
+        """Call handler for every published event of event_type; returns an unsubscribe function"""
+        with self._lock:
+            # Handler tuples are replaced, never mutated, so publish can read them without locking
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
+        return lambda: self._remove(event_type, handler)
+
+    def subscribe_all(self, handler):
+        """Call handler for every published event"""
+        with self._lock:
+            self._catch_all = self._catch_all + (handler,)
+        return lambda: self._remove(None, handler)
+
+    def _remove(self, event_type, handler):
+        with self._lock:
+            if event_type is None:
+                self._catch_all = tuple(h for h in self._catch_all if h is not handler)
+            else:
+                handlers = tuple(h for h in self._handlers.get(event_type, ()) if h is not handler)
+                self._handlers[event_type] = handlers
+
+    def publish(self, event):
+        """Deliver an event to its subscribers on the calling thread"""
+        for handler in self._handlers.get(type(event), ()):
+            handler(event)
+        for handler in self._catch_all:
+            handler(event)
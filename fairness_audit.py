@@ -0,0 +1,269 @@
+"""
+Fairness audit of secret number generation and hint buckets
+Draws secrets from the game's own SecretNumberStream in large batches, packs each batch into a
+bytes object and does all counting with C-level bytes operations (count and translate), so tens
+of millions of secrets take seconds without NumPy:
+
+    python fairness_audit.py --count 20000000 --seed 1
+
+Reports a chi-square test of uniformity, a Wald-Wolfowitz runs test above/below the median,
+and the difficulty of every hint bucket. Exits with 1 when a check fails.
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+
+from engine import generate_hint, hint_bounds
+from rules import active_rules
+from secret_stream import SecretNumberStream
+from strategy_analysis import wins_within
+
+BATCH_SIZE = 1000000
+
+
+def _stream_batches(seed, low, high):
+    """Batches from the generator the game uses"""
+    stream = SecretNumberStream(low, high, seed)
+    return stream.take
+
+
+def _randint_batches(seed, low, high):
+    """Batches from plain random.randint, for comparison"""
+    randint = random.Random(seed).randint
+    return lambda count: [randint(low, high) for _ in range(count)]
+
+
+GENERATORS = {
+    "stream": _stream_batches,
+    "randint": _randint_batches,
+}
+
+
+def draw_batches(count, batch_size=BATCH_SIZE, seed=0, generator="stream", low=None, high=None):
+    """Yield secrets as bytes objects holding secret - low, batch_size at a time (default: the rules' range)"""
+    rules = active_rules()
+    low = rules.low if low is None else low
+    high = rules.high if high is None else high
+    if high - low > 255:
+        raise ValueError("The audit packs secrets into bytes, so the range must span at most 256 numbers")
+    draw = GENERATORS[generator](seed, low, high)
+    while count > 0:
+        size = min(batch_size, count)
+        values = draw(size)
+        yield bytes(values) if low == 0 else bytes(value - low for value in values)
+        count -= size
+
+
+class SecretTally:
+    """Running counts for the uniformity and runs tests, fed one bytes batch at a time"""
+
+    def __init__(self, low=None, high=None):
+        rules = active_rules()
+        low = rules.low if low is None else low
+        high = rules.high if high is None else high
+        self.low = low
+        self.high = high
+        self.counts = [0] * (high - low + 1)
+        self.total = 0
+
+        # Offsets above the median become b"1", below become b"0"; a secret equal to the
+        # median (only when the range has a middle number) is dropped from the runs test
+        span = high - low
+        self._above = bytes(49 if 2 * offset > span else 48 for offset in range(256))
+        self._drop = bytes([span // 2]) if span % 2 == 0 else b""
+        self.above = 0
+        self.below = 0
+        self.runs = 0
+        self._last = b""
+
+    def add(self, batch):
+        counts = self.counts
+        for offset in range(len(counts)):
+            counts[offset] += batch.count(offset)
+        self.total += len(batch)
+
+        symbols = batch.translate(self._above, self._drop)
+        if not symbols:
+            return
+        ones = symbols.count(b"1")
+        self.above += ones
+        self.below += len(symbols) - ones
+        # "01" and "10" cannot overlap with themselves, so count() sees every change
+        self.runs += symbols.count(b"01") + symbols.count(b"10")
+        if symbols[:1] != self._last:
+            self.runs += 1
+        self._last = symbols[-1:]
+
+
+def chi_square_p_value(statistic, degrees):
+    """Upper tail of the chi-square distribution (Wilson-Hilferty normal approximation)"""
+    if degrees <= 0:
+        return 1.0
+    scale = 2 / (9 * degrees)
+    z_score = ((statistic / degrees) ** (1 / 3) - (1 - scale)) / scale ** 0.5
+    return 1 - statistics.NormalDist().cdf(z_score)
+
+
+def chi_square_test(counts):
+    """(statistic, degrees of freedom, p-value) for equal expected counts"""
+    total = sum(counts)
+    expected = total / len(counts)
+    statistic = sum((count - expected) ** 2 for count in counts) / expected if expected else 0.0
+    degrees = len(counts) - 1
+    return statistic, degrees, chi_square_p_value(statistic, degrees)
+
+
+def runs_test(tally):
+    """(runs, expected runs, z-score, two-sided p-value) for runs above/below the median"""
+    above = tally.above
+    below = tally.below
+    total = above + below
+    if above == 0 or below == 0:
+        return tally.runs, float(tally.runs), 0.0, 1.0
+    expected = 2 * above * below / total + 1
+    variance = (expected - 1) * (expected - 2) / (total - 1)
+    z_score = (tally.runs - expected) / variance ** 0.5
+    return tally.runs, expected, z_score, 2 * (1 - statistics.NormalDist().cdf(abs(z_score)))
+
+
+def midpoint_attempts(secret, low, high):
+    """Guesses the Strategy Tip midpoint policy needs to find secret in [low, high]"""
+    attempts = 1
+    guess = (low + high) // 2
+    while guess != secret:
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+        guess = (low + high) // 2
+        attempts += 1
+    return attempts
+
+
+def bucket_difficulty(counts, rules=None):
+    """One row per hint bucket for 0 up to the rules' number of hints used
+
+    Hints are nested, so after h hints the secret lies in the level h - 1 bucket. Each row
+    compares the share of secrets that landed in the bucket with its fair share, and the
+    midpoint policy's mean attempts for uniform secrets with the mean over the drawn secrets.
+    """
+    rules = rules or active_rules()
+    low = rules.low
+    high = rules.high
+    total = sum(counts)
+    rows = []
+    for hints in range(rules.hints + 1):
+        buckets = {}
+        for secret in range(low, high + 1):
+            bounds = hint_bounds(secret, hints - 1, rules=rules) if hints else (low, high)
+            buckets.setdefault(bounds, []).append(secret)
+        for (bucket_low, bucket_high), secrets in sorted(buckets.items()):
+            size = len(secrets)
+            needed = [midpoint_attempts(secret, bucket_low, bucket_high) for secret in secrets]
+            drawn = sum(counts[secret - low] for secret in secrets)
+            weighted = sum(counts[secret - low] * need for secret, need in zip(secrets, needed))
+            rows.append({
+                "hints": hints,
+                "low": bucket_low,
+                "high": bucket_high,
+                "size": size,
+                "share": drawn / total if total else 0.0,
+                "fair_share": size / (high - low + 1),
+                "mean_attempts": sum(needed) / size,
+                "drawn_mean_attempts": weighted / drawn if drawn else 0.0,
+                "worst_case": max(needed),
+                "win_probability": wins_within(size, rules.attempts) / size,
+            })
+    return rows
+
+
+def hint_text_mismatches(rules=None):
+    """(hint level, secret, message) for every hint whose wording excludes the secret
+
+    Messages without numbers in them say nothing that can be checked and are skipped.
+    """
+    rules = rules or active_rules()
+    mismatches = []
+    for level in range(len(rules.hint_cuts)):
+        for secret in range(rules.low, rules.high + 1):
+            message = generate_hint(secret, level, rules)
+            numbers = [int(value) for value in re.findall(r"\d+", message)]
+            if not numbers:
+                continue
+            if "less than" in message:
+                fits = secret < numbers[0]
+            elif "or greater" in message:
+                fits = secret >= numbers[0]
+            else:
+                fits = numbers[0] <= secret <= numbers[1]
+            if not fits:
+                mismatches.append((level, secret, message))
+    return mismatches
+
+
+def audit(count=10000000, batch_size=BATCH_SIZE, seed=0, generator="stream", alpha=0.001):
+    """Draw count secrets and run every check; "fair" is False when any check fails"""
+    tally = SecretTally()
+    start = time.perf_counter()
+    for batch in draw_batches(count, batch_size, seed, generator):
+        tally.add(batch)
+    elapsed = time.perf_counter() - start
+
+    chi_square = chi_square_test(tally.counts)
+    runs = runs_test(tally)
+    mismatches = hint_text_mismatches()
+    return {
+        "generator": generator,
+        "secrets": tally.total,
+        "seconds": elapsed,
+        "counts": tally.counts,
+        "chi_square": chi_square,
+        "runs": runs,
+        "buckets": bucket_difficulty(tally.counts),
+        "hint_text_mismatches": mismatches,
+        "fair": chi_square[2] >= alpha and runs[3] >= alpha and not mismatches,
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Audit secret number generation and hint buckets")
+    parser.add_argument("--count", type=int, default=10000000, help="Secrets to draw")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Secrets per batch")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generator")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="stream",
+                        help="Generator to audit (the game uses stream)")
+    parser.add_argument("--alpha", type=float, default=0.001, help="Significance level of the tests")
+    args = parser.parse_args()
+
+    report = audit(args.count, args.batch_size, args.seed, args.generator, args.alpha)
+
+    statistic, degrees, p_value = report["chi_square"]
+    runs, expected, z_score, runs_p = report["runs"]
+    print(f"🎲 {report['secrets']} secrets from {report['generator']} in {report['seconds']:.2f} s "
+          f"({report['secrets'] / report['seconds']:.0f}/s)")
+    print(f"Chi-square: {statistic:.2f} on {degrees} degrees of freedom, p = {p_value:.4f}")
+    print(f"Runs:       {runs} observed, {expected:.1f} expected, z = {z_score:.2f}, p = {runs_p:.4f}")
+
+    print(f"\n{'Hints':>5} {'Bucket':>9} {'Size':>5} {'Share':>8} {'Fair':>8} {'Mean':>6} {'Drawn':>6} "
+          f"{'Worst':>6} {'Win %':>7}")
+    for row in report["buckets"]:
+        print(f"{row['hints']:>5} {row['low']:>4}-{row['high']:<4} {row['size']:>5} {row['share']:>8.4%} "
+              f"{row['fair_share']:>8.4%} {row['mean_attempts']:>6.3f} {row['drawn_mean_attempts']:>6.3f} "
+              f"{row['worst_case']:>6} {row['win_probability'] * 100:>6.1f}%")
+
+    for level, secret, message in report["hint_text_mismatches"]:
+        print(f"❌ Hint level {level} tells secret {secret}: {message!r}")
+
+    if not report["fair"]:
+        print("\n❌ Audit failed")
+        sys.exit(1)
+    print("\n✅ Secrets are uniform and independent at this sample size, and every hint is truthful")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Fuzzing harness for the input sanitizers
+Feeds batches of random and adversarial strings through sanitize_input and
+sanitize_rounds_input, checks their invariants and reports throughput per input family:
+
+    python fuzz_inputs.py --count 2000000 --seed 1
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from engine import DANGEROUS_CHARS, sanitize_input, sanitize_rounds_input
+from rules import active_rules
+
+UNICODE_DIGITS = "٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵६७८९০১২৩０１２３４５６７８９²³¹⁴₀₁₂𝟎𝟏𝟐𝟗"
+MINUS_SIGNS = "-−‐‑‒–—﹣－"
+WHITESPACE = " \t\n\r\x0b\x0c  　"
+ASCII_CHARS = "".join(chr(code) for code in range(32, 127))
+
+
+def _ascii(rng):
+    return "".join(rng.choice(ASCII_CHARS) for _ in range(rng.randint(0, 12)))
+
+
+def _numeric(rng):
+    rules = active_rules()
+    span = rules.max_input - rules.min_input
+    return str(rng.randint(rules.min_input - span, rules.max_input + span))
+
+
+def _unicode_digits(rng):
+    return "".join(rng.choice(UNICODE_DIGITS + "0123456789") for _ in range(rng.randint(1, 6)))
+
+
+def _minus_signs(rng):
+    rules = active_rules()
+    magnitude = rng.randint(0, max(abs(rules.min_input), abs(rules.max_input)))
+    return rng.choice(MINUS_SIGNS) + str(magnitude) + rng.choice(("", rng.choice(MINUS_SIGNS)))
+
+
+def _whitespace(rng):
+    pad = lambda: "".join(rng.choice(WHITESPACE) for _ in range(rng.randint(0, 4)))
+    rules = active_rules()
+    return pad() + str(rng.randint(rules.low, rules.high + (rules.high - rules.low) // 2)) + pad()
+
+
+def _dangerous(rng):
+    text = str(rng.randint(active_rules().low, active_rules().high))
+    position = rng.randint(0, len(text))
+    return text[:position] + rng.choice(DANGEROUS_CHARS) + text[position:]
+
+
+def _long(rng):
+    return (rng.choice(("9", "1", "-", " ", "a", "٣"))
+            * rng.choice((active_rules().max_input_length + 1, 100, 10000, 100000)))
+
+
+def _mixed(rng):
+    parts = (rng.choice(MINUS_SIGNS), rng.choice(UNICODE_DIGITS), rng.choice(WHITESPACE),
+             rng.choice(ASCII_CHARS), str(rng.randint(0, 9)))
+    return "".join(rng.choice(parts) for _ in range(rng.randint(0, 10)))
+
+
+GENERATORS = {
+    "ascii": _ascii,
+    "numeric": _numeric,
+    "unicode_digits": _unicode_digits,
+    "minus_signs": _minus_signs,
+    "whitespace": _whitespace,
+    "dangerous": _dangerous,
+    "long": _long,
+    "mixed": _mixed,
+}
+
+
+def check_result(result, low, high):
+    """Return a description of a broken invariant, or None when the result is sound"""
+    if not isinstance(result, tuple) or len(result) != 2:
+        return f"returned {result!r} instead of a (value, error) pair"
+    value, error = result
+    if (value is None) == (error is None):
+        return f"returned {result!r}: exactly one of value and error must be set"
+    if error is not None:
+        if not isinstance(error, str) or not error.startswith("❌"):
+            return f"unexpected error message {error!r}"
+        return None
+    if type(value) is not int or not low <= value <= high:
+        return f"value {value!r} outside {low}..{high}"
+    return None
+
+
+def run_batch(sanitizer, inputs, low, high, check_dangerous=False):
+    """Run one batch; returns (seconds spent in the sanitizer, list of failures)"""
+    results = []
+    failures = []
+    start = time.perf_counter()
+    for text in inputs:
+        try:
+            results.append(sanitizer(text))
+        except Exception as error:  # any escaping exception is a finding
+            results.append(None)
+            failures.append((text, f"raised {type(error).__name__}: {error}"))
+    elapsed = time.perf_counter() - start
+
+    # Invariants are checked outside the timed section
+    for text, result in zip(inputs, results):
+        if result is None:
+            continue
+        problem = check_result(result, low, high)
+        if problem is None and check_dangerous and result[0] is not None:
+            if any(char in str(text) for char in DANGEROUS_CHARS):
+                problem = "accepted input containing a dangerous character"
+        if problem is not None:
+            failures.append((text, problem))
+    return elapsed, failures
+
+
+def fuzz(count=100000, batch_size=10000, seed=0, max_failures=20):
+    """Fuzz both sanitizers with count inputs per sanitizer and return a report"""
+    rng = random.Random(seed)
+    families = list(GENERATORS.items())
+    report = {
+        "sanitize_input": {name: {"inputs": 0, "seconds": 0.0} for name in GENERATORS},
+        "sanitize_rounds_input": {name: {"inputs": 0, "seconds": 0.0} for name in GENERATORS},
+        "failures": [],
+    }
+
+    rules = active_rules()
+    produced = 0
+    batch_index = 0
+    while produced < count:
+        name, generator = families[batch_index % len(families)]
+        size = min(batch_size, count - produced)
+        # Long inputs are expensive to build, so they come in smaller batches
+        if name == "long":
+            size = min(size, max(1, batch_size // 100))
+        inputs = [generator(rng) for _ in range(size)]
+
+        for sanitizer, low, high, check_dangerous in (
+            (sanitize_input, rules.min_input, rules.max_input, True),
+            (sanitize_rounds_input, 1, rules.max_rounds, True),
+        ):
+            elapsed, failures = run_batch(sanitizer, inputs, low, high, check_dangerous)
+            stats = report[sanitizer.__name__][name]
+            stats["inputs"] += size
+            stats["seconds"] += elapsed
+            for text, problem in failures:
+                if len(report["failures"]) < max_failures:
+                    report["failures"].append((sanitizer.__name__, name, text[:60], problem))
+
+        produced += size
+        batch_index += 1
+
+    return report
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Fuzz the input sanitizers")
+    parser.add_argument("--count", type=int, default=1000000, help="Inputs per sanitizer")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Inputs per batch")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the input generator")
+    args = parser.parse_args()
+
+    report = fuzz(args.count, args.batch_size, args.seed)
+
+    print(f"{'Sanitizer':<22} {'Family':<16} {'Inputs':>10} {'Inputs/sec':>14}")
+    for sanitizer in ("sanitize_input", "sanitize_rounds_input"):
+        for name, stats in report[sanitizer].items():
+            rate = stats["inputs"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+            print(f"{sanitizer:<22} {name:<16} {stats['inputs']:>10} {rate:>14.0f}")
+
+    if report["failures"]:
+        print(f"\n❌ {len(report['failures'])} invariant violations:")
+        for sanitizer, family, text, problem in report["failures"]:
+            print(f"  {sanitizer} [{family}] {text!r}: {problem}")
+        sys.exit(1)
+    print("\n✅ No invariant violations")
+
+
+if __name__ == "__main__":
+    main()
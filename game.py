@@ -1,12 +1,46 @@
-import random
 import customtkinter as ctk
 from tkinter import messagebox
 import threading
 import time
 import tkinter as tk
+from tkinter import filedialog
+import argparse
+import getpass
+from datetime import date
+import sys
+from collections import deque
+
+from rules import RulesError, active_rules, load_rules, use_rules
+from daily import (DEFAULT_RESULTS_PATH as DEFAULT_DAILY_RESULTS_PATH, DEFAULT_SOLUTIONS_PATH,
+                   DailyPlay, DailyResults, SolutionCache, compare as compare_daily, daily_seed)
+from autosave import DEFAULT_PATH as DEFAULT_AUTOSAVE_PATH, AutosaveError, Autosaver, pack_session, resume_session
+from engine import GameSession, generate_hint, optimal_guess as suggest_guess, sanitize_input, sanitize_rounds_input
+from hint_oracle import advise
+from live_validation import LiveGuessValidator
+from metrics import GameMetrics, start_metrics_server
+from game_logging import DEFAULT_LOG_PATH, GameLogger, SecondCache
+from events import (EventBus, GuessEvaluated, HintGiven, InvalidGuess, RoundEnded,
+                    RoundStarted, SessionEnded, SessionStarted)
+from batch_play import run_batch
+from multi_board import MultiBoardGUI
+from scoreboard import DEFAULT_NAME as DEFAULT_SCOREBOARD, Scoreboard, ScoreboardError
+from spectators import SpectatorHub
+from stall_watchdog import StallWatchdog
+from stats_panel import StatsPanel
+from message_history import MessageHistory, export_in_background
+from leaderboard import DEFAULT_PATH as DEFAULT_LEADERBOARD_PATH, Leaderboard, write_bytes_atomic
+
+# The messages textbox keeps at most this many lines; older ones are trimmed in chunks
+MAX_WIDGET_LINES = 2000
+TRIM_CHUNK_LINES = 500
+
+# Milliseconds between a keystroke and the entry feedback redraw
+ENTRY_FEEDBACK_MS = 120
 
 class GuessingGameGUI:
-    def __init__(self):
+    def __init__(self, seed=None, log_path=DEFAULT_LOG_PATH, metrics_port=None, spectate_port=None,
+                 watchdog_threshold=None, rules=None, scoreboard_name=None, autosave_path=DEFAULT_AUTOSAVE_PATH,
+                 daily_date=None, show_seed=False):
         # Set appearance mode and color theme
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -17,23 +51,113 @@ class GuessingGameGUI:
         self.root.geometry("1000x800")
         self.root.resizable(True, True)
         
-        # Game variables
-        self.secret_number = 0
-        self.attempts_left = 7
-        self.hints_left = 3
-        self.hint_level = 0
-        self.current_round = 1
-        self.total_rounds = 1
-        self.wins = 0
-        self.game_active = False
-        
-        # Strategy tracking
-        self.min_possible = 0
-        self.max_possible = 100
-        self.previous_guesses = []
+        # Game rules and state live in the engine; the GUI renders its events
+        self.rules = rules or active_rules()
+        # The seed gives away every secret, so it is only shown on request
+        self.show_seed = show_seed
+        
+        # Daily challenge: everyone gets the same date-seeded secret and one scored play a day
+        self.daily_date = daily_date
+        if daily_date is not None:
+            seed = daily_seed(daily_date)
+            # A resumed session would replace the day's secret
+            autosave_path = None
+            solutions = SolutionCache.load()
+            self.daily = DailyPlay(daily_date, solutions.get(daily_date, self.rules), DailyResults.load())
+            if solutions.changed:
+                threading.Thread(target=self.save_daily_solutions, args=(solutions,), daemon=True).start()
+        
+        self.engine = GameSession(EventBus(), seed, rules=self.rules)
+        self.pending_events = deque()
+        self.render_scheduled = False
+        self.next_round_job = None
+        self.event_renderers = {
+            SessionStarted: self.render_session_started,
+            RoundStarted: self.render_round_started,
+            InvalidGuess: self.render_invalid_guess,
+            GuessEvaluated: self.render_guess_evaluated,
+            HintGiven: self.render_hint_given,
+            RoundEnded: self.render_round_ended,
+            SessionEnded: self.render_session_ended,
+        }
+        self.engine.bus.subscribe_all(self.queue_event)
+        
+        # Crash-safe autosave; an unfinished session from the last run is picked up again
+        self.autosaver = None
+        self.resumed = False
+        self.resume_error = None
+        if autosave_path is not None:
+            try:
+                self.resumed = resume_session(self.engine, autosave_path)
+            except (OSError, AutosaveError) as error:
+                self.resume_error = error
+            self.autosaver = Autosaver(autosave_path)
+        
+        # Every message is buffered here so it can be exported later
+        self.message_history = MessageHistory()
+        self.widget_lines = 0
+        self.message_color_tags = set()
+        self.message_clock = SecondCache("%H:%M:%S")
+        
+        # Attempts and game events go to a background JSON lines log
+        self.attempt_log = deque(maxlen=100)
+        try:
+            self.game_logger = GameLogger(log_path)
+        except OSError:
+            self.game_logger = None
+        else:
+            self.engine.bus.subscribe_all(self.game_logger.log_event)
+        
+        # Optional Prometheus endpoint on localhost
+        self.metrics = None
+        self.metrics_server = None
+        if metrics_port is not None:
+            metrics = GameMetrics()
+            try:
+                self.metrics_server = start_metrics_server(metrics, metrics_port)
+            except OSError as error:
+                print(f"⚠️ Metrics disabled: {error}", file=sys.stderr)
+            else:
+                self.metrics = metrics
+                self.metrics.subscribe(self.engine.bus)
+        
+        # Optional live broadcast of game events to spectators
+        self.spectator_hub = None
+        if spectate_port is not None:
+            try:
+                self.spectator_hub = SpectatorHub(port=spectate_port)
+            except OSError as error:
+                print(f"⚠️ Spectating disabled: {error}", file=sys.stderr)
+            else:
+                self.spectator_hub.attach(self.engine.bus)
+        
+        # Cross-session leaderboard
+        self.player_name = getpass.getuser()
+        
+        # Optional live scoreboard shared with the other game processes on this host
+        self.scoreboard = None
+        if scoreboard_name is not None:
+            try:
+                self.scoreboard = Scoreboard(scoreboard_name)
+                self.scoreboard.join(self.player_name)
+            except (OSError, ScoreboardError) as error:
+                print(f"⚠️ Scoreboard disabled: {error}", file=sys.stderr)
+                if self.scoreboard is not None:
+                    self.scoreboard.close()
+                self.scoreboard = None
+            else:
+                self.scoreboard.attach(self.engine.bus)
+        self.leaderboard = Leaderboard.load()
         
         self.setup_ui()
         
+        # Optional watchdog that logs what the main loop was doing when it stalls
+        self.watchdog = None
+        if watchdog_threshold is not None:
+            self.watchdog = StallWatchdog(self.root, watchdog_threshold, on_stall=self.log_stall,
+                                          app_files=[__file__])
+            self.watchdog.start()
+        
     def setup_ui(self):
         # Create menubar
         self.create_menubar()
@@ -59,7 +183,7 @@ class GuessingGameGUI:
         
         self.instructions_label = ctk.CTkLabel(
             info_frame,
-            text="Guess a number between 0 and 100!\nYou have 7 attempts and 3 hints.",
+            text=self.rules.messages["instructions"],
             font=ctk.CTkFont(size=14)
         )
         self.instructions_label.pack(pady=5)
@@ -67,29 +191,34 @@ class GuessingGameGUI:
         # Game status frame
         status_frame = ctk.CTkFrame(self.root)
         status_frame.pack(pady=10, padx=20, fill="x")
+        self.status_frame = status_frame
         
         status_inner_frame = ctk.CTkFrame(status_frame)
         status_inner_frame.pack(pady=15, padx=15, fill="x")
         
         self.attempts_label = ctk.CTkLabel(
             status_inner_frame,
-            text="Attempts left: 7",
+            text=f"Attempts left: {self.rules.attempts}",
             font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#4CAF50"
+            text_color=self.rules.attempt_color(self.rules.attempts)
         )
         self.attempts_label.grid(row=0, column=0, padx=20, pady=5, sticky="w")
         
         self.hints_label = ctk.CTkLabel(
             status_inner_frame,
-            text="Hints left: 3",
+            text=f"Hints left: {self.rules.hints}",
             font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#FF9800"
+            text_color=self.rules.hint_color(self.rules.hints)
         )
         self.hints_label.grid(row=0, column=1, padx=20, pady=5, sticky="e")
         
         status_inner_frame.grid_columnconfigure(0, weight=1)
         status_inner_frame.grid_columnconfigure(1, weight=1)
         
+        # Live statistics, updated as rounds end
+        self.stats_panel = StatsPanel(self.root, self.root, max_attempts=self.rules.attempts)
+        self.stats_visible = False
+        
         # Input frame
         input_frame = ctk.CTkFrame(self.root)
         input_frame.pack(pady=20, padx=20, fill="x")
@@ -103,7 +232,7 @@ class GuessingGameGUI:
         
         self.guess_entry = ctk.CTkEntry(
             input_frame,
-            placeholder_text="Enter a number between 0 and 100",
+            placeholder_text=self.rules.messages["placeholder"],
             font=ctk.CTkFont(size=14),
             width=300,
             height=40
@@ -111,6 +240,21 @@ class GuessingGameGUI:
         self.guess_entry.pack(pady=5)
         self.guess_entry.bind("<Return>", lambda e: self.make_guess())
         
+        # Validation state follows every keystroke; the feedback label is redrawn at most once per debounce
+        self.live_validator = LiveGuessValidator(rules=self.rules)
+        self.entry_feedback_job = None
+        self.entry_feedback_shown = ("", "#FFFFFF")
+        self.entry_feedback_label = ctk.CTkLabel(
+            input_frame,
+            text="",
+            font=ctk.CTkFont(size=12)
+        )
+        self.entry_feedback_label.pack(pady=(0, 5))
+        self.guess_entry.configure(
+            validate="key",
+            validatecommand=(self.root.register(self.on_entry_edit), "%d", "%i", "%S", "%P")
+        )
+        
         # Buttons frame
         buttons_frame = ctk.CTkFrame(input_frame)
         buttons_frame.pack(pady=15, fill="x")
@@ -203,11 +347,23 @@ class GuessingGameGUI:
             hover_color="#7B1FA2"
         )
         self.stats_button.pack(side="right", padx=10, pady=10)
+        self.set_stats_visible(True)
         
         # Start first game
         self.add_message("🎉 Welcome to the Number Guessing Game!")
         self.add_message("🎯 Game loaded successfully - ready to play!")
-        self.start_new_game()
+        if self.show_seed:
+            self.add_message(f"🎲 Session seed: {self.engine.secret_stream.seed}")
+        if self.resume_error is not None:
+            self.add_message(f"⚠️ Could not resume the saved session: {self.resume_error}", "#FF9800")
+        if self.daily_date is not None:
+            self.add_message(f"📅 Daily challenge for {self.daily_date.isoformat()} - everyone plays the same number today!", "#00BCD4")
+            if self.daily.results.result(self.daily_date) is not None:
+                self.add_message("📅 You already played today, so this game won't change your streak")
+        if self.resumed:
+            self.show_resumed_session()
+        else:
+            self.start_new_game()
         
     def create_menubar(self):
         """Create the top menubar"""
@@ -257,12 +413,14 @@ class GuessingGameGUI:
                            activebackground="#1f538d", activeforeground="white")
         
         file_menu.add_command(label="🎮 New Session", command=self.new_session)
-        file_menu.add_command(label="📊 Show Statistics", command=self.show_stats)
+        file_menu.add_command(label="📊 Show/Hide Statistics", command=self.show_stats)
+        file_menu.add_command(label="🏅 Leaderboard", command=self.show_leaderboard)
         file_menu.add_separator()
         file_menu.add_command(label="🔄 Restart Current Game", command=self.restart_game)
         file_menu.add_separator()
         file_menu.add_command(label="🔍 View Attempt Log", command=self.show_attempt_log)
         file_menu.add_command(label="🗑️ Clear Attempt Log", command=self.clear_attempt_log)
+        file_menu.add_command(label="💾 Export Messages", command=self.export_messages)
         file_menu.add_separator()
         file_menu.add_command(label="❌ Exit", command=self.exit_game)
         
@@ -290,23 +448,21 @@ class GuessingGameGUI:
             
     def show_how_to_play(self):
         """Show how to play instructions"""
-        how_to_play = """
+        how_to_play = f"""
 🎯 HOW TO PLAY THE NUMBER GUESSING GAME
 
 🎮 OBJECTIVE:
-Guess the secret number between 0 and 100 in as few attempts as possible!
+Guess the secret number between {self.rules.low} and {self.rules.high} in as few attempts as possible!
 
 🎲 GAMEPLAY:
-1. Enter a number between 0 and 100 in the input field
+1. Enter a number between {self.rules.low} and {self.rules.high} in the input field
 2. Click "Make Guess" or press Enter
 3. The game will tell you if your guess is too high or too low
-4. You have 7 attempts to guess correctly
-5. Use hints wisely - you only get 3 per round!
+4. You have {self.rules.attempts} attempts to guess correctly
+5. Use hints wisely - you only get {self.rules.hints} per round!
 
 💡 HINTS:
-• First hint: Tells you if the number is above or below 50
-• Second hint: Tells you if it's between 5 and 80
-• Third hint: Gives you a more specific range
+{self.hint_guide()}
 
 🏆 WINNING:
 • Guess the correct number to win the round
@@ -314,7 +470,7 @@ Guess the secret number between 0 and 100 in as few attempts as possible!
 • Track your win rate and improve your skills!
 
 🎯 TIPS:
-• Start with 50 to divide the range in half
+• Start with {self.rules.midpoint} to divide the range in half
 • Use the elimination method
 • Save hints for when you really need them
 • Pay attention to the feedback after each guess
@@ -324,40 +480,48 @@ Guess the secret number between 0 and 100 in as few attempts as possible!
         
     def show_game_rules(self):
         """Show detailed game rules"""
-        rules = """
+        rules_text = f"""
 📋 GAME RULES
 
 🎲 BASIC RULES:
-• Secret number is randomly generated between 0-100
-• You have exactly 7 attempts per round
-• You get 3 hints per round
+• Secret number is randomly generated between {self.rules.low}-{self.rules.high}
+• You have exactly {self.rules.attempts} attempts per round
+• You get {self.rules.hints} hints per round
 • Numbers must be integers only
 
 ⚠️ RESTRICTIONS:
-• Guesses outside 0-100 range are invalid
+• Guesses outside {self.rules.low}-{self.rules.high} range are invalid
 • Non-numeric entries are rejected
 • Hints can only be used once per round
 • Game ends when attempts reach 0
 
 🎯 SCORING:
 • Win: Guess the correct number
-• Lose: Use all 7 attempts without success
+• Lose: Use all {self.rules.attempts} attempts without success
 • Win Rate: Percentage of rounds won
 
 🏆 SESSION PLAY:
-• Choose number of rounds (1-unlimited)
+• Choose number of rounds (1-{self.rules.max_rounds})
 • Statistics tracked across all rounds
 • New session resets win/loss count
 • Each round is independent
 
 💡 HINT SYSTEM:
-• Hint 1: Above/below 50
-• Hint 2: Inside/outside 5-80 range  
-• Hint 3: Specific range (20-number segments)
+{self.hint_guide()}
 • Hints become more specific as you use them
         """
         
-        messagebox.showinfo("Game Rules", rules)
+        messagebox.showinfo("Game Rules", rules_text)
+        
+    def hint_guide(self):
+        """One help line per hint, from the rules' hint buckets"""
+        lines = []
+        for number in range(1, self.rules.hints + 1):
+            buckets = self.rules.hint_buckets[min(number, len(self.rules.hint_buckets)) - 1]
+            sizes = sorted({bucket_high - bucket_low + 1 for bucket_low, bucket_high in buckets})
+            size_text = f"{sizes[0]}" if len(sizes) == 1 else f"{sizes[0]}-{sizes[-1]}"
+            lines.append(f"• Hint {number}: One of {len(buckets)} ranges of {size_text} numbers")
+        return "\n".join(lines)
         
     def show_about(self):
         """Show about information"""
@@ -388,77 +552,218 @@ Test your guessing skills and see how high you can get your win rate!
     def restart_game(self):
         """Restart the current game"""
         if messagebox.askyesno("Restart Game", "Are you sure you want to restart the current round?"):
-            self.start_new_game()
             self.add_message("🔄 Game restarted!")
+            self.start_new_game()
             
     def exit_game(self):
         """Exit the application"""
         if messagebox.askyesno("Exit Game", "Are you sure you want to exit?"):
             self.root.quit()
             
-    def add_message(self, message, color="#FFFFFF"):
+    def add_message(self, message, color="#FFFFFF", event="info", round_number=None):
         """Add a message to the messages textbox"""
+        if round_number is None:
+            round_number = self.engine.current_round
+        entry = self.message_history.append(message, round_number, event)
         self.messages_text.configure(state="normal")
         # Add timestamp for better readability
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = self.message_clock(entry[0])
         formatted_message = f"[{timestamp}] {message}\n"
-        self.messages_text.insert("end", formatted_message)
+        if color.upper() == "#FFFFFF":
+            self.messages_text.insert("end", formatted_message)
+        else:
+            # One text tag per color, configured the first time it is used
+            tag = f"color{color}"
+            if tag not in self.message_color_tags:
+                self.messages_text.tag_config(tag, foreground=color)
+                self.message_color_tags.add(tag)
+            self.messages_text.insert("end", formatted_message, tag)
+        self.widget_lines += formatted_message.count("\n")
+        
+        # Drop the oldest lines in one chunk so long sessions keep the textbox small
+        if self.widget_lines > MAX_WIDGET_LINES + TRIM_CHUNK_LINES:
+            excess = self.widget_lines - MAX_WIDGET_LINES
+            self.messages_text.delete("1.0", f"{excess + 1}.0")
+            self.widget_lines -= excess
         self.messages_text.configure(state="disabled")
         self.messages_text.see("end")
-        # Force update to ensure visibility
-        self.root.update_idletasks()
-        
-    def start_new_game(self):
-        """Start a new game round"""
-        self.secret_number = random.randint(0, 100)
-        self.attempts_left = 7
-        self.hints_left = 3
-        self.hint_level = 0
-        self.game_active = True
-        
-        # Reset strategy tracking
-        self.min_possible = 0
-        self.max_possible = 100
-        self.previous_guesses = []
         
+    def on_entry_edit(self, action, index, text, proposed):
+        """Tk validatecommand for guess_entry; never rejects the edit"""
+        # CustomTkinter writes its placeholder through the same entry
+        if not getattr(self.guess_entry, "_placeholder_text_active", False):
+            self.live_validator.edit(action, index, text, proposed)
+            if self.entry_feedback_job is None:
+                self.entry_feedback_job = self.root.after(ENTRY_FEEDBACK_MS, self.update_entry_feedback)
+        return True
+        
+    def update_entry_feedback(self):
+        """Show whether the typed guess is valid and inside the possible range"""
+        self.entry_feedback_job = None
+        feedback = ("", "#FFFFFF")
+        if len(self.live_validator) > 0:
+            number, error_message = self.live_validator.result()
+            if error_message:
+                feedback = (error_message, "#F44336")
+            elif self.engine.game_active:
+                game_round = self.engine.round
+                low = max(game_round.min_possible, game_round.hint_range[0])
+                high = min(game_round.max_possible, game_round.hint_range[1])
+                if low <= number <= high:
+                    feedback = (f"✅ {number} is inside the possible range {low} to {high}", "#4CAF50")
+                else:
+                    feedback = (f"⚠️ {number} is outside the possible range {low} to {high}", "#FF9800")
+                    
+        # Skip the redraw when nothing visible changed
+        if feedback != self.entry_feedback_shown:
+            self.entry_feedback_label.configure(text=feedback[0], text_color=feedback[1])
+            self.entry_feedback_shown = feedback
+            
+    def queue_event(self, event):
+        """Queue an engine event and schedule one idle-time render for the batch"""
+        self.pending_events.append(event)
+        if not self.render_scheduled:
+            self.render_scheduled = True
+            self.root.after_idle(self.render_events)
+            
+    def render_events(self):
+        """Render every queued event, then refresh the labels once"""
+        self.render_scheduled = False
+        session_ended = False
+        
+        while self.pending_events:
+            event = self.pending_events.popleft()
+            handler = self.event_renderers.get(type(event))
+            if handler is not None:
+                handler(event)
+            session_ended = session_ended or isinstance(event, SessionEnded)
+            
         self.update_labels()
+        
+        if session_ended:
+            self.set_stats_visible(True)
+            
+        # Snapshot once per batch, after the engine call that published it has finished
+        if self.autosaver is not None:
+            self.autosaver.submit(pack_session(self.engine))
+            
+    def render_session_started(self, event):
+        """Show the start of a new session"""
+        self.add_message(f"🎮 New session started with {event.total_rounds} rounds!", event=event.kind)
+        if self.show_seed:
+            self.add_message(f"🎲 Session seed: {event.seed}")
+        self.stats_panel.start_session(event.total_rounds)
+        
+    def render_round_started(self, event):
+        """Show the start of a round and reset the input"""
         self.guess_entry.delete(0, "end")
         self.guess_entry.focus()
         
-        self.add_message(f"🎮 Round {self.current_round} of {self.total_rounds} started!")
-        self.add_message("🎯 I'm thinking of a number between 0 and 100...")
-        self.add_message("💡 Pro tip: Start with 50 to use binary search strategy!")
+        self.add_message(f"🎮 Round {event.round_number} of {event.total_rounds} started!", event=event.kind)
+        self.add_message(self.rules.messages["thinking"])
+        self.add_message(self.rules.messages["opening_tip"])
         
-    def update_labels(self):
-        """Update the status labels"""
-        self.round_label.configure(text=f"Round {self.current_round} of {self.total_rounds}")
+    def render_invalid_guess(self, event):
+        """Show why a guess was rejected"""
+        self.add_message(event.error, event=event.kind)
         
-        # Update attempts label with color coding
-        if self.attempts_left > 4:
-            attempts_color = "#4CAF50"  # Green
-        elif self.attempts_left > 2:
-            attempts_color = "#FF9800"  # Orange
+    def render_guess_evaluated(self, event):
+        """Show the feedback for a guess"""
+        if event.result == "correct":
+            self.add_message(f"🎉 Correct! You won! The number was {event.guess}", event="win", round_number=event.round_number)
+            return
+            
+        if event.result == "low":
+            self.add_message(f"📈 {event.guess} is too low!", event=event.kind, round_number=event.round_number)
         else:
-            attempts_color = "#F44336"  # Red
+            self.add_message(f"📉 {event.guess} is too high!", event=event.kind, round_number=event.round_number)
+            
+        if event.attempts_left > 0:
+            self.add_message(f"🎯 Try again! {event.attempts_left} attempts remaining.", round_number=event.round_number)
+            range_size = event.max_possible - event.min_possible + 1
+            self.add_message(f"🔍 Possible range: {event.min_possible} to {event.max_possible} ({range_size} numbers left)", round_number=event.round_number)
             
+    def render_hint_given(self, event):
+        """Show a hint"""
+        self.add_message(f"💡 Hint: {event.message}", event=event.kind, round_number=event.round_number)
+        
+    def render_round_ended(self, event):
+        """Show the end of a round and schedule the next one"""
+        self.stats_panel.record_round(event.won, event.attempts_used)
+        if self.daily_date is not None and self.daily.is_daily_round(event):
+            self.record_daily(event)
+        if not event.won:
+            self.add_message(f"💀 Game Over! The number was {event.secret_number}", event="loss", round_number=event.round_number)
+            
+        if event.has_next_round:
+            self.add_message("⏳ Starting next round in 3 seconds...", round_number=event.round_number)
+            # Tk's own timer keeps the GUI responsive without a sleeping thread
+            self.next_round_job = self.root.after(3000, self.start_new_game)
+            
+    def render_session_ended(self, event):
+        """Show the end of the session and record it"""
+        self.add_message("🏁 Session complete!", event=event.kind)
+        self.stats_panel.end_session()
+        self.record_session()
+        
+    def show_resumed_session(self):
+        """Show the session restored from the autosave and carry on with it"""
+        engine = self.engine
+        self.stats_panel.start_session(engine.total_rounds)
+        for _, attempts, _, won in engine.history:
+            self.stats_panel.record_round(won, attempts)
+        self.add_message(f"♻️ Resumed round {engine.current_round} of {engine.total_rounds} "
+                         f"({engine.wins} won so far)", "#00BCD4")
+        
+        game_round = engine.round
+        if not game_round.active:
+            # The save was taken between rounds
+            self.start_new_game()
+            return
+        if game_round.previous_guesses:
+            guesses = ", ".join(str(guess) for guess in game_round.previous_guesses)
+            range_size = game_round.max_possible - game_round.min_possible + 1
+            self.add_message(f"🔁 Your guesses so far: {guesses}")
+            self.add_message(f"🔍 Possible range: {game_round.min_possible} to {game_round.max_possible} ({range_size} numbers left)")
+        self.update_labels()
+        
+    def start_new_game(self):
+        """Start a new game round"""
+        self.next_round_job = None
+        self.engine.start_round()
+        
+    def update_labels(self):
+        """Update the status labels"""
+        game_round = self.engine.round
+        self.round_label.configure(text=f"Round {self.engine.current_round} of {self.engine.total_rounds}")
+        
+        # Update attempts label with the profile's color coding
         self.attempts_label.configure(
-            text=f"Attempts left: {self.attempts_left}",
-            text_color=attempts_color
+            text=f"Attempts left: {game_round.attempts_left}",
+            text_color=self.rules.attempt_color(game_round.attempts_left)
         )
         
         # Update hints label
-        hints_color = "#FF9800" if self.hints_left > 0 else "#757575"
         self.hints_label.configure(
-            text=f"Hints left: {self.hints_left}",
-            text_color=hints_color
+            text=f"Hints left: {game_round.hints_left}",
+            text_color=self.rules.hint_color(game_round.hints_left)
         )
         
         # Enable/disable hint button
-        self.hint_button.configure(state="normal" if self.hints_left > 0 and self.game_active else "disabled")
+        self.hint_button.configure(state="normal" if game_round.hints_left > 0 and self.engine.game_active else "disabled")
         
     def make_guess(self):
         """Process the player's guess"""
-        if not self.game_active:
+        started = time.perf_counter()
+        try:
+            self.process_guess()
+        finally:
+            if self.metrics is not None:
+                self.metrics.guess_latency.observe(time.perf_counter() - started)
+                
+    def process_guess(self):
+        """Validate the entry and hand the guess to the engine"""
+        if not self.engine.game_active:
             return
             
         # Get and sanitize input
@@ -466,144 +771,25 @@ Test your guessing skills and see how high you can get your win rate!
         sanitized_guess, error_message = self.sanitize_input(raw_input)
         
         if error_message:
-            self.add_message(error_message)
+            self.engine.reject_guess(raw_input, error_message)
             self.log_attempt(raw_input, is_valid=False)
             return
             
-        # Validate game range
-        if sanitized_guess < 0 or sanitized_guess > 100:
-            self.add_message("❌ Number must be between 0 and 100!")
-            self.log_attempt(sanitized_guess, is_valid=False)
-            return
-            
-        # Log valid attempt
-        self.log_attempt(sanitized_guess, is_valid=True)
-        
-        # Track the guess for strategy
-        self.previous_guesses.append(sanitized_guess)
-        
-        self.attempts_left -= 1
-        
-        if sanitized_guess == self.secret_number:
-            self.add_message(f"🎉 Correct! You won! The number was {self.secret_number}")
-            self.wins += 1
-            self.end_round(True)
-        else:
-            if sanitized_guess < self.secret_number:
-                self.add_message(f"📈 {sanitized_guess} is too low!")
-                self.min_possible = max(self.min_possible, sanitized_guess + 1)
-            else:
-                self.add_message(f"📉 {sanitized_guess} is too high!")
-                self.max_possible = min(self.max_possible, sanitized_guess - 1)
-                
-            if self.attempts_left == 0:
-                self.add_message(f"💀 Game Over! The number was {self.secret_number}")
-                self.end_round(False)
-            else:
-                self.add_message(f"🎯 Try again! {self.attempts_left} attempts remaining.")
-                range_size = self.max_possible - self.min_possible + 1
-                self.add_message(f"🔍 Possible range: {self.min_possible} to {self.max_possible} ({range_size} numbers left)")
-                
-        self.update_labels()
-        self.guess_entry.delete(0, "end")
+        # The engine validates the game range and publishes the outcome
+        round_number = self.engine.current_round
+        result = self.engine.make_guess(sanitized_guess)
+        self.log_attempt(sanitized_guess, is_valid=result is not None, round_number=round_number)
+        if result is not None:
+            self.guess_entry.delete(0, "end")
         
     def get_hint(self):
         """Provide a hint to the player"""
-        if not self.game_active or self.hints_left == 0:
-            return
-            
-        self.hints_left -= 1
-        hint_message = self.generate_hint(self.secret_number, self.hint_level)
-        self.add_message(f"💡 Hint: {hint_message}")
-        self.hint_level += 1
-        self.update_labels()
+        self.engine.get_hint()
         
     def generate_hint(self, number, hint_level):
         """Generate a hint based on the hint level - improved for better strategy"""
-        if hint_level == 0:
-            # First hint: Split the range in half
-            return "The number is less than 50" if number < 50 else "The number is 50 or greater"
-        elif hint_level == 1:
-            # Second hint: Give a more specific quarter range
-            if number < 25:
-                return "The number is between 0 and 25"
-            elif number < 50:
-                return "The number is between 25 and 50"
-            elif number < 75:
-                return "The number is between 50 and 75"
-            else:
-                return "The number is between 75 and 100"
-        elif hint_level == 2:
-            # Third hint: Give an even more specific range (roughly 12-13 numbers)
-            if number < 13:
-                return "The number is between 0 and 12"
-            elif number < 25:
-                return "The number is between 13 and 25"
-            elif number < 38:
-                return "The number is between 25 and 38"
-            elif number < 50:
-                return "The number is between 38 and 50"
-            elif number < 63:
-                return "The number is between 50 and 63"
-            elif number < 75:
-                return "The number is between 63 and 75"
-            elif number < 88:
-                return "The number is between 75 and 88"
-            else:
-                return "The number is between 88 and 100"
-        else:
-            # Bonus hint: Give a very specific range (about 6-7 numbers)
-            if number < 7:
-                return "The number is between 0 and 6"
-            elif number < 13:
-                return "The number is between 7 and 13"
-            elif number < 19:
-                return "The number is between 13 and 19"
-            elif number < 25:
-                return "The number is between 19 and 25"
-            elif number < 31:
-                return "The number is between 25 and 31"
-            elif number < 38:
-                return "The number is between 31 and 38"
-            elif number < 44:
-                return "The number is between 38 and 44"
-            elif number < 50:
-                return "The number is between 44 and 50"
-            elif number < 56:
-                return "The number is between 50 and 56"
-            elif number < 63:
-                return "The number is between 56 and 63"
-            elif number < 69:
-                return "The number is between 63 and 69"
-            elif number < 75:
-                return "The number is between 69 and 75"
-            elif number < 81:
-                return "The number is between 75 and 81"
-            elif number < 88:
-                return "The number is between 81 and 88"
-            elif number < 94:
-                return "The number is between 88 and 94"
-            else:
-                return "The number is between 94 and 100"
+        return generate_hint(number, hint_level, self.rules)
             
-    def end_round(self, won):
-        """End the current round"""
-        self.game_active = False
-        
-        if self.current_round < self.total_rounds:
-            self.current_round += 1
-            self.add_message("⏳ Starting next round in 3 seconds...")
-            # Use threading to avoid blocking the GUI
-            threading.Thread(target=self.delayed_next_round, daemon=True).start()
-        else:
-            self.add_message("🏁 Session complete!")
-            self.show_stats()
-            
-    def delayed_next_round(self):
-        """Start the next round after a delay"""
-        time.sleep(3)
-        self.root.after(0, self.start_new_game)
-        
     def new_session(self):
         """Start a new game session"""
         dialog = ctk.CTkInputDialog(
@@ -622,178 +808,276 @@ Test your guessing skills and see how high you can get your win rate!
             messagebox.showerror("Invalid Input", error_message)
             return
             
-        # Reset session variables
-        self.total_rounds = sanitized_rounds
-        self.current_round = 1
-        self.wins = 0
-        
+        # A pending next round belongs to the old session
+        if self.next_round_job is not None:
+            self.root.after_cancel(self.next_round_job)
+            self.next_round_job = None
+            
         # Clear messages
         self.messages_text.configure(state="normal")
         self.messages_text.delete("1.0", "end")
         self.messages_text.configure(state="disabled")
+        self.widget_lines = 0
+        self.message_history.clear()
         
-        self.add_message(f"🎮 New session started with {sanitized_rounds} rounds!")
-        self.start_new_game()
+        self.engine.new_session(sanitized_rounds)
         
     def show_stats(self):
-        """Show game statistics"""
-        win_rate = (self.wins / self.total_rounds) * 100 if self.total_rounds > 0 else 0
-        
-        stats_message = f"""
-🏆 Game Statistics
-
-Wins: {self.wins}
-Total Rounds: {self.total_rounds}
-Win Rate: {win_rate:.1f}%
-
-{"🎉 Excellent performance!" if win_rate >= 75 else 
- "👍 Good job!" if win_rate >= 50 else 
- "💪 Keep practicing!"}
-        """
-        
-        messagebox.showinfo("Statistics", stats_message)
-        
-    def sanitize_input(self, user_input):
-        """Sanitize and validate user input"""
-        if not user_input:
-            return None, "❌ Input cannot be empty!"
-            
-        # Remove whitespace and convert to string
-        sanitized = str(user_input).strip()
+        """Show or hide the statistics panel"""
+        self.set_stats_visible(not self.stats_visible)
+        
+    def set_stats_visible(self, visible):
+        """Pack the non-modal statistics panel under the status frame, or remove it"""
+        if visible and not self.stats_visible:
+            self.stats_panel.frame.pack(pady=10, padx=20, fill="x", after=self.status_frame)
+            self.stats_panel.request_redraw()
+        elif not visible and self.stats_visible:
+            self.stats_panel.frame.pack_forget()
+        self.stats_visible = visible
+        self.stats_button.configure(text="📊 Hide Stats" if visible else "📊 Show Stats")
+        
+    def record_session(self):
+        """Add the finished session to the leaderboard and save it in the background"""
+        self.leaderboard.record(self.player_name, self.engine.wins, self.engine.total_rounds,
+                                self.engine.session_attempts)
+        rank = self.leaderboard.rank(self.player_name)
+        self.add_message(f"🏅 Leaderboard rank: #{rank} of {len(self.leaderboard)}")
+        
+        # Serialize on the UI thread, write on a worker so the disk never blocks the GUI
+        data = self.leaderboard.to_bytes()
+        threading.Thread(target=self.save_leaderboard, args=(data,), daemon=True).start()
+        
+    def save_leaderboard(self, data):
+        """Write serialized leaderboard data to disk"""
+        try:
+            write_bytes_atomic(DEFAULT_LEADERBOARD_PATH, data)
+        except OSError:
+            self.root.after(0, lambda: self.add_message("❌ Could not save the leaderboard!"))
+        
+    def record_daily(self, event):
+        """Compare a daily round with the cached midpoint solution and count the first play toward the streak"""
+        self.add_message(compare_daily(self.daily.solution, event.won, event.attempts_used), "#00BCD4",
+                         round_number=event.round_number)
+        if not self.daily.finish(event):
+            return
+        results = self.daily.results
+        streak = results.current_streak(self.daily_date)
+        self.add_message(f"🔥 Daily streak: {streak} day{'s' if streak != 1 else ''} "
+                         f"(best {results.best_streak()})", round_number=event.round_number)
+        data = results.to_bytes()
+        threading.Thread(target=self.save_daily_results, args=(data,), daemon=True).start()
+        
+    def save_daily_results(self, data):
+        """Write serialized daily results to disk"""
+        try:
+            write_bytes_atomic(DEFAULT_DAILY_RESULTS_PATH, data)
+        except OSError:
+            self.root.after(0, lambda: self.add_message("❌ Could not save your daily result!"))
         
-        # Check for malicious characters or patterns
-        dangerous_chars = ['<', '>', '&', '"', "'", '\\', '/', ';', '|', '`', '$']
-        if any(char in sanitized for char in dangerous_chars):
-            return None, "❌ Invalid characters detected!"
+    def save_daily_solutions(self, solutions):
+        """Cache newly solved days; a failed write only means solving them again next time"""
+        try:
+            solutions.save(DEFAULT_SOLUTIONS_PATH)
+        except OSError:
+            pass
+        
+    def show_leaderboard(self):
+        """Show the top players and the current player's rank"""
+        top_entries = self.leaderboard.top(10)
+        if not top_entries:
+            messagebox.showinfo("Leaderboard", "No sessions recorded yet.")
+            return
             
-        # Check length limit
-        if len(sanitized) > 10:
-            return None, "❌ Input too long! Maximum 10 characters."
+        lines = ["🏅 TOP PLAYERS", ""]
+        for entry in top_entries:
+            lines.append(f"#{entry['rank']} {entry['name']} - {entry['win_rate']:.1f}% "
+                         f"({entry['wins']}/{entry['rounds']}), {entry['mean_attempts']:.2f} attempts/round")
             
-        # Remove non-numeric characters except minus sign
-        cleaned = ''.join(char for char in sanitized if char.isdigit() or char == '-')
-        
-        if not cleaned:
-            return None, "❌ Please enter a valid number!"
+        own_entry = self.leaderboard.entry(self.player_name)
+        if own_entry is not None and own_entry['rank'] > len(top_entries):
+            lines.append("")
+            lines.append(f"Your rank: #{own_entry['rank']} - {own_entry['win_rate']:.1f}%")
             
-        try:
-            # Convert to integer
-            number = int(cleaned)
-            
-            # Validate range
-            if number < -999 or number > 999:
-                return None, "❌ Number out of acceptable range!"
-                
-            return number, None
+        messagebox.showinfo("Leaderboard", "\n".join(lines))
+        
+    def export_messages(self):
+        """Export the message history to a text or JSON lines file"""
+        path = filedialog.asksaveasfilename(
+            title="Export Messages",
+            defaultextension=".txt",
+            filetypes=[("Text file", "*.txt"), ("JSON lines", "*.jsonl")]
+        )
+        if not path:
+            return
             
-        except ValueError:
-            return None, "❌ Please enter a valid integer!"
+        # Snapshot the buffer now; formatting and writing happen on a worker thread
+        entries = self.message_history.snapshot()
+        export_in_background(entries, path, lambda count, error: self.root.after(
+            0, self.export_finished, path, count, error))
+        
+    def export_finished(self, path, count, error):
+        """Report the result of a background export"""
+        if error is not None:
+            self.add_message(f"❌ Export failed: {error}", event="export")
+        else:
+            self.add_message(f"💾 Exported {count} messages to {path}", event="export")
+        
+    def sanitize_input(self, user_input):
+        """Sanitize and validate user input"""
+        return sanitize_input(user_input, self.rules)
     
     def sanitize_rounds_input(self, user_input):
         """Sanitize input for number of rounds"""
-        if not user_input:
-            return None, "❌ Please enter number of rounds!"
-            
-        # Remove whitespace and convert to string
-        sanitized = str(user_input).strip()
-        
-        # Check for dangerous characters
-        if not sanitized.isdigit():
-            return None, "❌ Please enter only numbers!"
-            
-        # Check length limit
-        if len(sanitized) > 3:
-            return None, "❌ Maximum 999 rounds allowed!"
-            
-        try:
-            rounds = int(sanitized)
-            
-            # Validate range
-            if rounds < 1:
-                return None, "❌ Must be at least 1 round!"
-            elif rounds > 999:
-                return None, "❌ Maximum 999 rounds allowed!"
-                
-            return rounds, None
-            
-        except ValueError:
-            return None, "❌ Please enter a valid number!"
+        return sanitize_rounds_input(user_input, self.rules)
     
-    def log_attempt(self, guess, is_valid=True):
+    def log_attempt(self, guess, is_valid=True, round_number=None):
         """Log user attempts for monitoring"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        status = "VALID" if is_valid else "INVALID"
-        
-        # Simple logging - in a real application, you might want to use proper logging
-        log_entry = f"[{timestamp}] {status} - Guess: {guess}"
-        
-        # Store in a simple list (in memory)
-        if not hasattr(self, 'attempt_log'):
-            self.attempt_log = []
-        
-        self.attempt_log.append(log_entry)
+        if round_number is None:
+            round_number = self.engine.current_round
+            
+        # Keep the raw values; formatting happens only when the log is shown or written
+        self.attempt_log.append((time.time(), is_valid, guess))
         
-        # Keep only last 100 entries to prevent memory issues
-        if len(self.attempt_log) > 100:
-            self.attempt_log = self.attempt_log[-100:]
+        if self.game_logger is not None:
+            self.game_logger.log_attempt(guess, is_valid, round_number)
+    
+    def log_stall(self, seconds, handler, stack):
+        """Called from the watchdog thread when the main loop stalls"""
+        if self.game_logger is not None:
+            self.game_logger.log_stall(seconds, handler, stack)
+        else:
+            print(f"⚠️ Main loop stalled for {seconds:.2f}s in {handler}\n{stack}", file=sys.stderr)
     
     def show_attempt_log(self):
         """Show the attempt log for debugging/monitoring"""
-        if not hasattr(self, 'attempt_log') or not self.attempt_log:
+        if not self.attempt_log:
             messagebox.showinfo("Attempt Log", "No attempts logged yet.")
             return
             
         # Show last 20 entries
-        recent_logs = self.attempt_log[-20:]
+        recent_logs = [
+            f"[{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}] "
+            f"{'VALID' if is_valid else 'INVALID'} - Guess: {guess}"
+            for timestamp, is_valid, guess in list(self.attempt_log)[-20:]
+        ]
         log_text = "🔍 RECENT ATTEMPTS LOG\n\n" + "\n".join(recent_logs)
         
         messagebox.showinfo("Attempt Log", log_text)
         
     def clear_attempt_log(self):
         """Clear the attempt log"""
-        if hasattr(self, 'attempt_log'):
-            self.attempt_log.clear()
-            self.add_message("🗑️ Attempt log cleared!")
+        self.attempt_log.clear()
+        self.add_message("🗑️ Attempt log cleared!")
         
     def get_strategy_tip(self):
         """Provide strategic advice for the next guess"""
-        if not self.game_active:
+        if not self.engine.game_active:
             return
+        game_round = self.engine.round
             
+        # Combine what the guesses and the latest hint revealed
+        min_possible = max(game_round.min_possible, game_round.hint_range[0])
+        max_possible = min(game_round.max_possible, game_round.hint_range[1])
+
         # Calculate the optimal next guess using binary search
-        optimal_guess = (self.min_possible + self.max_possible) // 2
-        
-        # Check if this guess was already made
-        if optimal_guess in self.previous_guesses:
-            # Find the next best guess
-            if optimal_guess + 1 <= self.max_possible and optimal_guess + 1 not in self.previous_guesses:
-                optimal_guess = optimal_guess + 1
-            elif optimal_guess - 1 >= self.min_possible and optimal_guess - 1 not in self.previous_guesses:
-                optimal_guess = optimal_guess - 1
-            else:
-                # Find any number in range not guessed yet
-                for num in range(self.min_possible, self.max_possible + 1):
-                    if num not in self.previous_guesses:
-                        optimal_guess = num
-                        break
+        optimal_guess = suggest_guess(min_possible, max_possible, game_round.previous_guesses)
         
-        range_size = self.max_possible - self.min_possible + 1
+        range_size = max_possible - min_possible + 1
         
         strategy_message = f"🎯 Strategic Suggestion: Try {optimal_guess}\n"
         strategy_message += f"📊 This will divide the remaining {range_size} possibilities optimally!\n"
-        strategy_message += f"🔍 Current range: {self.min_possible} to {self.max_possible}"
+        strategy_message += f"🔍 Current range: {min_possible} to {max_possible}"
+
+        # Is the next hint worth more than a guess?
+        if game_round.hints_left > 0:
+            advice = advise(min_possible, max_possible, game_round.hint_level,
+                            game_round.attempts_left, game_round.hints_left, self.rules.hint_cuts)
+            strategy_message += (f"\n🧮 Guess: {advice['guess_bits']:.2f} bits, "
+                                 f"{advice['guess_win_chance']:.0%} win chance | "
+                                 f"Hint: {advice['hint_bits']:.2f} bits, "
+                                 f"{advice['hint_win_chance']:.0%} win chance")
+            if advice["recommend"] == "hint" and advice["hint_bits"] == 0:
+                strategy_message += "\n💡 Spend a hint: it reveals nothing now but unlocks a finer hint level!"
+            elif advice["recommend"] == "hint":
+                strategy_message += "\n💡 A hint is worth more than a guess right now!"
+            else:
+                strategy_message += "\n🎯 Save your hints, a guess is worth more right now!"
         
-        if len(self.previous_guesses) == 0:
-            strategy_message += "\n💡 Binary search tip: Always start with 50 to split the range in half!"
+        if len(game_round.previous_guesses) == 0:
+            strategy_message += f"\n💡 Binary search tip: Always start with {self.rules.midpoint} to split the range in half!"
         elif range_size <= 3:
             strategy_message += "\n🎉 You're very close! Only a few numbers left!"
         
-        self.add_message(strategy_message)
+        self.add_message(strategy_message, event="strategy_tip")
         
     def run(self):
         """Start the GUI application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            # Flush queued log records before the process exits
+            if self.game_logger is not None:
+                self.game_logger.close()
+            if self.metrics_server is not None:
+                self.metrics_server.shutdown()
+                self.metrics_server.server_close()
+            if self.spectator_hub is not None:
+                self.spectator_hub.close()
+            if self.scoreboard is not None:
+                self.scoreboard.close()
+            # The newest snapshot is written before the process exits
+            if self.autosaver is not None:
+                self.autosaver.close()
 
 if __name__ == "__main__":
-    game = GuessingGameGUI()
-    game.run()
+    parser = argparse.ArgumentParser(description="Number Guessing Game")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for the secret numbers so sessions can be replayed")
+    parser.add_argument("--show-seed", action="store_true",
+                        help="Show each session's seed in the game messages (it reveals every secret)")
+    parser.add_argument("--log-file", default=DEFAULT_LOG_PATH,
+                        help="JSON lines file for attempts and game events")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Serve Prometheus metrics on 127.0.0.1 at this port")
+    parser.add_argument("--spectate-port", type=int, default=None,
+                        help="Broadcast game events to spectators on 127.0.0.1 at this port")
+    parser.add_argument("--scoreboard", nargs="?", const=DEFAULT_SCOREBOARD, default=None, metavar="NAME",
+                        help="Add this game's results to the shared scoreboard of local game processes")
+    parser.add_argument("--autosave-file", default=DEFAULT_AUTOSAVE_PATH,
+                        help="Where the session in progress is saved and resumed from")
+    parser.add_argument("--no-autosave", action="store_true",
+                        help="Neither save nor resume the session in progress")
+    parser.add_argument("--daily", action="store_true",
+                        help="Play today's daily challenge: the same secret number for everyone")
+    parser.add_argument("--watchdog", type=float, default=None, metavar="SECONDS",
+                        help="Log a stack sample when the main loop stalls longer than this")
+    parser.add_argument("--boards", type=int, default=1,
+                        help="Run this many independent boards in one window")
+    parser.add_argument("--batch", metavar="FILE", default=None,
+                        help="Play guess/hint commands from FILE (- for stdin) and print JSON lines instead of opening a window")
+    parser.add_argument("--rules", metavar="FILE", default=None,
+                        help="Rules profile (.toml or .json) with the range, limits, hints, colors and messages")
+    args = parser.parse_args()
+    
+    # The profile is validated and compiled once, before anything reads it
+    if args.rules is not None:
+        try:
+            use_rules(load_rules(args.rules))
+        except (OSError, RulesError) as error:
+            parser.error(f"--rules: {error}")
+    
+    daily_date = date.today() if args.daily else None
+    if args.batch is not None:
+        run_batch(args.batch, daily_seed(daily_date) if args.daily else args.seed)
+    else:
+        if args.boards > 1:
+            game = MultiBoardGUI(args.boards, seed=args.seed)
+        else:
+            game = GuessingGameGUI(seed=args.seed, log_path=args.log_file, metrics_port=args.metrics_port,
+                                   spectate_port=args.spectate_port, watchdog_threshold=args.watchdog,
+                                   scoreboard_name=args.scoreboard,
+                                   autosave_path=None if args.no_autosave else args.autosave_file,
+                                   daily_date=daily_date, show_seed=args.show_seed)
+        game.run()
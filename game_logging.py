@@ -0,0 +1,145 @@
+"""
+Asynchronous structured logging for attempts and game events
+The Tk thread only enqueues log records; a QueueListener thread formats them as JSON lines
+"""
+
+import json
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOGGER_NAME = "number_guessing_game"
+DEFAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), ".number_guessing_game", "game.log.jsonl")
+
+
+class SecondCache:
+    """time.strftime that only re-formats when the second changes"""
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        self._second = None
+        self._text = ""
+
+    def __call__(self, timestamp=None):
+        second = int(time.time() if timestamp is None else timestamp)
+        if second != self._second:
+            self._second = second
+            self._text = time.strftime(self.fmt, time.localtime(second))
+        return self._text
+
+
+class DirectQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched so the caller never formats anything"""
+
+    def prepare(self, record):
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line with a cached timestamp"""
+
+    def __init__(self):
+        super().__init__()
+        self._timestamp = SecondCache("%Y-%m-%dT%H:%M:%S")
+
+    def format(self, record):
+        data = {
+            "time": self._timestamp(record.created),
+            "ms": int(record.msecs),
+            "level": record.levelname,
+            "event": getattr(record, "event", record.getMessage()),
+        }
+
+        # Game events are passed through as objects and only unpacked here
+        game_event = getattr(record, "game_event", None)
+        if game_event is not None:
+            data.update(vars(game_event))
+
+        fields = getattr(record, "fields", None)
+        if fields:
+            data.update(fields)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class JsonLinesFileHandler(RotatingFileHandler):
+    """Rotating JSON lines sink that also writes a throughput line every second"""
+
+    def __init__(self, path, max_bytes=5 * 1024 * 1024, backup_count=3):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        super().__init__(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.setFormatter(JsonLinesFormatter())
+        self._second = None
+        self._count = 0
+
+    def emit(self, record):
+        second = int(record.created)
+        if second != self._second:
+            self._flush_throughput(second)
+        self._count += 1
+        super().emit(record)
+
+    def close(self):
+        # Report the last partial second before the file closes
+        self._flush_throughput(None)
+        super().close()
+
+    def _flush_throughput(self, second):
+        """Write how many records arrived during the previous second"""
+        if self._second is not None and self._count:
+            summary = logging.makeLogRecord({
+                "name": LOGGER_NAME,
+                "levelno": logging.INFO,
+                "levelname": "INFO",
+                "msg": "throughput",
+                "created": float(self._second),
+                "msecs": 0.0,
+                "fields": {"second": self._second, "records_per_second": self._count},
+            })
+            super().emit(summary)
+        self._second = second
+        self._count = 0
+
+
+class GameLogger:
+    """Queue-backed logger for attempts and game events"""
+
+    def __init__(self, path=DEFAULT_LOG_PATH, max_bytes=5 * 1024 * 1024, backup_count=3):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.file_handler = JsonLinesFileHandler(path, max_bytes, backup_count)
+        self.listener = QueueListener(self.queue, self.file_handler)
+
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.queue_handler = DirectQueueHandler(self.queue)
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+
+    def log_attempt(self, guess, is_valid, round_number=None):
+        """Record a guess attempt"""
+        self.logger.info("attempt", extra={
+            "event": "attempt",
+            "fields": {"guess": guess, "valid": is_valid, "round": round_number},
+        })
+
+    def log_event(self, event):
+        """Record a game event published on the event bus"""
+        self.logger.info(event.kind, extra={"event": event.kind, "game_event": event})
+
+    def log_stall(self, seconds, handler, stack):
+        """Record a main-loop stall reported by the watchdog"""
+        self.logger.warning("stall", extra={
+            "event": "stall",
+            "fields": {"seconds": round(seconds, 3), "handler": handler, "stack": stack},
+        })
+
+    def close(self):
+        """Drain the queue, stop the listener thread and close the file"""
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        self.file_handler.close()
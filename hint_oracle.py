@@ -0,0 +1,110 @@
+"""
+Hint-value oracle for the Strategy Tip
+Compares spending the next hint with making the best guess, both in bits of information
+and in the chance of still winning the round. Values are cached per game state and only
+states whose range straddles an unused hint boundary are ever expanded, so large ranges
+fall back to the closed-form counts in strategy_analysis.
+"""
+
+import math
+from functools import lru_cache
+
+from rules import active_rules
+from strategy_analysis import wins_within
+
+
+def _entropy(sizes):
+    """Entropy in bits of an outcome whose branches hold these numbers of secrets"""
+    total = sum(sizes)
+    if total <= 0:
+        return 0.0
+    return sum(-size / total * math.log2(size / total) for size in sizes if size > 0)
+
+
+def _hint_split(low, high, hint_level, cuts):
+    """Ranges the next hint can narrow [low, high] to"""
+    level_cuts = cuts[min(hint_level, len(cuts) - 1)]
+    bounds = [low] + [cut for cut in level_cuts if low < cut <= high] + [high + 1]
+    return [(start, end - 1) for start, end in zip(bounds, bounds[1:])]
+
+
+def _hints_can_help(low, high, hint_level, hints_left, cuts):
+    """True while some remaining hint level still has a boundary inside the range"""
+    for level in range(hint_level, hint_level + hints_left):
+        if len(_hint_split(low, high, level, cuts)) > 1:
+            return True
+    return False
+
+
+def guess_bits(low, high):
+    """Information revealed by the midpoint guess"""
+    middle = (low + high) // 2
+    return _entropy((middle - low, 1, high - middle))
+
+
+def hint_bits(low, high, hint_level, cuts=None):
+    """Information revealed by the next hint (cuts default to the active rules' hint table)"""
+    cuts = cuts or active_rules().hint_cuts
+    return _entropy([end - start + 1 for start, end in _hint_split(low, high, hint_level, cuts)])
+
+
+def win_chance(low, high, hint_level, attempts_left, hints_left, cuts=None):
+    """Chance of winning from this state when every later choice is made optimally"""
+    cuts = tuple(tuple(level) for level in cuts or active_rules().hint_cuts)
+    return _win_chance(low, high, hint_level, attempts_left, hints_left, cuts)
+
+
+@lru_cache(maxsize=65536)
+def _win_chance(low, high, hint_level, attempts_left, hints_left, cuts):
+    size = high - low + 1
+    if size <= 0 or attempts_left <= 0:
+        return 0.0
+    if hints_left <= 0 or not _hints_can_help(low, high, hint_level, hints_left, cuts):
+        return wins_within(size, attempts_left) / size
+
+    return max(_guess_chance(low, high, hint_level, attempts_left, hints_left, cuts),
+               _hint_chance(low, high, hint_level, attempts_left, hints_left, cuts))
+
+
+def _guess_chance(low, high, hint_level, attempts_left, hints_left, cuts):
+    middle = (low + high) // 2
+    wins = 1.0
+    if middle > low:
+        wins += (middle - low) * _win_chance(low, middle - 1, hint_level, attempts_left - 1, hints_left, cuts)
+    if middle < high:
+        wins += (high - middle) * _win_chance(middle + 1, high, hint_level, attempts_left - 1, hints_left, cuts)
+    return wins / (high - low + 1)
+
+
+def _hint_chance(low, high, hint_level, attempts_left, hints_left, cuts):
+    if hints_left <= 0:
+        return 0.0
+    wins = 0.0
+    for start, end in _hint_split(low, high, hint_level, cuts):
+        wins += (end - start + 1) * _win_chance(start, end, hint_level + 1, attempts_left, hints_left - 1, cuts)
+    return wins / (high - low + 1)
+
+
+def advise(min_possible, max_possible, hint_level, attempts_left, hints_left, cuts=None):
+    """Compare the next hint with the best guess for the current state
+
+    Returns a dict with the suggested guess, the bits each choice reveals, the win chance
+    after each choice and the recommended action ("hint" or "guess").
+    """
+    cuts = tuple(tuple(level) for level in cuts or active_rules().hint_cuts)
+    guess_chance = _guess_chance(min_possible, max_possible, hint_level, attempts_left, hints_left, cuts) \
+        if attempts_left > 0 and max_possible >= min_possible else 0.0
+    hint_chance = _hint_chance(min_possible, max_possible, hint_level, attempts_left, hints_left, cuts) \
+        if max_possible >= min_possible else 0.0
+    bits_from_hint = hint_bits(min_possible, max_possible, hint_level, cuts) if hints_left > 0 else 0.0
+
+    return {
+        "guess": (min_possible + max_possible) // 2,
+        "guess_bits": guess_bits(min_possible, max_possible),
+        "hint_bits": bits_from_hint,
+        "guess_win_chance": guess_chance,
+        "hint_win_chance": hint_chance,
+        # A hint costs no attempt, so it wins ties as long as it reveals something
+        "recommend": "hint" if hint_chance > guess_chance or (hint_chance == guess_chance and bits_from_hint > 0)
+        else "guess",
+    }
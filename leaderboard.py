@@ -0,0 +1,233 @@
+"""
+Leaderboard ranking players by win rate and attempts across sessions
+Entries are kept in a bisect-maintained blocked sorted list and stored in a compact binary file
+"""
+
+import os
+import struct
+import tempfile
+from bisect import bisect_left, insort
+from itertools import accumulate
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".number_guessing_game", "leaderboard.dat")
+
+# File layout: header, then one fixed-size record per player
+MAGIC = b"NGLB"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+RECORD = struct.Struct("<32sIIQ")
+NAME_BYTES = 32
+
+
+def _clean_name(name):
+    """Trim a player name so it fits in a record without splitting a character"""
+    return name.encode("utf-8")[:NAME_BYTES].decode("utf-8", "ignore")
+
+
+def _sort_key(name, wins, rounds, attempts):
+    """Higher win rate first, then fewer attempts per round, then name"""
+    return (-wins / rounds, attempts / rounds, name)
+
+
+class SortedKeyList:
+    """Sorted list split into blocks so inserts and deletes stay cheap with millions of keys"""
+
+    def __init__(self, keys=(), load=1000):
+        self._load = load
+        keys = sorted(keys)
+        self._blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._offsets = None
+        self._length = len(keys)
+
+    def __len__(self):
+        return self._length
+
+    def _block_for(self, key):
+        """Index of the first block whose largest key is >= key"""
+        return min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+
+    def add(self, key):
+        """Insert a key in sorted position"""
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+        else:
+            index = self._block_for(key)
+            block = self._blocks[index]
+            insort(block, key)
+            self._maxes[index] = block[-1]
+
+            # Split blocks that grow too large so inserts stay proportional to the block size
+            if len(block) > self._load * 2:
+                self._blocks[index:index + 1] = [block[:self._load], block[self._load:]]
+                self._maxes[index:index + 1] = [block[self._load - 1], block[-1]]
+        self._length += 1
+        self._offsets = None
+
+    def remove(self, key):
+        """Remove a key that is known to be present"""
+        index = self._block_for(key)
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if position == len(block) or block[position] != key:
+            raise ValueError("Key not found")
+
+        del block[position]
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+        self._length -= 1
+        self._offsets = None
+
+    def index(self, key):
+        """Number of keys strictly less than key"""
+        if not self._blocks:
+            return 0
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            return self._length
+
+        # Block start offsets are rebuilt lazily after the board changes
+        if self._offsets is None:
+            self._offsets = [0]
+            self._offsets.extend(accumulate(len(block) for block in self._blocks))
+        return self._offsets[index] + bisect_left(self._blocks[index], key)
+
+    def head(self, count):
+        """Return the first count keys"""
+        result = []
+        for block in self._blocks:
+            if len(result) >= count:
+                break
+            result.extend(block[:count - len(result)])
+        return result
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+
+class Leaderboard:
+    """Players ranked by win rate, with O(log n) rank lookups"""
+
+    def __init__(self):
+        self._players = {}
+        self._keys = SortedKeyList()
+
+    def __len__(self):
+        return len(self._players)
+
+    def record(self, name, wins, rounds, attempts):
+        """Add a finished session's results to a player's totals"""
+        if rounds <= 0:
+            return
+        name = _clean_name(name)
+
+        totals = self._players.get(name)
+        if totals is not None:
+            # Remove the old position before re-inserting with the new totals
+            self._keys.remove(_sort_key(name, *totals))
+            totals = (totals[0] + wins, totals[1] + rounds, totals[2] + attempts)
+        else:
+            totals = (wins, rounds, attempts)
+
+        self._players[name] = totals
+        self._keys.add(_sort_key(name, *totals))
+
+    def top(self, count=10):
+        """Return the best entries as dicts, best first"""
+        return [self._entry(key[2], position + 1) for position, key in enumerate(self._keys.head(count))]
+
+    def rank(self, name):
+        """Return the 1-based rank of a player, or None if they have not played"""
+        name = _clean_name(name)
+        totals = self._players.get(name)
+        if totals is None:
+            return None
+        return self._keys.index(_sort_key(name, *totals)) + 1
+
+    def entry(self, name):
+        """Return a player's entry with their rank, or None"""
+        position = self.rank(name)
+        if position is None:
+            return None
+        return self._entry(_clean_name(name), position)
+
+    def _entry(self, name, position):
+        wins, rounds, attempts = self._players[name]
+        return {
+            "rank": position,
+            "name": name,
+            "wins": wins,
+            "rounds": rounds,
+            "win_rate": (wins / rounds) * 100,
+            "mean_attempts": attempts / rounds,
+        }
+
+    def to_bytes(self):
+        """Serialize every player in rank order"""
+        pack = RECORD.pack
+        players = self._players
+        parts = [HEADER.pack(MAGIC, VERSION, len(players))]
+        parts.extend(pack(key[2].encode("utf-8"), *players[key[2]]) for key in self._keys)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a leaderboard from to_bytes output"""
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a leaderboard file")
+
+        end = HEADER.size + count * RECORD.size
+        if len(data) < end:
+            raise ValueError("Leaderboard file is truncated")
+
+        board = cls()
+        players = board._players
+        keys = []
+        for raw_name, wins, rounds, attempts in RECORD.iter_unpack(data[HEADER.size:end]):
+            if not rounds:
+                raise ValueError("Leaderboard file has a record without rounds")
+            name = raw_name.rstrip(b"\0").decode("utf-8", "ignore")
+            players[name] = (wins, rounds, attempts)
+            keys.append((-wins / rounds, attempts / rounds, name))
+
+        # Records are saved in rank order, so sorting them is a linear pass
+        board._keys = SortedKeyList(keys)
+        return board
+
+    def save(self, path=DEFAULT_PATH):
+        """Write the leaderboard atomically"""
+        write_bytes_atomic(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """Load a leaderboard, returning an empty one when the file is missing or unreadable"""
+        try:
+            with open(path, "rb") as handle:
+                return cls.from_bytes(handle.read())
+        except (OSError, ValueError, struct.error):
+            return cls()
+
+
+def write_bytes_atomic(path, data):
+    """Write data to a temp file and rename it over path"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # A unique temp file keeps two writers of the same path from sharing one
+    handle, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                         dir=directory or None)
+    try:
+        with os.fdopen(handle, "wb") as temp:
+            temp.write(data)
+            temp.flush()
+            os.fsync(temp.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
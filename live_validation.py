@@ -0,0 +1,107 @@
+"""
+Keystroke-level validation for the guess entry
+LiveGuessValidator mirrors sanitize_input and validate_guess, but keeps one small summary per
+character so typing or deleting at the end of the entry costs O(1). Edits anywhere else
+(pastes, selections, typing in the middle) rebuild the summary from the proposed text.
+"""
+
+import unicodedata
+
+from engine import DANGEROUS_CHARS
+from rules import active_rules
+
+# Summary of the text so far:
+# (length, leading spaces, trailing spaces, dangerous chars, cleaned chars, minus signs,
+#  cleaned text starts with minus, decimal digits, non-decimal digits, magnitude)
+_EMPTY = (0, 0, 0, 0, 0, 0, False, 0, 0, 0)
+
+
+def _push(state, char, cap):
+    (length, leading, trailing, dangerous, cleaned, minus, leading_minus,
+     digits, bad_digits, magnitude) = state
+    space = char.isspace()
+    if space and leading == length:
+        leading += 1
+    trailing = trailing + 1 if space else 0
+    if char in DANGEROUS_CHARS:
+        dangerous += 1
+    if char == "-":
+        if cleaned == 0:
+            leading_minus = True
+        cleaned += 1
+        minus += 1
+    elif char.isdigit():
+        cleaned += 1
+        if char.isdecimal():
+            digits += 1
+            magnitude = min(magnitude * 10 + unicodedata.decimal(char), cap)
+        else:
+            bad_digits += 1
+    return (length + 1, leading, trailing, dangerous, cleaned, minus, leading_minus,
+            digits, bad_digits, magnitude)
+
+
+class LiveGuessValidator:
+    """Incremental equivalent of validate_guess for text typed one character at a time"""
+
+    def __init__(self, low=None, high=None, rules=None):
+        self.rules = rules or active_rules()
+        self.low = self.rules.low if low is None else low
+        self.high = self.rules.high if high is None else high
+        # Magnitudes above the accepted inputs are out of range anyway, so they stop growing
+        self._cap = max(-self.rules.min_input, self.rules.max_input) + 1
+        self._states = [_EMPTY]
+
+    def __len__(self):
+        return len(self._states) - 1
+
+    def reset(self, text=""):
+        """Rebuild the summary from a whole string"""
+        self._states = [_EMPTY]
+        self.insert(text)
+
+    def insert(self, text):
+        """Characters typed at the end of the entry"""
+        states = self._states
+        cap = self._cap
+        for char in text:
+            states.append(_push(states[-1], char, cap))
+
+    def delete(self, count):
+        """Characters removed from the end of the entry"""
+        del self._states[max(1, len(self._states) - count):]
+
+    def edit(self, action, index, text, proposed):
+        """Apply one Tk entry edit (validatecommand %d, %i, %S and %P)"""
+        action = int(action)
+        index = int(index)
+        if action == 1 and index == len(self):
+            self.insert(text)
+        elif action == 0 and index + len(text) == len(self):
+            self.delete(len(text))
+        else:
+            self.reset(proposed)
+
+    def result(self):
+        """(number, None) or (None, error message), exactly as validate_guess would return"""
+        (length, leading, trailing, dangerous, cleaned, minus, leading_minus,
+         digits, bad_digits, magnitude) = self._states[-1]
+        if length == 0:
+            return None, "❌ Input cannot be empty!"
+        if dangerous:
+            return None, "❌ Invalid characters detected!"
+        stripped = 0 if leading == length else length - leading - trailing
+        rules = self.rules
+        if stripped > rules.max_input_length:
+            return None, rules.messages["too_long"]
+        if cleaned == 0:
+            return None, "❌ Please enter a valid number!"
+        if bad_digits or digits == 0 or minus > 1 or (minus == 1 and not leading_minus):
+            return None, "❌ Please enter a valid integer!"
+
+        number = -magnitude if minus else magnitude
+        if number < rules.min_input or number > rules.max_input:
+            return None, "❌ Number out of acceptable range!"
+        if number < self.low or number > self.high:
+            return None, rules.range_message(self.low, self.high)
+        return number, None
@@ -0,0 +1,278 @@
+"""
+Lobby and rooms for head-to-head races
+Waiting players are grouped into rooms; everyone in a room chases the same secret under the
+normal attempts and hints rules, and the fewest attempts wins. Round deadlines live in one
+hashed timer wheel, so tens of thousands of rooms tick without a timer per room:
+
+    python lobby.py --rooms 20000 --room-size 4
+"""
+
+import argparse
+import math
+import random
+import time
+
+from engine import GameRound, optimal_guess
+from rules import active_rules
+from secret_stream import SecretNumberStream
+
+ROUND_SECONDS = 120
+
+
+class TimerWheel:
+    """Hashed timer wheel; schedule and cancel are O(1) and each tick visits one slot"""
+
+    def __init__(self, tick=1.0, slots=512, start=0.0):
+        self.tick = tick
+        self.slots = [[] for _ in range(slots)]
+        self.current_tick = int(start // tick)
+        self.active = 0
+
+    def schedule(self, delay, key):
+        """Fire key after delay seconds; returns a handle for cancel()"""
+        expires = self.current_tick + max(1, math.ceil(delay / self.tick))
+        # [expiry tick, key, still active]
+        entry = [expires, key, True]
+        self.slots[expires % len(self.slots)].append(entry)
+        self.active += 1
+        return entry
+
+    def cancel(self, entry):
+        """Cancelled entries are skipped and swept out when their slot comes round"""
+        if entry[2]:
+            entry[2] = False
+            self.active -= 1
+
+    def advance(self, now):
+        """Move the wheel to now and return the keys of every expired timer"""
+        target = int(now // self.tick)
+        if target <= self.current_tick:
+            return []
+
+        expired = []
+        slot_count = len(self.slots)
+        # After a long pause every slot is visited once instead of once per missed tick
+        for tick in range(self.current_tick + 1, self.current_tick + 1 + min(target - self.current_tick, slot_count)):
+            index = tick % slot_count
+            remaining = []
+            for entry in self.slots[index]:
+                if not entry[2]:
+                    continue
+                if entry[0] <= target:
+                    entry[2] = False
+                    self.active -= 1
+                    expired.append(entry[1])
+                else:
+                    remaining.append(entry)
+            self.slots[index] = remaining
+        self.current_tick = target
+        return expired
+
+
+class Room:
+    """Players racing for one shared secret, each under the normal round rules"""
+
+    def __init__(self, room_id, secret_number, players, started_at):
+        self.room_id = room_id
+        self.secret_number = secret_number
+        self.started_at = started_at
+        self.rounds = {player: GameRound(secret_number) for player in players}
+        self.timer = None
+        self.timed_out = False
+
+    @property
+    def all_done(self):
+        return not any(game_round.active for game_round in self.rounds.values())
+
+    def standings(self):
+        """Winners ordered by attempts then hints, followed by everyone who did not find it"""
+        rows = []
+        for player, game_round in self.rounds.items():
+            rows.append({
+                "player": player,
+                "won": game_round.won,
+                "attempts": game_round.attempts_used,
+                "hints": game_round.hint_level,
+            })
+        rows.sort(key=lambda row: (not row["won"], row["attempts"], row["hints"]))
+
+        winners = sum(row["won"] for row in rows)
+        place = 0
+        previous = None
+        for index, row in enumerate(rows):
+            if not row["won"]:
+                # Everyone who did not find the secret shares last place
+                row["place"] = winners + 1
+                continue
+            key = (row["attempts"], row["hints"])
+            if key != previous:
+                place = index + 1
+                previous = key
+            row["place"] = place
+        return rows
+
+
+class Lobby:
+    """Matches waiting players into rooms and enforces their deadlines"""
+
+    def __init__(self, room_size=2, round_seconds=ROUND_SECONDS, seed=None, clock=time.monotonic,
+                 tick=1.0, on_room_finished=None):
+        if room_size < 1:
+            raise ValueError("room_size must be at least 1")
+        self.room_size = room_size
+        self.round_seconds = round_seconds
+        self.clock = clock
+        self.on_room_finished = on_room_finished
+        rules = active_rules()
+        self.secret_stream = SecretNumberStream(rules.low, rules.high, seed)
+        self.wheel = TimerWheel(tick, start=clock())
+
+        # Insertion-ordered, so the longest waiting players are matched first
+        self.waiting = {}
+        self.rooms = {}
+        self.player_rooms = {}
+        self.next_room_id = 1
+        self.finished_rooms = 0
+
+    def join(self, player):
+        """Add a player to the queue; returns the room once it fills, else None"""
+        if player in self.waiting or player in self.player_rooms:
+            raise ValueError(f"{player} is already in the lobby")
+        self.waiting[player] = self.clock()
+        if len(self.waiting) < self.room_size:
+            return None
+
+        players = []
+        for waiting_player in self.waiting:
+            players.append(waiting_player)
+            if len(players) == self.room_size:
+                break
+        for waiting_player in players:
+            del self.waiting[waiting_player]
+        return self._open_room(players)
+
+    def leave(self, player):
+        """Remove a waiting player, or forfeit the player's current round"""
+        if self.waiting.pop(player, None) is not None:
+            return
+        room = self._room_of(player)
+        room.rounds[player].active = False
+        self._finish_if_done(room)
+
+    def guess(self, player, number):
+        """Apply a guess for a player; returns "correct", "low" or "high" """
+        room = self._room_of(player)
+        result = room.rounds[player].guess(number)
+        self._finish_if_done(room)
+        return result
+
+    def hint(self, player):
+        """Spend one of the player's hints; returns the hint message"""
+        message, bounds = self._room_of(player).rounds[player].hint()
+        return message
+
+    def round_of(self, player):
+        """The GameRound a player is currently playing"""
+        return self._room_of(player).rounds[player]
+
+    def tick(self):
+        """Advance the timer wheel and close every room past its deadline"""
+        expired = self.wheel.advance(self.clock())
+        for room_id in expired:
+            room = self.rooms.get(room_id)
+            if room is not None:
+                room.timed_out = True
+                for game_round in room.rounds.values():
+                    game_round.active = False
+                self._finish(room)
+        return len(expired)
+
+    def _open_room(self, players):
+        room_id = self.next_room_id
+        self.next_room_id += 1
+        room = Room(room_id, self.secret_stream.next_secret(), players, self.clock())
+        room.timer = self.wheel.schedule(self.round_seconds, room_id)
+        self.rooms[room_id] = room
+        for player in players:
+            self.player_rooms[player] = room_id
+        return room
+
+    def _room_of(self, player):
+        room_id = self.player_rooms.get(player)
+        if room_id is None:
+            raise ValueError(f"{player} is not in a room")
+        return self.rooms[room_id]
+
+    def _finish_if_done(self, room):
+        if room.all_done:
+            self.wheel.cancel(room.timer)
+            self._finish(room)
+
+    def _finish(self, room):
+        del self.rooms[room.room_id]
+        for player in room.rounds:
+            del self.player_rooms[player]
+        self.finished_rooms += 1
+        if self.on_room_finished is not None:
+            self.on_room_finished(room, room.standings())
+
+
+def simulate(rooms=20000, room_size=2, seed=0):
+    """Fill a lobby, let bots play some rooms to the end and time the shared ticks"""
+    now = [0.0]
+    lobby = Lobby(room_size=room_size, seed=seed, clock=lambda: now[0])
+    rng = random.Random(seed)
+
+    started = time.perf_counter()
+    for player in range(rooms * room_size):
+        lobby.join(f"player-{player}")
+    join_seconds = time.perf_counter() - started
+
+    # Half the rooms are played out by midpoint bots; the rest wait for their deadline
+    started = time.perf_counter()
+    for room in list(lobby.rooms.values()):
+        if rng.random() < 0.5:
+            continue
+        for player, game_round in room.rounds.items():
+            while game_round.active:
+                lobby.guess(player, optimal_guess(game_round.min_possible, game_round.max_possible,
+                                                  game_round.previous_guesses))
+    play_seconds = time.perf_counter() - started
+
+    tick_seconds = []
+    while lobby.rooms:
+        now[0] += lobby.wheel.tick
+        started = time.perf_counter()
+        lobby.tick()
+        tick_seconds.append(time.perf_counter() - started)
+
+    return {
+        "rooms": rooms,
+        "players": rooms * room_size,
+        "join_seconds": join_seconds,
+        "play_seconds": play_seconds,
+        "ticks": len(tick_seconds),
+        "max_tick_ms": max(tick_seconds) * 1000 if tick_seconds else 0.0,
+        "mean_tick_ms": sum(tick_seconds) / len(tick_seconds) * 1000 if tick_seconds else 0.0,
+        "finished_rooms": lobby.finished_rooms,
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Simulate lobby matchmaking and round deadlines")
+    parser.add_argument("--rooms", type=int, default=20000, help="Rooms to open")
+    parser.add_argument("--room-size", type=int, default=2, help="Players per room")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for secrets and bot choices")
+    args = parser.parse_args()
+
+    report = simulate(args.rooms, args.room_size, args.seed)
+    print(f"🏟️ {report['rooms']} rooms, {report['players']} players")
+    print(f"   Matchmaking: {report['join_seconds'] * 1000:.1f} ms")
+    print(f"   Bot play: {report['play_seconds'] * 1000:.1f} ms")
+    print(f"   Ticks: {report['ticks']}, mean {report['mean_tick_ms']:.3f} ms, max {report['max_tick_ms']:.3f} ms")
+    print(f"   Finished rooms: {report['finished_rooms']}")
+
+
+if __name__ == "__main__":
+    main()
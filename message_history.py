@@ -0,0 +1,81 @@
+"""
+Message history for the game messages box
+Messages are kept in an internal buffer so they can be exported without reading the Tk widget back
+"""
+
+import json
+import threading
+import time
+
+from leaderboard import write_bytes_atomic
+
+# Number of records written per chunk when exporting
+EXPORT_CHUNK = 1000
+
+
+class MessageHistory:
+    """Append-only buffer of game messages with structured fields"""
+
+    def __init__(self):
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def append(self, text, round_number, event="info", timestamp=None):
+        """Record a message and return the stored entry"""
+        entry = (time.time() if timestamp is None else timestamp, round_number, event, text)
+        self._entries.append(entry)
+        return entry
+
+    def snapshot(self):
+        """Return a copy of the entries that is safe to hand to another thread"""
+        return tuple(self._entries)
+
+    def clear(self):
+        """Forget every message"""
+        self._entries = []
+
+
+def format_text(entry):
+    """Render an entry like the messages box does, with its round and event in front of the text"""
+    timestamp, round_number, event, text = entry
+    return f"[{time.strftime('%H:%M:%S', time.localtime(timestamp))}] [round {round_number}] [{event}] {text}"
+
+
+def format_jsonl(entry):
+    """Render an entry as one JSON object"""
+    timestamp, round_number, event, text = entry
+    return json.dumps({
+        "timestamp": timestamp,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(timestamp)),
+        "round": round_number,
+        "event": event,
+        "text": text,
+    }, ensure_ascii=False)
+
+
+def export_history(entries, path):
+    """Write entries to path as JSON lines (.jsonl) or plain text, encoded in chunks"""
+    formatter = format_jsonl if path.lower().endswith(".jsonl") else format_text
+    parts = []
+    for start in range(0, len(entries), EXPORT_CHUNK):
+        chunk = entries[start:start + EXPORT_CHUNK]
+        parts.append(("\n".join(formatter(entry) for entry in chunk) + "\n").encode("utf-8"))
+    write_bytes_atomic(path, b"".join(parts))
+    return len(entries)
+
+
+def export_in_background(entries, path, on_done):
+    """Export on a worker thread and call on_done(count, error) when finished"""
+    def worker():
+        try:
+            count = export_history(entries, path)
+        except OSError as error:
+            on_done(0, error)
+        else:
+            on_done(count, None)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
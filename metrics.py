@@ -0,0 +1,197 @@
+"""
+Prometheus-format metrics for kiosk and service deployments
+Counters and histograms write to per-thread shards without locks; shards are only summed when scraped
+
+    python game.py --metrics-port 9464
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from events import GuessEvaluated, HintGiven, InvalidGuess, RoundEnded, RoundStarted
+from rules import active_rules
+
+# Fixed error messages from the input sanitizers mapped to metric labels
+ERROR_TYPES = {
+    "❌ Input cannot be empty!": "empty",
+    "❌ Invalid characters detected!": "invalid_characters",
+    "❌ Please enter a valid number!": "not_a_number",
+    "❌ Number out of acceptable range!": "out_of_range",
+    "❌ Please enter a valid integer!": "not_an_integer",
+}
+
+
+def error_types(rules=None):
+    """Every sanitizer error message under a rules profile mapped to its metric label"""
+    rules = rules or active_rules()
+    return dict(ERROR_TYPES, **{rules.messages["too_long"]: "too_long"})
+
+
+ROUND_DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class _Sharded:
+    """Base for metrics that keep one private shard per writing thread"""
+
+    def __init__(self, name, help_text, label_name=None):
+        self.name = name
+        self.help_text = help_text
+        self.label_name = label_name
+        self._local = threading.local()
+        self._shards = []
+        self._register_lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+            self._local.shard = shard
+            # Only the first write from each thread takes the lock
+            with self._register_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _label(self, label):
+        if self.label_name is None or label is None:
+            return ""
+        return f'{{{self.label_name}="{label}"}}'
+
+
+class Counter(_Sharded):
+    """Monotonic counter, optionally split by one label"""
+
+    def _new_shard(self):
+        return {}
+
+    def inc(self, label=None, amount=1):
+        shard = self._shard()
+        shard[label] = shard.get(label, 0) + amount
+
+    def values(self):
+        """Sum every thread's shard"""
+        totals = {}
+        for shard in list(self._shards):
+            for label, value in shard.copy().items():
+                totals[label] = totals.get(label, 0) + value
+        return totals
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label, value in sorted(self.values().items(), key=lambda item: str(item[0])):
+            lines.append(f"{self.name}{self._label(label)} {value}")
+        return lines
+
+
+class Histogram(_Sharded):
+    """Histogram with fixed upper bounds"""
+
+    def __init__(self, name, help_text, buckets):
+        super().__init__(name, help_text)
+        self.buckets = tuple(buckets)
+
+    def _new_shard(self):
+        # One slot per bucket plus +Inf, then the running sum
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value):
+        shard = self._shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self):
+        """Return (per-bucket counts, sum) across every thread"""
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for shard in list(self._shards):
+            values = list(shard)
+            for index in range(len(counts)):
+                counts[index] += values[index]
+            total += values[-1]
+        return counts, total
+
+    def render(self):
+        counts, total = self.snapshot()
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {cumulative}")
+        return lines
+
+
+class GameMetrics:
+    """Game counters and histograms fed from the event bus"""
+
+    def __init__(self):
+        self.guesses = Counter("guessing_game_guesses_total", "Valid guesses processed")
+        self.invalid_inputs = Counter("guessing_game_invalid_inputs_total",
+                                      "Rejected inputs by error type", "error")
+        self.hints = Counter("guessing_game_hints_total", "Hints used by hint level", "level")
+        self.rounds = Counter("guessing_game_rounds_total", "Finished rounds by outcome", "outcome")
+        self.round_duration = Histogram("guessing_game_round_duration_seconds",
+                                        "Time from round start to round end", ROUND_DURATION_BUCKETS)
+        self.guess_latency = Histogram("guessing_game_make_guess_seconds",
+                                       "Time spent handling make_guess", LATENCY_BUCKETS)
+        self._round_started = None
+        self.error_types = error_types()
+
+    def subscribe(self, bus):
+        """Count events published on an event bus"""
+        bus.subscribe(RoundStarted, self._on_round_started)
+        bus.subscribe(GuessEvaluated, lambda event: self.guesses.inc())
+        bus.subscribe(InvalidGuess, self._on_invalid_guess)
+        bus.subscribe(HintGiven, lambda event: self.hints.inc(event.hint_level + 1))
+        bus.subscribe(RoundEnded, self._on_round_ended)
+
+    def _on_round_started(self, event):
+        self._round_started = time.monotonic()
+
+    def _on_invalid_guess(self, event):
+        self.invalid_inputs.inc(self.error_types.get(event.error, "game_range"))
+
+    def _on_round_ended(self, event):
+        self.rounds.inc("win" if event.won else "loss")
+        if self._round_started is not None:
+            self.round_duration.observe(time.monotonic() - self._round_started)
+            self._round_started = None
+
+    def render(self):
+        """Aggregate every metric into Prometheus text format"""
+        lines = []
+        for metric in (self.guesses, self.invalid_inputs, self.hints, self.rounds,
+                       self.round_duration, self.guess_latency):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(metrics, port, host="127.0.0.1"):
+    """Serve /metrics on a daemon thread and return the server"""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes should not spam the console
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    # A short poll interval keeps shutdown() quick
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
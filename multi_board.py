@@ -0,0 +1,257 @@
+"""
+Multi-board window for training sessions with many learners on one machine
+Boards live in a BoardPool; the window has one menubar, one set of fonts, one board view that is
+re-pointed at the selected board and one periodic update loop. Hidden boards only update their
+overview button, so redraw cost does not grow with the number of boards:
+
+    python game.py --boards 50
+"""
+
+import time
+import tkinter as tk
+from tkinter import messagebox
+
+import customtkinter as ctk
+
+from board_pool import MAX_BOARD_MESSAGES, BoardPool
+from engine import optimal_guess as suggest_guess, sanitize_input, sanitize_rounds_input
+from game_logging import SecondCache
+from rules import active_rules
+
+# Milliseconds between passes of the shared update loop
+TICK_MS = 100
+
+EVENT_COLORS = {"win": "#4CAF50", "loss": "#F44336", "invalid_input": "#F44336", "hint": "#FF9800"}
+
+
+class MultiBoardGUI:
+    def __init__(self, count, seed=None, rounds=1):
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+
+        self.root = ctk.CTk()
+        self.root.title(f"🎯 Number Guessing Game - {count} boards")
+        self.root.geometry("1100x800")
+        self.root.resizable(True, True)
+
+        # Fonts are created once and shared by every widget
+        self.fonts = {
+            "title": ctk.CTkFont(size=24, weight="bold"),
+            "bold": ctk.CTkFont(size=16, weight="bold"),
+            "normal": ctk.CTkFont(size=14),
+            "small": ctk.CTkFont(size=12),
+        }
+
+        self.pool = BoardPool(count, seed)
+        self.selected = 0
+        self.shown_messages = 0
+        self.view_lines = 0
+        self.message_clock = SecondCache("%H:%M:%S")
+        self.redraw_ms = 0.0
+
+        self.setup_ui()
+        for board_id in range(count):
+            self.pool.new_session(board_id, rounds)
+        self.refresh(set(range(count)))
+        self.tick_job = self.root.after(TICK_MS, self.tick)
+
+    def setup_ui(self):
+        # Shared menubar
+        menubar_frame = ctk.CTkFrame(self.root, height=40)
+        menubar_frame.pack(fill="x", padx=5, pady=(5, 0))
+        menubar_frame.pack_propagate(False)
+        ctk.CTkButton(menubar_frame, text="📁 File", command=self.show_file_menu, width=80, height=30,
+                      font=self.fonts["small"], fg_color="transparent",
+                      hover_color="#2B2B2B").pack(side="left", padx=5, pady=5)
+        self.cost_label = ctk.CTkLabel(menubar_frame, text="", font=self.fonts["small"], text_color="#666666")
+        self.cost_label.pack(side="right", padx=10, pady=5)
+
+        body = ctk.CTkFrame(self.root)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Overview pane: one small button per board
+        overview = ctk.CTkScrollableFrame(body, width=220)
+        overview.pack(side="left", fill="y", padx=(0, 10))
+        self.board_buttons = []
+        for board in self.pool.boards:
+            button = ctk.CTkButton(overview, text="", font=self.fonts["small"], height=28, anchor="w",
+                                   command=lambda board_id=board.board_id: self.select_board(board_id))
+            button.pack(fill="x", pady=2)
+            self.board_buttons.append(button)
+
+        # Board view shared by every board
+        view = ctk.CTkFrame(body)
+        view.pack(side="left", fill="both", expand=True)
+
+        self.board_title = ctk.CTkLabel(view, text="", font=self.fonts["title"])
+        self.board_title.pack(pady=(15, 5))
+        self.status_label = ctk.CTkLabel(view, text="", font=self.fonts["bold"])
+        self.status_label.pack(pady=5)
+
+        self.guess_entry = ctk.CTkEntry(view, placeholder_text=active_rules().messages["placeholder"],
+                                        font=self.fonts["normal"], width=300, height=40)
+        self.guess_entry.pack(pady=10)
+        self.guess_entry.bind("<Return>", lambda e: self.make_guess())
+
+        buttons_frame = ctk.CTkFrame(view)
+        buttons_frame.pack(pady=5, fill="x")
+        ctk.CTkButton(buttons_frame, text="🎲 Make Guess", command=self.make_guess, font=self.fonts["bold"],
+                      height=40, width=150).pack(side="left", padx=10)
+        self.hint_button = ctk.CTkButton(buttons_frame, text="💡 Get Hint", command=self.get_hint,
+                                         font=self.fonts["bold"], height=40, width=150,
+                                         fg_color="#FF9800", hover_color="#F57C00")
+        self.hint_button.pack(side="right", padx=10)
+        ctk.CTkButton(buttons_frame, text="🎯 Strategy Tip", command=self.get_strategy_tip,
+                      font=self.fonts["bold"], height=40, width=150, fg_color="#9C27B0",
+                      hover_color="#7B1FA2").pack(side="right", padx=10)
+
+        self.messages_text = ctk.CTkTextbox(view, font=self.fonts["normal"], corner_radius=10, border_width=2,
+                                            border_color="#00BCD4", fg_color="#1e1e1e", text_color="#ffffff")
+        self.messages_text.pack(pady=10, padx=15, fill="both", expand=True)
+        for event, color in EVENT_COLORS.items():
+            self.messages_text.tag_config(event, foreground=color)
+
+        ctk.CTkButton(view, text="🎮 New Session", command=self.new_session, font=self.fonts["bold"],
+                      height=40, width=150, fg_color="#4CAF50",
+                      hover_color="#45a049").pack(side="left", padx=10, pady=10)
+
+    def show_file_menu(self):
+        """Show the shared file menu"""
+        file_menu = tk.Menu(self.root, tearoff=0, bg="#2B2B2B", fg="white",
+                            activebackground="#1f538d", activeforeground="white")
+        file_menu.add_command(label="🎮 New Session (this board)", command=self.new_session)
+        file_menu.add_command(label="🔄 New Session (all boards)", command=self.new_session_all)
+        file_menu.add_command(label="📏 Board Costs", command=self.show_costs)
+        file_menu.add_separator()
+        file_menu.add_command(label="❌ Exit", command=self.root.quit)
+        try:
+            file_menu.tk_popup(self.root.winfo_x() + 50, self.root.winfo_y() + 80)
+        finally:
+            file_menu.grab_release()
+
+    @property
+    def board(self):
+        return self.pool.boards[self.selected]
+
+    def tick(self):
+        """The one update loop: start due rounds, render events, redraw what changed"""
+        self.refresh(self.pool.tick())
+        self.tick_job = self.root.after(TICK_MS, self.tick)
+
+    def refresh(self, changed):
+        """Redraw the overview buttons of changed boards and the view if it shows one of them"""
+        if not changed:
+            return
+        started = time.perf_counter()
+        for board_id in changed:
+            board = self.pool.boards[board_id]
+            self.board_buttons[board_id].configure(text=f"Board {board_id + 1}: {board.status()}")
+        if self.selected in changed:
+            self.redraw_view(full=False)
+        self.redraw_ms = (time.perf_counter() - started) * 1000
+        self.cost_label.configure(text=f"Last redraw: {self.redraw_ms:.2f} ms")
+
+    def select_board(self, board_id):
+        """Point the shared view at another board"""
+        self.selected = board_id
+        self.guess_entry.delete(0, "end")
+        self.redraw_view(full=True)
+
+    def redraw_view(self, full):
+        """Update the view labels and append the selected board's new messages"""
+        board = self.board
+        engine = board.engine
+        self.board_title.configure(text=f"🎯 Board {board.board_id + 1}")
+        if engine.round is not None:
+            self.status_label.configure(
+                text=f"Round {engine.current_round} of {engine.total_rounds} · "
+                     f"Attempts left: {engine.round.attempts_left} · Hints left: {engine.round.hints_left}")
+            self.hint_button.configure(
+                state="normal" if engine.game_active and engine.round.hints_left > 0 else "disabled")
+
+        self.messages_text.configure(state="normal")
+        if full:
+            self.messages_text.delete("1.0", "end")
+            self.view_lines = 0
+            new_messages = len(board.messages)
+        else:
+            new_messages = min(board.total_messages - self.shown_messages, len(board.messages))
+        if new_messages > 0:
+            for timestamp, message, event in list(board.messages)[-new_messages:]:
+                self.messages_text.insert("end", f"[{self.message_clock(timestamp)}] {message}\n", event)
+            self.view_lines += new_messages
+        # The widget keeps about as many lines as the board buffer, trimmed in chunks
+        if self.view_lines > MAX_BOARD_MESSAGES * 2:
+            excess = self.view_lines - MAX_BOARD_MESSAGES
+            self.messages_text.delete("1.0", f"{excess + 1}.0")
+            self.view_lines -= excess
+        self.messages_text.configure(state="disabled")
+        self.messages_text.see("end")
+        self.shown_messages = board.total_messages
+
+    def make_guess(self):
+        """Validate the entry and hand the guess to the selected board's engine"""
+        engine = self.board.engine
+        if not engine.game_active:
+            return
+        raw_input = self.guess_entry.get()
+        sanitized_guess, error_message = sanitize_input(raw_input)
+        if error_message:
+            engine.reject_guess(raw_input, error_message)
+        elif engine.make_guess(sanitized_guess) is not None:
+            self.guess_entry.delete(0, "end")
+        # Show the result now instead of waiting for the next tick
+        self.refresh(self.pool.drain())
+
+    def get_hint(self):
+        self.board.engine.get_hint()
+        self.refresh(self.pool.drain())
+
+    def get_strategy_tip(self):
+        """Suggest the midpoint of the selected board's remaining range"""
+        engine = self.board.engine
+        if not engine.game_active:
+            return
+        game_round = engine.round
+        low = max(game_round.min_possible, game_round.hint_range[0])
+        high = min(game_round.max_possible, game_round.hint_range[1])
+        self.board.add_message(f"🎯 Strategic Suggestion: Try {suggest_guess(low, high, game_round.previous_guesses)} "
+                               f"(range {low} to {high})", "strategy_tip")
+        self.refresh({self.selected})
+
+    def ask_rounds(self):
+        """Ask for a number of rounds; returns None when cancelled or invalid"""
+        raw_input = ctk.CTkInputDialog(text="How many rounds would you like to play?",
+                                       title="New Session").get_input()
+        if raw_input is None:
+            return None
+        rounds, error_message = sanitize_rounds_input(raw_input)
+        if error_message:
+            messagebox.showerror("Invalid Input", error_message)
+            return None
+        return rounds
+
+    def new_session(self):
+        rounds = self.ask_rounds()
+        if rounds is not None:
+            self.pool.new_session(self.selected, rounds)
+            self.refresh(self.pool.drain())
+
+    def new_session_all(self):
+        rounds = self.ask_rounds()
+        if rounds is not None:
+            for board_id in range(len(self.pool)):
+                self.pool.new_session(board_id, rounds)
+            self.refresh(self.pool.drain())
+
+    def show_costs(self):
+        """Show the measured redraw cost"""
+        messagebox.showinfo("Board Costs",
+                            f"📏 {len(self.pool)} boards\n"
+                            f"Last redraw: {self.redraw_ms:.2f} ms\n"
+                            f"Update loop every {TICK_MS} ms\n\n"
+                            f"Run 'python board_pool.py --boards {len(self.pool)}' for memory per board.")
+
+    def run(self):
+        """Start the GUI application"""
+        self.root.mainloop()
@@ -0,0 +1,115 @@
+"""
+Compact history of finished rounds
+Per-round fields live in parallel typed arrays and every guess is packed into fixed-size
+array('h') slabs addressed by an offset index, so a guess costs two bytes and reading a round
+back yields plain ints or memoryview slices instead of per-guess objects.
+"""
+
+from array import array
+
+SLAB_SIZE = 65536
+
+
+class RoundHistory:
+    """Append-only store of secrets, guesses, hints used and outcomes"""
+
+    def __init__(self, slab_size=SLAB_SIZE):
+        self.slab_size = slab_size
+        self.secrets = array("h")
+        self.hints_used = array("b")
+        self.won = array("b")
+        # offsets[i] is the position of round i's first guess across all slabs
+        self.offsets = array("q")
+        self.slabs = [array("h")]
+        self.total_guesses = 0
+
+    def __len__(self):
+        return len(self.secrets)
+
+    def record(self, secret, guesses, hints_used, won):
+        """Append one finished round"""
+        self.offsets.append(self.total_guesses)
+        self.secrets.append(secret)
+        self.hints_used.append(hints_used)
+        self.won.append(1 if won else 0)
+
+        slab = self.slabs[-1]
+        if len(slab) + len(guesses) <= self.slab_size:
+            slab.extend(guesses)
+            self.total_guesses += len(guesses)
+            return
+
+        guesses = array("h", guesses)
+        position = 0
+        while position < len(guesses):
+            slab = self.slabs[-1]
+            room = self.slab_size - len(slab)
+            if room == 0:
+                slab = array("h")
+                self.slabs.append(slab)
+                room = self.slab_size
+            slab.extend(guesses[position:position + room])
+            position += room
+        self.total_guesses += len(guesses)
+
+    def record_round(self, game_round):
+        """Append a finished engine GameRound"""
+        self.record(game_round.secret_number, game_round.previous_guesses,
+                    game_round.hint_level, game_round.won)
+
+    def _span(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("round index out of range")
+        end = self.offsets[index + 1] if index + 1 < len(self) else self.total_guesses
+        return index, self.offsets[index], end
+
+    def guess_count(self, index):
+        index, start, end = self._span(index)
+        return end - start
+
+    def guess_views(self, index):
+        """Yield memoryview slices of the slabs holding one round's guesses"""
+        index, start, end = self._span(index)
+        while start < end:
+            slab_index, position = divmod(start, self.slab_size)
+            stop = min(end - start, self.slab_size - position) + position
+            yield memoryview(self.slabs[slab_index])[position:stop]
+            start += stop - position
+
+    def guesses(self, index):
+        """Yield one round's guesses lazily"""
+        for view in self.guess_views(index):
+            yield from view
+
+    def attempts(self):
+        """Yield the number of guesses of every round in order"""
+        offsets = self.offsets
+        count = len(offsets)
+        for index in range(count):
+            end = offsets[index + 1] if index + 1 < count else self.total_guesses
+            yield end - offsets[index]
+
+    def __iter__(self):
+        """Yield (secret, guess count, hints used, won) per round without touching the guesses"""
+        for index, attempts in enumerate(self.attempts()):
+            yield self.secrets[index], attempts, self.hints_used[index], bool(self.won[index])
+
+    def round(self, index):
+        """One round as a dict, for display or export"""
+        index, start, end = self._span(index)
+        return {
+            "secret": self.secrets[index],
+            "guesses": list(self.guesses(index)),
+            "hints_used": self.hints_used[index],
+            "won": bool(self.won[index]),
+        }
+
+    def clear(self):
+        self.__init__(self.slab_size)
+
+    def nbytes(self):
+        """Bytes held by the arrays themselves"""
+        arrays = [self.secrets, self.hints_used, self.won, self.offsets] + self.slabs
+        return sum(len(values) * values.itemsize for values in arrays)
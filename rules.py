@@ -0,0 +1,277 @@
+"""
+Rules profile for the Number Guessing Game
+A profile is a JSON or TOML file with any of the keys in DEFAULT_PROFILE. It is validated once
+and compiled into a Rules object whose lookup tables (hint bucket and message per number and
+level, label color per attempts/hints left, formatted messages) every code path reads:
+
+    python game.py --rules classroom.toml
+"""
+
+import json
+import os
+import tomllib
+from bisect import bisect_right
+
+DEFAULT_PROFILE = {
+    "min_number": 0,
+    "max_number": 100,
+    "attempts": 7,
+    "hints": 3,
+    "max_rounds": 999,
+    "max_input_length": 10,
+    # Integers sanitize_input accepts before the game range is checked
+    "min_input": -999,
+    "max_input": 999,
+    # Hint levels get finer as hints are used; the last level covers every deeper hint.
+    # Each level has its cuts and either one "message" template or one message per bucket;
+    # templates can use {low} and {high}, the inclusive bounds of the bucket.
+    "hint_levels": [
+        {"cuts": [50],
+         "messages": ["The number is less than 50", "The number is 50 or greater"]},
+        {"cuts": [25, 50, 75],
+         "messages": ["The number is between 0 and 25", "The number is between 25 and 50",
+                      "The number is between 50 and 75", "The number is between 75 and 100"]},
+        {"cuts": [13, 25, 38, 50, 63, 75, 88],
+         "messages": ["The number is between 0 and 12", "The number is between 13 and 25",
+                      "The number is between 25 and 38", "The number is between 38 and 50",
+                      "The number is between 50 and 63", "The number is between 63 and 75",
+                      "The number is between 75 and 88", "The number is between 88 and 100"]},
+        {"cuts": [7, 13, 19, 25, 31, 38, 44, 50, 56, 63, 69, 75, 81, 88, 94],
+         "messages": ["The number is between 0 and 6", "The number is between 7 and 13",
+                      "The number is between 13 and 19", "The number is between 19 and 25",
+                      "The number is between 25 and 31", "The number is between 31 and 38",
+                      "The number is between 38 and 44", "The number is between 44 and 50",
+                      "The number is between 50 and 56", "The number is between 56 and 63",
+                      "The number is between 63 and 69", "The number is between 69 and 75",
+                      "The number is between 75 and 81", "The number is between 81 and 88",
+                      "The number is between 88 and 94", "The number is between 94 and 100"]},
+    ],
+    # The attempts label uses the first color whose "min_left" the attempts left reach
+    "attempt_colors": [
+        {"min_left": 5, "color": "#4CAF50"},
+        {"min_left": 3, "color": "#FF9800"},
+        {"min_left": 0, "color": "#F44336"},
+    ],
+    "hint_colors": {"available": "#FF9800", "used_up": "#757575"},
+    # Templates can use {low}, {high}, {attempts}, {hints}, {max_rounds},
+    # {max_input_length} and {midpoint}
+    "messages": {
+        "instructions": "Guess a number between {low} and {high}!\nYou have {attempts} attempts and {hints} hints.",
+        "placeholder": "Enter a number between {low} and {high}",
+        "thinking": "🎯 I'm thinking of a number between {low} and {high}...",
+        "opening_tip": "💡 Pro tip: Start with {midpoint} to use binary search strategy!",
+        "out_of_range": "❌ Number must be between {low} and {high}!",
+        "too_long": "❌ Input too long! Maximum {max_input_length} characters.",
+        "too_many_rounds": "❌ Maximum {max_rounds} rounds allowed!",
+    },
+}
+
+_INTEGER_KEYS = ("min_number", "max_number", "attempts", "hints", "max_rounds", "max_input_length",
+                 "min_input", "max_input")
+
+
+class RulesError(ValueError):
+    """A rules profile that cannot be used"""
+
+
+def _check(condition, message):
+    if not condition:
+        raise RulesError(message)
+
+
+def _is_color(value):
+    return (isinstance(value, str) and len(value) == 7 and value[0] == "#"
+            and all(char in "0123456789abcdefABCDEF" for char in value[1:]))
+
+
+def validate_profile(profile):
+    """Merge a profile over the defaults and check it; returns the merged profile"""
+    _check(isinstance(profile, dict), "A rules profile must be a table of settings")
+    unknown = sorted(set(profile) - set(DEFAULT_PROFILE))
+    _check(not unknown, f"Unknown rules setting(s): {', '.join(unknown)}")
+    merged = dict(DEFAULT_PROFILE, **profile)
+    _check(isinstance(merged["messages"], dict), "messages must be a table of templates")
+    unknown = sorted(set(merged["messages"]) - set(DEFAULT_PROFILE["messages"]))
+    _check(not unknown, f"Unknown message(s): {', '.join(unknown)}")
+    merged["messages"] = dict(DEFAULT_PROFILE["messages"], **merged["messages"])
+    for key, template in merged["messages"].items():
+        _check(isinstance(template, str), f"messages.{key} must be a string")
+
+    for key in _INTEGER_KEYS:
+        # bool is an int subclass, but true/false are never meant as numbers
+        _check(isinstance(merged[key], int) and not isinstance(merged[key], bool),
+               f"{key} must be an integer")
+    low = merged["min_number"]
+    high = merged["max_number"]
+    _check(low < high, "min_number must be less than max_number")
+    # Round history keeps secrets and guesses as 16-bit and hints used as 8-bit integers
+    _check(-32768 <= low and high <= 32767, "min_number..max_number must lie within -32768..32767")
+    _check(merged["attempts"] >= 1, "attempts must be at least 1")
+    _check(0 <= merged["hints"] <= 127, "hints must be between 0 and 127")
+    _check(merged["max_rounds"] >= 1, "max_rounds must be at least 1")
+    _check(merged["min_input"] <= low and merged["max_input"] >= high,
+           "min_input..max_input must include the whole game range")
+    longest = max(len(str(merged["min_input"])), len(str(merged["max_input"])))
+    _check(merged["max_input_length"] >= longest,
+           f"max_input_length must allow {longest} characters so every accepted number can be typed")
+
+    levels = merged["hint_levels"]
+    _check(isinstance(levels, list) and levels, "hint_levels must be a non-empty list")
+    previous = set()
+    for index, level in enumerate(levels):
+        name = f"hint_levels[{index}]"
+        _check(isinstance(level, dict), f"{name} must be a table")
+        cuts = level.get("cuts")
+        _check(isinstance(cuts, list) and cuts and all(isinstance(cut, int) for cut in cuts),
+               f"{name}.cuts must be a non-empty list of integers")
+        _check(all(low < cut <= high for cut in cuts), f"{name}.cuts must lie inside the game range")
+        _check(all(first < second for first, second in zip(cuts, cuts[1:])),
+               f"{name}.cuts must be increasing")
+        # Nested buckets let the latest hint stand for everything hinted so far
+        _check(previous <= set(cuts), f"{name}.cuts must include every cut of the level before")
+        previous = set(cuts)
+        if "messages" in level:
+            _check(isinstance(level["messages"], list) and len(level["messages"]) == len(cuts) + 1,
+                   f"{name}.messages needs one message per bucket ({len(cuts) + 1})")
+            _check(all(isinstance(message, str) for message in level["messages"]),
+                   f"{name}.messages must be strings")
+        else:
+            _check(isinstance(level.get("message"), str), f"{name} needs a message or messages")
+
+    colors = merged["attempt_colors"]
+    _check(isinstance(colors, list) and colors, "attempt_colors must be a non-empty list")
+    for entry in colors:
+        _check(isinstance(entry, dict) and isinstance(entry.get("min_left"), int) and _is_color(entry.get("color")),
+               "attempt_colors entries need an integer min_left and a #RRGGBB color")
+    _check(min(entry["min_left"] for entry in colors) == 0, "attempt_colors must cover 0 attempts left")
+    hint_colors = merged["hint_colors"]
+    _check(isinstance(hint_colors, dict) and set(hint_colors) == {"available", "used_up"}
+           and all(_is_color(color) for color in hint_colors.values()),
+           "hint_colors needs #RRGGBB colors for available and used_up")
+    return merged
+
+
+class Rules:
+    """A validated profile compiled into lookup tables"""
+
+    def __init__(self, profile):
+        profile = validate_profile(profile)
+        try:
+            self._compile(profile)
+        except (KeyError, IndexError, ValueError, AttributeError, TypeError) as error:
+            raise RulesError(f"Bad message template: {error!r}") from error
+
+    def _compile(self, profile):
+        self.profile = profile
+        self.low = profile["min_number"]
+        self.high = profile["max_number"]
+        self.attempts = profile["attempts"]
+        self.hints = profile["hints"]
+        self.max_rounds = profile["max_rounds"]
+        self.max_rounds_digits = len(str(self.max_rounds))
+        self.max_input_length = profile["max_input_length"]
+        self.min_input = profile["min_input"]
+        self.max_input = profile["max_input"]
+        self.midpoint = (self.low + self.high) // 2
+        self.hint_cuts = tuple(tuple(level["cuts"]) for level in profile["hint_levels"])
+
+        # Per level: the bounds and message of every bucket, and the bucket of every number
+        self.hint_buckets = []
+        self.hint_messages = []
+        self.hint_index = []
+        for level, cuts in zip(profile["hint_levels"], self.hint_cuts):
+            edges = (self.low,) + cuts + (self.high + 1,)
+            buckets = tuple((edges[index], edges[index + 1] - 1) for index in range(len(cuts) + 1))
+            templates = level.get("messages") or [level["message"]] * len(buckets)
+            self.hint_buckets.append(buckets)
+            self.hint_messages.append(tuple(template.format(low=bucket_low, high=bucket_high)
+                                            for template, (bucket_low, bucket_high) in zip(templates, buckets)))
+            index = []
+            for position, (bucket_low, bucket_high) in enumerate(buckets):
+                index.extend([position] * (bucket_high - bucket_low + 1))
+            self.hint_index.append(tuple(index))
+        self.hint_buckets = tuple(self.hint_buckets)
+        self.hint_messages = tuple(self.hint_messages)
+        self.hint_index = tuple(self.hint_index)
+
+        # Label colors for every possible number of attempts and hints left
+        thresholds = sorted(((entry["min_left"], entry["color"]) for entry in profile["attempt_colors"]),
+                            reverse=True)
+        self.attempt_colors = tuple(next(color for minimum, color in thresholds if left >= minimum)
+                                    for left in range(self.attempts + 1))
+        self.hint_colors = ((profile["hint_colors"]["used_up"],)
+                            + (profile["hint_colors"]["available"],) * self.hints)
+
+        self.values = {
+            "low": self.low,
+            "high": self.high,
+            "attempts": self.attempts,
+            "hints": self.hints,
+            "max_rounds": self.max_rounds,
+            "max_input_length": self.max_input_length,
+            "midpoint": self.midpoint,
+        }
+        self.messages = {name: template.format(**self.values)
+                         for name, template in profile["messages"].items()}
+
+    def _level(self, hint_level):
+        return min(hint_level, len(self.hint_cuts) - 1)
+
+    def hint_bucket(self, number, hint_level):
+        """Index of the bucket holding number at a hint level"""
+        level = self._level(hint_level)
+        if self.low <= number <= self.high:
+            return self.hint_index[level][number - self.low]
+        return bisect_right(self.hint_cuts[level], number)
+
+    def hint_message(self, number, hint_level):
+        return self.hint_messages[self._level(hint_level)][self.hint_bucket(number, hint_level)]
+
+    def hint_bounds(self, number, hint_level):
+        """Inclusive (low, high) of the bucket holding number"""
+        return self.hint_buckets[self._level(hint_level)][self.hint_bucket(number, hint_level)]
+
+    def range_message(self, low, high):
+        """Out-of-range error for a game range (precomputed for the profile's own range)"""
+        if (low, high) == (self.low, self.high):
+            return self.messages["out_of_range"]
+        return self.profile["messages"]["out_of_range"].format(**dict(self.values, low=low, high=high))
+
+    def attempt_color(self, attempts_left):
+        return self.attempt_colors[min(max(attempts_left, 0), self.attempts)]
+
+    def hint_color(self, hints_left):
+        return self.hint_colors[min(max(hints_left, 0), self.hints)]
+
+
+def load_profile(path):
+    """Read a profile from a .toml or .json file"""
+    try:
+        if os.path.splitext(path)[1].lower() == ".toml":
+            with open(path, "rb") as handle:
+                return tomllib.load(handle)
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (ValueError, tomllib.TOMLDecodeError) as error:
+        raise RulesError(f"Cannot parse {path}: {error}") from error
+
+
+def load_rules(path):
+    """Load, validate and compile a rules profile file"""
+    return Rules(load_profile(path))
+
+
+DEFAULT_RULES = Rules({})
+
+_active = DEFAULT_RULES
+
+
+def active_rules():
+    """The rules every component uses unless it is given its own"""
+    return _active
+
+
+def use_rules(rules):
+    """Make rules the active profile; call once at startup, before any session is created"""
+    global _active
+    _active = rules if rules is not None else DEFAULT_RULES
@@ -0,0 +1,297 @@
+"""
+Live scoreboard shared by every game process on the host
+Each process claims one fixed-size slot in a multiprocessing.shared_memory table and writes its
+wins, rounds, attempts and hints there after every round. Slots are guarded by seqlocks, so the
+single writer never waits and a viewer aggregates the whole table from one memory copy, without
+sockets, files or locks:
+
+    python game.py --scoreboard
+    python scoreboard.py --watch 1
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from events import RoundEnded
+
+DEFAULT_NAME = "number_guessing_scoreboard"
+DEFAULT_SLOTS = 128
+
+# Table layout: header, then one fixed-size slot per process
+MAGIC = b"NGSB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+# seq, pid, wins, rounds, attempts, hints, updated, player name
+SLOT = struct.Struct("<QQQQQQd40s")
+NAME_BYTES = 40
+SEQ_WORDS = SLOT.size // 8
+
+# Seconds a claimed slot must keep its owner before it is used
+CLAIM_SETTLE = 0.002
+
+# How long an attaching process waits for the creator to write the header
+ATTACH_TIMEOUT = 1.0
+
+
+class ScoreboardError(RuntimeError):
+    """The shared table cannot be used"""
+
+
+def _clean_name(name):
+    """Trim a player name so it fits in a slot without splitting a character"""
+    return name.encode("utf-8")[:NAME_BYTES].decode("utf-8", "ignore")
+
+
+def _pid_alive(pid):
+    """Whether a process still exists (always assumed on Windows)"""
+    if pid == os.getpid() or os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _open_segment(name, create, size=0):
+    """Open a segment that outlives the process that created it
+
+    Before Python 3.13 every process that opens a segment registers it with the resource
+    tracker, which unlinks it when that process exits and would split the scoreboard.
+    """
+    try:
+        return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        segment = shared_memory.SharedMemory(name, create=create, size=size)
+        if os.name == "posix":
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+class Scoreboard:
+    """One process's view of the shared table; attaches to it or creates it"""
+
+    def __init__(self, name=DEFAULT_NAME, slots=DEFAULT_SLOTS):
+        self.name = name
+        try:
+            self._segment = _open_segment(name, True, HEADER.size + slots * SLOT.size)
+        except FileExistsError:
+            self._segment = _open_segment(name, False)
+            slots = self._wait_for_header()
+        else:
+            # Zero-filled slots are free; the magic goes in last so attachers see a complete header
+            HEADER.pack_into(self._segment.buf, 0, b"\0" * 4, VERSION, slots, 0)
+            self._segment.buf[:4] = MAGIC
+        self.slots = slots
+        self._table = self._segment.buf[HEADER.size:HEADER.size + slots * SLOT.size]
+        self._words = self._table.cast("Q")
+
+        self.slot = None
+        self._seq = 0
+        self._pid = 0
+        self._player = b""
+        self.wins = 0
+        self.rounds = 0
+        self.attempts = 0
+        self.hints = 0
+
+    def _wait_for_header(self):
+        deadline = time.monotonic() + ATTACH_TIMEOUT
+        while True:
+            magic, version, slots, _ = HEADER.unpack_from(self._segment.buf, 0)
+            if magic == MAGIC:
+                break
+            if time.monotonic() > deadline:
+                self._segment.close()
+                raise ScoreboardError(f"Shared memory {self.name!r} is not a scoreboard")
+            time.sleep(0.001)
+        if version != VERSION or HEADER.size + slots * SLOT.size > self._segment.size:
+            self._segment.close()
+            raise ScoreboardError(f"Scoreboard {self.name!r} has an incompatible layout")
+        return slots
+
+    # Writer side: only the process that claimed a slot ever writes to it
+
+    def join(self, player, pid=None):
+        """Claim a free slot (or one left behind by a dead process) for this process"""
+        pid = os.getpid() if pid is None else pid
+        words = self._words
+        # Starting from a pid-derived slot keeps processes that start together apart
+        for step in range(self.slots):
+            index = (pid + step) % self.slots
+            owner = words[index * SEQ_WORDS + 1]
+            if owner and _pid_alive(owner):
+                continue
+            # There is no cross-process compare-and-swap, so claim, give a process that read the
+            # same free slot time to overwrite the claim, and move on if it did
+            words[index * SEQ_WORDS + 1] = pid
+            time.sleep(CLAIM_SETTLE)
+            if words[index * SEQ_WORDS + 1] != pid:
+                continue
+            self.slot = index
+            self._seq = words[index * SEQ_WORDS] & ~1
+            self._pid = pid
+            self._player = _clean_name(player).encode("utf-8")
+            self.wins = self.rounds = self.attempts = self.hints = 0
+            self._write()
+            return index
+        raise ScoreboardError(f"All {self.slots} scoreboard slots are taken")
+
+    def _write(self):
+        offset = self.slot * SLOT.size
+        # Odd sequence numbers mark a slot that is being written
+        self._seq += 1
+        self._words[self.slot * SEQ_WORDS] = self._seq
+        SLOT.pack_into(self._table, offset, self._seq, self._pid, self.wins, self.rounds,
+                       self.attempts, self.hints, time.time(), self._player)
+        self._seq += 1
+        self._words[self.slot * SEQ_WORDS] = self._seq
+
+    def record_round(self, won, attempts_used, hints_used=0):
+        """Add a finished round to this process's slot"""
+        if self.slot is None:
+            return
+        self.wins += bool(won)
+        self.rounds += 1
+        self.attempts += attempts_used
+        self.hints += hints_used
+        self._write()
+
+    def attach(self, bus):
+        """Record every round that ends on an event bus; returns the unsubscribe function"""
+        return bus.subscribe(RoundEnded, lambda event: self.record_round(
+            event.won, event.attempts_used, event.hints_used))
+
+    def leave(self):
+        """Free this process's slot"""
+        if self.slot is None:
+            return
+        if self._words[self.slot * SEQ_WORDS + 1] != self._pid:
+            # Another process took over the slot
+            self.slot = None
+            return
+        self._seq += 1
+        self._words[self.slot * SEQ_WORDS] = self._seq
+        SLOT.pack_into(self._table, self.slot * SLOT.size, self._seq, 0, 0, 0, 0, 0, 0.0, b"")
+        self._seq += 1
+        self._words[self.slot * SEQ_WORDS] = self._seq
+        self.slot = None
+
+    # Reader side
+
+    def read(self, retries=100):
+        """Consistent (slot, pid, wins, rounds, attempts, hints, updated, player) for every claimed slot
+
+        A slot still mid-write after retries re-reads (its writer died or was suspended during
+        an update) is left out of this read.
+        """
+        words = self._words
+        snapshot = bytes(self._table)
+        rows = []
+        for index, row in enumerate(SLOT.iter_unpack(snapshot)):
+            if not row[1]:
+                continue
+            seq = row[0]
+            # A slot is consistent when no write was in progress and none started since the copy
+            for _ in range(retries):
+                if not seq & 1 and words[index * SEQ_WORDS] == seq:
+                    break
+                row = SLOT.unpack_from(self._table, index * SLOT.size)
+                seq = row[0]
+            else:
+                continue
+            if row[1]:
+                rows.append((index,) + row[1:7] + (row[7].rstrip(b"\0").decode("utf-8", "ignore"),))
+        return rows
+
+    def totals(self):
+        """Combined score of every process on the board"""
+        players = wins = rounds = attempts = hints = 0
+        for _, _, slot_wins, slot_rounds, slot_attempts, slot_hints, _, _ in self.read():
+            players += 1
+            wins += slot_wins
+            rounds += slot_rounds
+            attempts += slot_attempts
+            hints += slot_hints
+        return {
+            "players": players,
+            "wins": wins,
+            "rounds": rounds,
+            "attempts": attempts,
+            "hints": hints,
+            "win_rate": wins / rounds if rounds else 0.0,
+            "attempts_per_round": attempts / rounds if rounds else 0.0,
+        }
+
+    def close(self):
+        """Free the slot and detach; the table stays for the other processes"""
+        self.leave()
+        self._words.release()
+        self._table.release()
+        self._segment.close()
+
+    def unlink(self):
+        """Remove the table from the system once every process has closed it"""
+        if os.name == "posix" and sys.version_info < (3, 13):
+            # unlink() unregisters the segment, which _open_segment already did
+            resource_tracker.register(self._segment._name, "shared_memory")
+        self._segment.unlink()
+
+
+def print_board(scoreboard):
+    """Print every process's row and the combined score"""
+    started = time.perf_counter()
+    rows = scoreboard.read()
+    totals = scoreboard.totals()
+    elapsed = time.perf_counter() - started
+
+    now = time.time()
+    print(f"{'Player':<16} {'PID':>7} {'Wins':>6} {'Rounds':>7} {'Win %':>7} {'Att/round':>9} {'Hints':>6} {'Idle':>6}")
+    for _, pid, wins, rounds, attempts, hints, updated, player in sorted(rows, key=lambda row: -row[2]):
+        win_rate = wins / rounds * 100 if rounds else 0.0
+        per_round = attempts / rounds if rounds else 0.0
+        print(f"{player[:16]:<16} {pid:>7} {wins:>6} {rounds:>7} {win_rate:>6.1f}% {per_round:>9.2f} "
+              f"{hints:>6} {now - updated:>5.0f}s")
+    print(f"🏆 {totals['players']} players, {totals['wins']}/{totals['rounds']} rounds won "
+          f"({totals['win_rate']:.1%}), {totals['attempts_per_round']:.2f} attempts per round "
+          f"- read in {elapsed * 1e6:.0f} µs")
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Show the combined scoreboard of local game processes")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="Shared memory name of the scoreboard")
+    parser.add_argument("--watch", type=float, default=None, metavar="SECONDS",
+                        help="Refresh every SECONDS until interrupted")
+    parser.add_argument("--unlink", action="store_true",
+                        help="Remove the scoreboard from shared memory and exit")
+    args = parser.parse_args()
+
+    if sys.stdout.encoding and sys.stdout.encoding.lower() != "utf-8":
+        sys.stdout.reconfigure(encoding="utf-8")
+    scoreboard = Scoreboard(args.name)
+    try:
+        if args.unlink:
+            scoreboard.unlink()
+            print(f"🗑️ Removed scoreboard {args.name!r}")
+            return
+        while True:
+            print_board(scoreboard)
+            if args.watch is None:
+                break
+            time.sleep(args.watch)
+            print()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scoreboard.close()
+
+
+if __name__ == "__main__":
+    main()
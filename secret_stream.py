@@ -0,0 +1,70 @@
+"""
+Seeded secret number generation for game sessions
+Each session owns its own random stream so rounds can be reproduced from the seed
+"""
+
+import random
+
+
+class SecretNumberStream:
+    """Per-session stream of secret numbers backed by a seeded random.Random"""
+
+    def __init__(self, low=0, high=100, seed=None):
+        if high < low:
+            raise ValueError("high must be greater than or equal to low")
+
+        # Pick a seed from the OS when none is given so it can still be reported
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+
+        self.low = low
+        self.high = high
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._span = high - low + 1
+        self._bits = max(1, (self._span - 1).bit_length())
+        self._buffer = []
+        self._position = 0
+        # Secrets handed out so far; a new stream with the same seed can skip to here
+        self.handed_out = 0
+
+    def prefetch(self, count):
+        """Draw the next count secrets up front using getrandbits rejection sampling"""
+        getrandbits = self._rng.getrandbits
+        span = self._span
+        bits = self._bits
+        low = self.low
+
+        # Drop numbers that were already handed out before extending the buffer
+        pending = self._buffer[self._position:]
+        needed = count - len(pending)
+
+        while needed > 0:
+            value = getrandbits(bits)
+            if value < span:
+                pending.append(low + value)
+                needed -= 1
+
+        self._buffer = pending
+        self._position = 0
+        return list(pending[:count])
+
+    def take(self, count):
+        """Return the next count secrets and mark them as handed out"""
+        secrets = self.prefetch(count)
+        self._position = count
+        self.handed_out += count
+        return secrets
+
+    def next_secret(self):
+        """Return the next secret, refilling the buffer when it runs out"""
+        if self._position >= len(self._buffer):
+            self.prefetch(1)
+        secret = self._buffer[self._position]
+        self._position += 1
+        self.handed_out += 1
+        return secret
+
+    def remaining(self):
+        """Number of prefetched secrets not handed out yet"""
+        return len(self._buffer) - self._position
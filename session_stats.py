@@ -0,0 +1,53 @@
+"""
+Session statistics behind the statistics panel
+Counts wins per number of attempts and losses, and tracks which chart bars changed since the
+last redraw, without depending on Tk.
+"""
+
+from rules import active_rules
+
+
+def performance_feedback(win_rate):
+    """Feedback line shown with the statistics"""
+    if win_rate >= 75:
+        return "🎉 Excellent performance!"
+    if win_rate >= 50:
+        return "👍 Good job!"
+    return "💪 Keep practicing!"
+
+
+class AttemptDistribution:
+    """Wins per number of attempts plus losses, with a chart ceiling that only grows by doubling"""
+
+    def __init__(self, max_attempts=None):
+        self.max_attempts = active_rules().attempts if max_attempts is None else max_attempts
+        self.reset()
+
+    def reset(self):
+        # Slots 0..max_attempts-1 are wins in 1..max_attempts guesses; the last slot is losses
+        self.counts = [0] * (self.max_attempts + 1)
+        self.ceiling = 4
+        self.changed = set(range(len(self.counts)))
+
+    @property
+    def wins(self):
+        return sum(self.counts[:-1])
+
+    @property
+    def rounds(self):
+        return sum(self.counts)
+
+    def record(self, won, attempts):
+        slot = min(max(attempts, 1), self.max_attempts) - 1 if won else self.max_attempts
+        self.counts[slot] += 1
+        self.changed.add(slot)
+        if self.counts[slot] > self.ceiling:
+            while self.counts[slot] > self.ceiling:
+                self.ceiling *= 2
+            # Every bar's height depends on the ceiling
+            self.changed = set(range(len(self.counts)))
+
+    def take_changes(self):
+        """Return the slots to redraw since the last call"""
+        changed, self.changed = self.changed, set()
+        return sorted(changed)
@@ -0,0 +1,217 @@
+"""
+Live spectator broadcast for hosted games
+Game events are serialized once and the same bytes are queued for every spectator connection.
+Each spectator has a bounded buffer; one that falls too far behind is disconnected so it can
+never stall the player. All socket work happens on one selector thread:
+
+    python game.py --spectate-port 9500
+    python spectators.py --port 9500
+"""
+
+import argparse
+import json
+import selectors
+import socket
+import threading
+from collections import deque
+
+DEFAULT_MAX_BUFFER = 256 * 1024
+
+# Event fields spectators never see: the session seed determines every secret number
+PRIVATE_FIELDS = frozenset({"seed"})
+
+
+def serialize_event(event):
+    """Encode an engine event as one JSON line, without its private fields"""
+    data = {"event": event.kind}
+    data.update((name, value) for name, value in vars(event).items() if name not in PRIVATE_FIELDS)
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class _Spectator:
+    __slots__ = ("sock", "pending", "buffered", "writing")
+
+    def __init__(self, sock):
+        self.sock = sock
+        # memoryviews of shared payloads; nothing is copied per spectator
+        self.pending = deque()
+        self.buffered = 0
+        self.writing = False
+
+
+class SpectatorHub:
+    """TCP fan-out of game events to any number of read-only spectators"""
+
+    def __init__(self, host="127.0.0.1", port=0, max_buffer=DEFAULT_MAX_BUFFER, send_buffer_size=None):
+        self.max_buffer = max_buffer
+        # Optional kernel send buffer per spectator; small values make max_buffer the real limit
+        self.send_buffer_size = send_buffer_size
+        self.dropped = 0
+        self.events_published = 0
+
+        self._server = socket.create_server((host, port), backlog=1024)
+        self._server.setblocking(False)
+        self.address = self._server.getsockname()
+
+        self._wake_receiver, self._wake_sender = socket.socketpair()
+        self._wake_receiver.setblocking(False)
+        self._wake_sender.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_receiver, selectors.EVENT_READ, "wake")
+
+        self._outbox = deque()
+        self._spectators = {}
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="spectator-hub", daemon=True)
+        self._thread.start()
+
+    @property
+    def spectator_count(self):
+        return len(self._spectators)
+
+    def attach(self, bus):
+        """Broadcast every event published on an event bus; returns the unsubscribe function"""
+        return bus.subscribe_all(self.publish)
+
+    def publish(self, event):
+        """Queue an event for every spectator without blocking the caller"""
+        self.publish_bytes(serialize_event(event))
+
+    def publish_bytes(self, payload):
+        self._outbox.append(payload)
+        self.events_published += 1
+        self._wake()
+
+    def close(self):
+        """Stop the hub thread and disconnect every spectator"""
+        self._running = False
+        self._wake()
+        self._thread.join(timeout=2)
+
+    def _wake(self):
+        try:
+            self._wake_sender.send(b"\0")
+        except (BlockingIOError, OSError):
+            # A full wake pipe already guarantees the hub thread will run
+            pass
+
+    def _run(self):
+        try:
+            while self._running:
+                for key, mask in self._selector.select(timeout=0.5):
+                    if key.data == "accept":
+                        self._accept()
+                    elif key.data == "wake":
+                        self._drain_wake()
+                    elif mask & selectors.EVENT_READ:
+                        self._check_closed(key.data)
+                    if isinstance(key.data, _Spectator) and mask & selectors.EVENT_WRITE \
+                            and key.data.sock in self._spectators:
+                        self._flush(key.data)
+                self._fan_out()
+        finally:
+            for spectator in list(self._spectators.values()):
+                self._drop(spectator, count=False)
+            self._selector.close()
+            self._server.close()
+            self._wake_receiver.close()
+            self._wake_sender.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, address = self._server.accept()
+            except (BlockingIOError, OSError):
+                return
+            sock.setblocking(False)
+            # Events are small and live; do not hold them back waiting for ACKs
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.send_buffer_size is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+            spectator = _Spectator(sock)
+            self._spectators[sock] = spectator
+            self._selector.register(sock, selectors.EVENT_READ, spectator)
+
+    def _drain_wake(self):
+        try:
+            while self._wake_receiver.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _check_closed(self, spectator):
+        # Spectators only listen; any read means data to discard or a closed connection
+        try:
+            if not spectator.sock.recv(4096):
+                self._drop(spectator, count=False)
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._drop(spectator, count=False)
+
+    def _fan_out(self):
+        while self._outbox:
+            payload = memoryview(self._outbox.popleft())
+            size = len(payload)
+            for spectator in list(self._spectators.values()):
+                if spectator.buffered + size > self.max_buffer:
+                    # Too far behind: disconnect rather than buffer without bound
+                    self._drop(spectator)
+                    continue
+                spectator.pending.append(payload)
+                spectator.buffered += size
+                if not spectator.writing:
+                    self._flush(spectator)
+
+    def _flush(self, spectator):
+        pending = spectator.pending
+        try:
+            while pending:
+                sent = spectator.sock.send(pending[0])
+                spectator.buffered -= sent
+                if sent < len(pending[0]):
+                    pending[0] = pending[0][sent:]
+                    break
+                pending.popleft()
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._drop(spectator, count=False)
+            return
+
+        # Only watch for writability while something is waiting
+        writing = bool(pending)
+        if writing != spectator.writing:
+            spectator.writing = writing
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if writing else 0)
+            self._selector.modify(spectator.sock, events, spectator)
+
+    def _drop(self, spectator, count=True):
+        if self._spectators.pop(spectator.sock, None) is None:
+            return
+        if count:
+            self.dropped += 1
+        try:
+            self._selector.unregister(spectator.sock)
+        except (KeyError, ValueError):
+            pass
+        spectator.sock.close()
+        spectator.pending.clear()
+
+
+def main():
+    """Watch a hosted game from the command line"""
+    parser = argparse.ArgumentParser(description="Watch a hosted Number Guessing Game")
+    parser.add_argument("--host", default="127.0.0.1", help="Host running game.py --spectate-port")
+    parser.add_argument("--port", type=int, required=True, help="Spectator port")
+    args = parser.parse_args()
+
+    with socket.create_connection((args.host, args.port)) as sock:
+        for line in sock.makefile("r", encoding="utf-8"):
+            print(line, end="", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Opt-in watchdog for Tk main-loop stalls
+A heartbeat scheduled with root.after records how late each beat runs. A helper thread checks
+the time since the last beat and, when the main loop has been stuck longer than the threshold,
+samples the main thread's stack and reports it with the handler that was running:
+
+    python game.py --watchdog 0.5
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+
+# Tk dialog modules whose frames identify a blocking dialog
+DIALOG_MODULES = ("messagebox", "filedialog", "simpledialog", "commondialog", "ctk_input_dialog")
+
+# Frames in tkinter/__init__.py where the stack leaves Tk and enters a callback
+TK_DISPATCH_NAMES = ("__call__", "mainloop")
+
+
+def _is_tk_dispatch(code):
+    """Tkinter's mainloop, or the wrapper through which Tk calls every Python callback"""
+    return (code.co_name in TK_DISPATCH_NAMES
+            and code.co_filename.endswith(os.path.join("tkinter", "__init__.py")))
+
+
+def describe_handler(frame, app_files):
+    """Name the handler behind a main-thread frame
+
+    A dialog anywhere in the callback wins (e.g. "messagebox.showinfo"); otherwise it is the
+    outermost frame from one of app_files below Tk's callback dispatch (e.g. "make_guess"),
+    not the module code that started the main loop.
+    """
+    handler = None
+    dialog = None
+    while frame is not None:
+        code = frame.f_code
+        if _is_tk_dispatch(code):
+            break
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        # Keep walking outwards: the outermost dialog frame is the public call
+        if module in DIALOG_MODULES:
+            dialog = f"{module}.{code.co_name}"
+        if os.path.abspath(code.co_filename) in app_files:
+            handler = code.co_name
+        frame = frame.f_back
+    return dialog or handler or "unknown"
+
+
+class StallWatchdog:
+    """Heartbeat through root.after plus a helper thread that samples stalls"""
+
+    def __init__(self, root, threshold=0.5, interval=0.1, on_stall=None, app_files=None,
+                 clock=time.monotonic):
+        self.root = root
+        self.threshold = threshold
+        self.interval = interval
+        self.on_stall = on_stall
+        self.app_files = {os.path.abspath(path) for path in (app_files or ())}
+        self.clock = clock
+
+        # The watchdog must be created on the thread that runs the Tk main loop
+        self.main_thread_id = threading.get_ident()
+        self.last_beat = clock()
+        self.max_drift = 0.0
+        self.beats = 0
+        self.stalls = []
+        self._reported_beat = None
+        self._job = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.last_beat = self.clock()
+        self._job = self.root.after(int(self.interval * 1000), self._beat)
+        self._thread = threading.Thread(target=self._monitor, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                # The window may already be destroyed
+                pass
+            self._job = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def _beat(self):
+        """Runs on the Tk thread; measures how late this beat is"""
+        now = self.clock()
+        drift = now - self.last_beat - self.interval
+        if drift > self.max_drift:
+            self.max_drift = drift
+        self.last_beat = now
+        self.beats += 1
+        if not self._stop.is_set():
+            self._job = self.root.after(int(self.interval * 1000), self._beat)
+
+    def _monitor(self):
+        """Runs on the helper thread; samples the main thread once per stall"""
+        while not self._stop.wait(self.interval / 2):
+            beat = self.beats
+            stalled = self.clock() - self.last_beat
+            if stalled <= self.threshold or beat == self._reported_beat:
+                continue
+            self._reported_beat = beat
+            self.report(stalled)
+
+    def report(self, stalled):
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return
+        handler = describe_handler(frame, self.app_files)
+        stack = "".join(traceback.format_stack(frame))
+        del frame
+        self.stalls.append((stalled, handler))
+        if self.on_stall is not None:
+            self.on_stall(stalled, handler, stack)
@@ -0,0 +1,111 @@
+"""
+Non-modal statistics panel for the main window
+Round results are counted as they arrive, but the panel redraws at most a few times per second.
+The attempts chart is drawn once on a Canvas; later redraws only move the bars that changed,
+and every bar is rescaled only when the chart's ceiling has to grow.
+"""
+
+import time
+
+import customtkinter as ctk
+
+from session_stats import AttemptDistribution, performance_feedback
+
+# Minimum seconds between two redraws of the panel
+REDRAW_INTERVAL = 0.25
+
+CHART_WIDTH = 360
+CHART_HEIGHT = 110
+CHART_LABEL_HEIGHT = 18
+BAR_GAP = 6
+
+
+class StatsPanel:
+    """Session statistics and attempts chart embedded in the main window"""
+
+    def __init__(self, root, parent, min_interval=REDRAW_INTERVAL, max_attempts=None):
+        self.root = root
+        self.min_interval = min_interval
+        self.distribution = AttemptDistribution(max_attempts)
+        self.total_rounds = 1
+        self.session_over = False
+        self._job = None
+        self._last_draw = 0.0
+        self.redraws = 0
+
+        self.frame = ctk.CTkFrame(parent)
+        self.summary_label = ctk.CTkLabel(self.frame, text="", justify="left",
+                                          font=ctk.CTkFont(size=14, weight="bold"))
+        self.summary_label.pack(side="left", padx=15, pady=10)
+
+        self.canvas = ctk.CTkCanvas(self.frame, width=CHART_WIDTH, height=CHART_HEIGHT,
+                                    bg="#1e1e1e", highlightthickness=0)
+        self.canvas.pack(side="right", padx=15, pady=10)
+        self._create_chart()
+        self._draw()
+
+    def _create_chart(self):
+        """Create every bar, count and label once; redraws only move them"""
+        slots = len(self.distribution.counts)
+        self.slot_width = (CHART_WIDTH - BAR_GAP) / slots
+        self.bars = []
+        self.count_texts = []
+        base = CHART_HEIGHT - CHART_LABEL_HEIGHT
+        for slot in range(slots):
+            left = BAR_GAP + slot * self.slot_width
+            right = left + self.slot_width - BAR_GAP
+            color = "#F44336" if slot == slots - 1 else "#4CAF50"
+            self.bars.append(self.canvas.create_rectangle(left, base, right, base, fill=color, width=0))
+            self.count_texts.append(self.canvas.create_text((left + right) / 2, base - 8, text="",
+                                                            fill="#ffffff", font=("TkDefaultFont", 9)))
+            label = "✗" if slot == slots - 1 else str(slot + 1)
+            self.canvas.create_text((left + right) / 2, CHART_HEIGHT - CHART_LABEL_HEIGHT / 2,
+                                    text=label, fill="#aaaaaa", font=("TkDefaultFont", 9))
+
+    def start_session(self, total_rounds):
+        self.distribution.reset()
+        self.total_rounds = total_rounds
+        self.session_over = False
+        self.request_redraw()
+
+    def record_round(self, won, attempts):
+        self.distribution.record(won, attempts)
+        self.request_redraw()
+
+    def end_session(self):
+        self.session_over = True
+        self.request_redraw()
+
+    def request_redraw(self):
+        """Redraw now-ish, but never more often than min_interval"""
+        if self._job is not None:
+            return
+        wait = self.min_interval - (time.monotonic() - self._last_draw)
+        self._job = self.root.after(max(0, int(wait * 1000)), self._draw)
+
+    def _draw(self):
+        self._job = None
+        self._last_draw = time.monotonic()
+        self.redraws += 1
+
+        distribution = self.distribution
+        rounds = distribution.rounds
+        win_rate = distribution.wins / rounds * 100 if rounds else 0
+        lines = [
+            "🏆 Game Statistics",
+            f"Wins: {distribution.wins}   Rounds: {rounds} of {self.total_rounds}",
+            f"Win Rate: {win_rate:.1f}%",
+        ]
+        if rounds:
+            lines.append(("🏁 Session complete! " if self.session_over else "") + performance_feedback(win_rate))
+        self.summary_label.configure(text="\n".join(lines))
+
+        base = CHART_HEIGHT - CHART_LABEL_HEIGHT
+        usable = base - 16
+        for slot in distribution.take_changes():
+            count = distribution.counts[slot]
+            top = base - usable * count / distribution.ceiling
+            left = BAR_GAP + slot * self.slot_width
+            self.canvas.coords(self.bars[slot], left, top, left + self.slot_width - BAR_GAP, base)
+            self.canvas.coords(self.count_texts[slot], left + (self.slot_width - BAR_GAP) / 2, top - 8)
+            self.canvas.itemconfigure(self.count_texts[slot], text=str(count) if count else "")
@@ -0,0 +1,132 @@
+"""
+Closed-form analysis of the Strategy Tip midpoint policy
+The midpoint search tree for a range depends only on the range size, and each level of the
+tree holds at most two distinct subtree sizes, so the attempt distribution for every secret
+can be counted from O(log n) memoized subtrees instead of simulating each secret:
+
+    python strategy_analysis.py --attempts 7 10 20 --hints 0 1 2 3
+"""
+
+import argparse
+import time
+from functools import lru_cache
+
+from rules import active_rules
+
+DEFAULT_RANGES = (10, 101, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8, 10 ** 9)
+
+
+@lru_cache(maxsize=None)
+def attempt_distribution(size):
+    """Tuple whose i-th entry counts secrets found on attempt i + 1 by midpoint search"""
+    if size <= 0:
+        return ()
+
+    # The guess (low + high) // 2 leaves (size - 1) // 2 numbers below and size // 2 above
+    below = attempt_distribution((size - 1) // 2)
+    above = attempt_distribution(size // 2)
+    depth = max(len(below), len(above))
+    combined = [0] * depth
+    for index, count in enumerate(below):
+        combined[index] += count
+    for index, count in enumerate(above):
+        combined[index] += count
+    return (1,) + tuple(combined)
+
+
+def wins_within(size, attempts):
+    """Number of secrets in a range of this size found within the attempt limit"""
+    return sum(attempt_distribution(size)[:attempts])
+
+
+def hint_buckets(size, hints, rules=None):
+    """Sizes of the ranges the deepest of the given number of hints can leave
+
+    Hints are nested, so using h hints narrows the secret to one of 2**h buckets.
+    The game's own range uses the rules' hint table; other sizes split evenly.
+    """
+    if hints <= 0:
+        return [size]
+
+    rules = rules or active_rules()
+    level = min(hints, len(rules.hint_cuts)) - 1
+    if size == rules.high - rules.low + 1:
+        cuts = [cut - rules.low for cut in rules.hint_cuts[level]]
+    else:
+        parts = 2 ** (level + 1)
+        cuts = sorted({(size * index * 2 + parts) // (parts * 2) for index in range(1, parts)})
+        cuts = [cut for cut in cuts if 0 < cut < size]
+
+    bounds = [0] + cuts + [size]
+    return [high - low for low, high in zip(bounds, bounds[1:]) if high > low]
+
+
+def win_probability(size, attempts, hints=0, rules=None):
+    """Chance that midpoint search wins when every secret is equally likely"""
+    wins = sum(wins_within(bucket, attempts) for bucket in hint_buckets(size, hints, rules))
+    return wins / size
+
+
+def mean_attempts(size, attempts=None, hints=0, rules=None):
+    """Average number of guesses midpoint search uses per round
+
+    A secret not found within the attempt limit uses every attempt, as a lost round does;
+    without a limit every secret is found.
+    """
+    guesses = 0
+    for bucket in hint_buckets(size, hints, rules):
+        distribution = attempt_distribution(bucket)
+        found = distribution if attempts is None else distribution[:attempts]
+        guesses += sum((index + 1) * count for index, count in enumerate(found))
+        guesses += (bucket - sum(found)) * (attempts or 0)
+    return guesses / size
+
+
+def analyze(ranges=DEFAULT_RANGES, attempts=(7,), hints=(0, 1, 2, 3)):
+    """Return one row per (range, attempts, hints) configuration"""
+    rows = []
+    for size in ranges:
+        for attempt_limit in attempts:
+            for hint_count in hints:
+                deepest = max(len(attempt_distribution(bucket)) for bucket in hint_buckets(size, hint_count))
+                rows.append({
+                    "range": size,
+                    "attempts": attempt_limit,
+                    "hints": hint_count,
+                    "win_probability": win_probability(size, attempt_limit, hint_count),
+                    "worst_case": min(deepest, attempt_limit),
+                    "mean_attempts": mean_attempts(size, attempt_limit, hint_count),
+                })
+    return rows
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Win probability of the midpoint strategy")
+    parser.add_argument("--ranges", type=int, nargs="+", default=list(DEFAULT_RANGES),
+                        help="Range sizes (number of possible secrets)")
+    parser.add_argument("--attempts", type=int, nargs="+", default=[7], help="Attempt limits")
+    parser.add_argument("--hints", type=int, nargs="+", default=[0, 1, 2, 3], help="Hints spent up front")
+    parser.add_argument("--distribution", action="store_true",
+                        help="Also print how many secrets need each number of attempts")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = analyze(args.ranges, args.attempts, args.hints)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{'Range':>12} {'Attempts':>9} {'Hints':>6} {'Win %':>9} {'Worst':>6} {'Mean':>7}")
+    for row in rows:
+        print(f"{row['range']:>12} {row['attempts']:>9} {row['hints']:>6} "
+              f"{row['win_probability'] * 100:>8.3f}% {row['worst_case']:>6} {row['mean_attempts']:>7.3f}")
+
+    if args.distribution:
+        for size in args.ranges:
+            counts = ", ".join(f"{index + 1}:{count}" for index, count in enumerate(attempt_distribution(size)))
+            print(f"\n{size}: {counts}")
+
+    print(f"\n⏱️ {len(rows)} configurations computed in {elapsed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
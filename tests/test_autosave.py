@@ -0,0 +1,189 @@
+"""
+Tests for the session autosave and resume
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autosave import (HEADER, AutosaveError, Autosaver, pack_session, restore_session,
+                      resume_session, unpack_session)
+from engine import GameSession
+from round_history import RoundHistory
+from rules import Rules
+from secret_stream import SecretNumberStream
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+def play_some(session):
+    """Win one round, lose one, then guess and hint in the third"""
+    session.make_guess(session.round.secret_number)
+    session.start_round()
+    secret = session.round.secret_number
+    for _ in range(7):
+        session.make_guess(100 if secret != 100 else 0)
+    session.start_round()
+    session.get_hint()
+    session.make_guess(50 if session.round.secret_number != 50 else 49)
+
+
+def round_state(game_round):
+    return (game_round.secret_number, game_round.low, game_round.high, game_round.attempts_left,
+            game_round.hints_left, game_round.hint_level, game_round.active, game_round.won,
+            game_round.min_possible, game_round.max_possible, game_round.previous_guesses,
+            game_round.hint_range)
+
+
+@pytest.fixture
+def session():
+    session = GameSession(seed=1234)
+    # Tiny slabs so the history spans several of them
+    session.history = RoundHistory(slab_size=4)
+    session.new_session(5)
+    play_some(session)
+    return session
+
+
+class TestSnapshot:
+    """Test cases for packing and restoring a session"""
+
+    def test_round_trip(self, session):
+        """A restored session has the same state and plays on identically"""
+        resumed = GameSession(seed=99)
+        resumed.history = RoundHistory(slab_size=4)
+        restore_session(resumed, unpack_session(pack_session(session)))
+
+        assert round_state(resumed.round) == round_state(session.round)
+        assert (resumed.current_round, resumed.total_rounds, resumed.wins, resumed.session_attempts) == \
+            (session.current_round, session.total_rounds, session.wins, session.session_attempts)
+        assert resumed.secret_stream.seed == resumed.seed == 1234
+        assert list(resumed.history) == list(session.history)
+        assert [resumed.history.round(i) for i in range(2)] == [session.history.round(i) for i in range(2)]
+
+        for game in (session, resumed):
+            game.make_guess(game.round.secret_number)
+            game.start_round()
+        assert resumed.round.secret_number == session.round.secret_number
+
+    def test_snapshot_between_rounds(self, session):
+        """A save taken after a round ended resumes into the same next round"""
+        session.make_guess(session.round.secret_number)
+        resumed = GameSession()
+        restore_session(resumed, unpack_session(pack_session(session)))
+        assert not resumed.round.active
+        session.start_round()
+        resumed.start_round()
+        assert resumed.round.secret_number == session.round.secret_number
+        assert resumed.current_round == session.current_round == 4
+
+    def test_unseeded_session_stays_unseeded(self):
+        """A resumed session plays its saved stream, and later sessions still get fresh seeds"""
+        session = GameSession()
+        session.new_session(3)
+        session.make_guess(session.round.secret_number)
+        session.start_round()
+        resumed = GameSession(seed=99)
+        restore_session(resumed, unpack_session(pack_session(session)))
+        assert resumed.seed is None
+        assert resumed.secret_stream.seed == session.secret_stream.seed
+        assert resumed.round.secret_number == session.round.secret_number
+
+    def test_secret_is_not_stored(self, session):
+        """The round in progress gets its secret back from the seed, not from the file"""
+        state = unpack_session(pack_session(session))
+        state["seed"] = 777
+        resumed = GameSession()
+        restore_session(resumed, state)
+        expected = SecretNumberStream(0, 100, 777).take(state["handed_out"])[-1]
+        assert resumed.round.secret_number == expected
+
+    def test_finished_session_has_nothing_to_save(self):
+        """Once the last round ends the save is removed"""
+        session = GameSession(seed=3)
+        assert pack_session(session) is None
+        session.new_session(1)
+        assert pack_session(session) is not None
+        session.make_guess(session.round.secret_number)
+        assert pack_session(session) is None
+
+    def test_snapshot_is_compact(self, session):
+        """Fixed-size records plus a few bytes per guess"""
+        data = pack_session(session)
+        assert len(data) < 200
+
+    def test_damaged_snapshots_are_rejected(self, session):
+        """Corruption, truncation, other files and other rules never resume"""
+        data = pack_session(session)
+        flipped = bytearray(data)
+        flipped[HEADER.size + 20] ^= 0xFF
+        for bad in (bytes(flipped), data[:-3], data[:5], b"NOPE" + data[4:]):
+            with pytest.raises(AutosaveError):
+                unpack_session(bad)
+
+        other_rules = GameSession(rules=Rules({"attempts": 10}))
+        with pytest.raises(AutosaveError):
+            restore_session(other_rules, unpack_session(data))
+
+
+class TestAutosaver:
+    """Test cases for the background writer"""
+
+    def test_writes_are_coalesced(self, tmp_path):
+        """Snapshots submitted within one interval collapse into the newest"""
+        path = str(tmp_path / "save.dat")
+        saver = Autosaver(path, interval=60)
+        saver.submit(b"first")
+        wait_for(lambda: saver.writes == 1)
+        for data in (b"second", b"third", b"fourth"):
+            saver.submit(data)
+        time.sleep(0.05)
+        assert saver.writes == 1
+        saver.close()
+        assert (saver.writes, saver.coalesced) == (2, 2)
+        with open(path, "rb") as handle:
+            assert handle.read() == b"fourth"
+        assert not os.path.exists(path + ".tmp")
+
+    def test_none_removes_the_save(self, tmp_path):
+        """A finished session leaves no file to resume"""
+        path = str(tmp_path / "save.dat")
+        saver = Autosaver(path, interval=0)
+        saver.submit(b"data")
+        wait_for(lambda: os.path.exists(path))
+        saver.submit(None)
+        saver.close()
+        assert not os.path.exists(path)
+
+    def test_resume_from_disk(self, tmp_path, session):
+        """resume_session reads what the autosaver wrote"""
+        path = str(tmp_path / "save.dat")
+        assert resume_session(GameSession(), path) is False
+        saver = Autosaver(path)
+        saver.submit(pack_session(session))
+        saver.close()
+
+        resumed = GameSession()
+        assert resume_session(resumed, path) is True
+        assert round_state(resumed.round) == round_state(session.round)
+
+    def test_write_errors_are_kept(self, tmp_path):
+        """A failed write is recorded instead of killing the writer"""
+        blocker = tmp_path / "blocker"
+        blocker.write_bytes(b"")
+        saver = Autosaver(str(blocker / "save.dat"), interval=0)
+        saver.submit(b"data")
+        saver.close()
+        assert isinstance(saver.last_error, OSError)
+        assert saver.writes == 0
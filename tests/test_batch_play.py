@@ -0,0 +1,115 @@
+"""
+Tests for the streaming batch-play mode
+"""
+
+import pytest
+import sys
+import os
+import io
+import json
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import MAX_ATTEMPTS, validate_guess
+from secret_stream import SecretNumberStream
+from batch_play import play, read_chunks, run_batch
+
+
+def lines_of(text, read_size=7):
+    """Every line read_chunks yields for the text, using tiny reads to cross chunk borders"""
+    return [line for chunk in read_chunks(io.StringIO(text, newline=""), read_size) for line in chunk]
+
+
+def results_of(text, seed=1):
+    """Parsed results of playing the text"""
+    return [json.loads(line) for chunk in play(read_chunks(io.StringIO(text)), seed) for line in chunk]
+
+
+class TestReadChunks:
+    """Test cases for splitting the input into lines"""
+
+    def test_lines_across_chunk_borders(self):
+        """Lines are reassembled across reads and line endings are removed"""
+        assert lines_of("12\r\n hint \n\n-5\nlast") == ["12", " hint ", "", "-5", "last"]
+
+    @pytest.mark.parametrize("line", [
+        " " * 5000 + "42" + " " * 5000,
+        "1" * 5000,
+        "1" * 2000 + ";" + "2" * 2000,
+        "7" + " " * 5000 + "8",
+        " " * 5000 + "4x2" + "\t" * 3000,
+        "x" * 10000,
+    ])
+    def test_overlong_lines_validate_like_the_full_line(self, line):
+        """Overlong lines are summarized without changing what validate_guess says about them"""
+        summarized = lines_of(line + "\n50\n", read_size=256)
+        assert len(summarized) == 2
+        assert len(summarized[0]) < 1000
+        assert validate_guess(summarized[0]) == validate_guess(line)
+        assert summarized[1] == "50"
+
+
+class TestPlay:
+    """Test cases for playing commands through the round rules"""
+
+    def test_binary_search_wins_the_seeded_round(self):
+        """Guesses are judged against the seeded secret numbers"""
+        secret = SecretNumberStream(seed=4).next_secret()
+        low, high, guesses = 0, 100, []
+        while True:
+            guess = (low + high) // 2
+            guesses.append(guess)
+            if guess == secret:
+                break
+            low, high = (guess + 1, high) if guess < secret else (low, guess - 1)
+
+        results = results_of("\n".join(str(guess) for guess in guesses), seed=4)
+        assert [result["guess"] for result in results] == guesses
+        assert results[-1]["result"] == "correct"
+        assert results[-1]["won"] is True
+        assert results[-1]["secret"] == secret
+
+    def test_rounds_advance_after_a_loss(self):
+        """A lost round reports its secret and the next command starts a new round"""
+        text = "\n".join(["101"] + ["-1"] + ["0"] * MAX_ATTEMPTS + ["0"])
+        results = results_of(text)
+
+        assert [result["result"] for result in results[:2]] == ["invalid", "invalid"]
+        last_of_round = results[1 + MAX_ATTEMPTS]
+        assert last_of_round["round"] == 1
+        assert last_of_round["attempts_left"] == 0
+        assert "secret" in last_of_round
+        assert results[-1]["round"] == 2
+
+    def test_hints_and_new_rounds(self):
+        """Hints are given until they run out, and "new" abandons the round"""
+        results = results_of("hint\nHINT\n hint\nhint\nnew\n50")
+
+        assert [result["result"] for result in results[:5]] == ["hint", "hint", "hint", "invalid", "abandoned"]
+        assert results[-1]["result"] in ("low", "high", "correct")
+        assert [result.get("hints_left") for result in results[:3]] == [2, 1, 0]
+        assert results[3]["error"] == "❌ No hints left!"
+        assert results[-1]["round"] == 2
+
+    def test_comments_and_blank_lines_are_skipped(self):
+        """Skipped lines still count for line numbers"""
+        results = results_of("# warm up\n\n50\n")
+        assert len(results) == 1
+        assert results[0]["line"] == 3
+
+    def test_errors_match_validate_guess(self):
+        """Rejected input reports the same error as the GUI"""
+        inputs = ["", "   ", "abc", "1<2", "12345678901", "4-2", "1000", "-5"]
+        results = results_of("\n".join(["# skip"] + inputs[1:]))
+        assert [result["error"] for result in results] == [validate_guess(text)[1] for text in inputs[1:]]
+
+    def test_run_batch_writes_json_lines(self, tmp_path):
+        """A command file is played and every output line is JSON"""
+        path = tmp_path / "commands.txt"
+        path.write_text("50\nhint\nabc\n", encoding="utf-8")
+        output = io.StringIO()
+
+        assert run_batch(str(path), seed=2, output=output) == 3
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [result["line"] for result in results] == [1, 2, 3]
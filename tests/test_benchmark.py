@@ -0,0 +1,147 @@
+"""
+Tests for the benchmark baseline comparison
+"""
+
+import pytest
+import sys
+import os
+import random
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameSession, validate_guess
+import benchmark
+from benchmark import (build_corpus, compare, corpus_digest, load_corpus, load_results,
+                       mann_whitney_greater, replay_session, run, save_corpus, save_results)
+
+
+def fake_results(samples, peak=1000, digest="abc"):
+    return {
+        "format": benchmark.RESULTS_FORMAT,
+        "label": "test",
+        "corpus": {"digest": digest},
+        "benchmarks": {"replay": {"samples": samples, "peak_bytes": peak, "checksum": 0}},
+    }
+
+
+class TestCorpus:
+    """Test cases for the seeded and recorded session corpus"""
+
+    def test_seeded_corpus_is_reproducible(self):
+        """The same seed always produces the same corpus"""
+        assert build_corpus(20, seed=3) == build_corpus(20, seed=3)
+        assert corpus_digest(build_corpus(20, seed=3)) != corpus_digest(build_corpus(20, seed=4))
+
+    def test_replay_finishes_every_session(self):
+        """Replaying a recorded session plays every round it recorded"""
+        for entry in build_corpus(30, seed=1):
+            wins, attempts = replay_session(entry)
+            guesses = sum(1 for command in entry["commands"] if validate_guess(command)[1] is None)
+            assert 0 <= wins <= entry["rounds"]
+            assert attempts == guesses
+
+    def test_replay_matches_direct_play(self):
+        """Replayed wins match a session driven directly with the same guesses"""
+        entry = build_corpus(1, seed=7)[0]
+        session = GameSession(seed=entry["seed"])
+        session.new_session(entry["rounds"])
+        for command in entry["commands"]:
+            if not session.game_active and len(session.history) < session.total_rounds:
+                session.start_round()
+            if validate_guess(command)[1] is None:
+                session.make_guess(int(command))
+            elif command == "hint":
+                session.get_hint()
+        assert replay_session(entry) == (session.wins, session.session_attempts)
+
+    def test_corpus_round_trip(self, tmp_path):
+        """A saved corpus loads back unchanged"""
+        corpus = build_corpus(5, seed=2)
+        path = tmp_path / "corpus.jsonl"
+        save_corpus(corpus, path)
+        assert load_corpus(path) == corpus
+
+
+class TestComparison:
+    """Test cases for the significance test and regression detection"""
+
+    def test_mann_whitney_detects_shift(self):
+        """A clear slowdown is significant, identical distributions are not"""
+        rng = random.Random(0)
+        baseline = [1.0 + rng.random() * 0.05 for _ in range(15)]
+        slower = [1.2 + rng.random() * 0.05 for _ in range(15)]
+        assert mann_whitney_greater(slower, baseline) < 0.001
+        assert mann_whitney_greater(baseline, slower) > 0.99
+        assert mann_whitney_greater([1.0] * 10, [1.0] * 10) == 1.0
+
+    def test_slowdown_beyond_tolerance_is_a_regression(self):
+        """Only significant slowdowns larger than the tolerance are flagged"""
+        baseline = fake_results([1.0 + index * 0.001 for index in range(15)])
+        slower = fake_results([1.2 + index * 0.001 for index in range(15)])
+        within = fake_results([1.02 + index * 0.001 for index in range(15)])
+
+        assert compare(baseline, slower, tolerance=0.05)[0]["slower"]
+        assert not compare(baseline, within, tolerance=0.05)[0]["slower"]
+        assert not compare(baseline, baseline, tolerance=0.05)[0]["slower"]
+
+    def test_same_code_is_not_a_regression(self):
+        """Two measurements of the same code, with the default settings, flag nothing"""
+        corpus = build_corpus(50, seed=0)
+        baseline = run(corpus, samples=5, label="before", processes=5)
+        current = run(corpus, samples=5, label="after", processes=5)
+        rows = compare(baseline, current)
+        assert [row["benchmark"] for row in rows] == list(benchmark.BENCHMARKS)
+        assert not any(row["slower"] for row in rows)
+
+    def test_memory_growth_is_a_regression(self):
+        """Peak memory beyond the memory tolerance is flagged"""
+        samples = [1.0] * 10
+        row = compare(fake_results(samples, 1000), fake_results(samples, 1200), memory_tolerance=0.1)[0]
+        assert row["bigger"]
+        assert not row["slower"]
+
+    def test_different_corpora_cannot_be_compared(self):
+        """Results from another corpus are rejected"""
+        with pytest.raises(ValueError):
+            compare(fake_results([1.0]), fake_results([1.0], digest="other"))
+
+    def test_results_round_trip(self, tmp_path):
+        """Measured results are saved and loaded with their format version"""
+        corpus = build_corpus(3, seed=0)
+        results = run(corpus, samples=3, label="v1", names=["validate"], processes=2)
+        path = tmp_path / "nested" / "v1.json"
+        save_results(results, str(path))
+
+        loaded = load_results(path)
+        assert loaded["label"] == "v1"
+        assert len(loaded["benchmarks"]["validate"]["samples"]) == 2
+        assert [len(runs) for runs in loaded["benchmarks"]["validate"]["runs"]] == [3, 3]
+        assert loaded["benchmarks"]["validate"]["peak_bytes"] >= 0
+        assert compare(loaded, results)[0]["benchmark"] == "validate"
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        """Results files from another format version are not compared"""
+        results = fake_results([1.0])
+        results["format"] = benchmark.RESULTS_FORMAT + 1
+        path = tmp_path / "future.json"
+        save_results(results, str(path))
+        with pytest.raises(ValueError):
+            load_results(path)
+
+    def test_cli_exits_non_zero_on_regression(self, tmp_path, monkeypatch, capsys):
+        """The command exits with 1 when the baseline was much faster"""
+        corpus = build_corpus(3, seed=0)
+        baseline = run(corpus, samples=3, label="fast", names=["validate"], processes=1)
+        baseline["benchmarks"]["validate"]["samples"] = [1e-9] * 6
+        baseline_path = tmp_path / "fast.json"
+        save_results(baseline, str(baseline_path))
+
+        monkeypatch.setattr(sys, "argv", [
+            "benchmark.py", "--sessions", "3", "--samples", "3", "--processes", "4", "--benchmarks", "validate",
+            "--baseline", str(baseline_path), "--output", str(tmp_path / "slow.json"),
+        ])
+        with pytest.raises(SystemExit) as exit_info:
+            benchmark.main()
+        assert exit_info.value.code == 1
+        assert "Regressions in: validate" in capsys.readouterr().out
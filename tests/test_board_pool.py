@@ -0,0 +1,96 @@
+"""
+Tests for the multi-board pool
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_pool import BoardPool, describe_event, measure
+from events import GuessEvaluated, RoundEnded
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBoardPool:
+    """Test cases for boards sharing one update loop"""
+
+    def test_boards_have_independent_rounds(self):
+        """A guess on one board leaves the others untouched"""
+        pool = BoardPool(3, seed=10)
+        for board_id in range(3):
+            pool.new_session(board_id, 2)
+        pool.drain()
+
+        pool.boards[1].engine.make_guess(50)
+        assert pool.drain() == {1}
+        assert pool.boards[1].engine.round.attempts_left == 6
+        assert pool.boards[0].engine.round.attempts_left == 7
+        assert pool.boards[1].messages[-1][1].startswith(("📈", "📉", "🔍", "🎉"))
+
+    def test_next_round_uses_shared_timer_heap(self):
+        """Rounds restart from the pool's tick, not from a timer per board"""
+        clock = FakeClock()
+        pool = BoardPool(2, seed=1, next_round_delay=3.0, clock=clock)
+        for board_id in range(2):
+            pool.new_session(board_id, 2)
+        pool.drain()
+
+        board = pool.boards[0]
+        board.engine.make_guess(board.engine.round.secret_number)
+        pool.tick()
+        assert len(pool.timers) == 1
+        assert not board.engine.game_active
+
+        clock.now = 2.9
+        assert pool.tick() == set()
+        clock.now = 3.0
+        assert pool.tick() == {0}
+        assert board.engine.game_active and board.engine.current_round == 2
+
+    def test_new_session_makes_pending_timer_stale(self):
+        """A timer scheduled before a new session does not start an extra round"""
+        clock = FakeClock()
+        pool = BoardPool(1, seed=1, clock=clock)
+        pool.new_session(0, 3)
+        board = pool.boards[0]
+        board.engine.make_guess(board.engine.round.secret_number)
+        pool.tick()
+
+        pool.new_session(0, 3)
+        pool.drain()
+        clock.now = 100
+        pool.tick()
+        assert board.engine.current_round == 1
+
+    def test_message_buffer_is_bounded(self):
+        """Each board keeps a fixed number of recent messages"""
+        pool = BoardPool(1, seed=2)
+        board = pool.boards[0]
+        for index in range(500):
+            board.add_message(str(index))
+        assert len(board.messages) == 200
+        assert board.total_messages == 500
+
+    def test_describe_event(self):
+        """Engine events become the same messages the single-board GUI shows"""
+        assert describe_event(GuessEvaluated(1, 40, "low", 5, 41, 100))[0][0] == "📈 40 is too low!"
+        lines = describe_event(RoundEnded(1, False, 42, 7, 0, True))
+        assert [kind for message, kind in lines] == ["loss", "info"]
+
+    def test_measure_fifty_boards(self):
+        """Fifty boards stay small and cheap to tick"""
+        report = measure(count=50, rounds=3)
+        assert report["boards"] == 50
+        assert report["bytes_per_board"] < 200 * 1024
+        assert report["tick_ms"] < 50
@@ -0,0 +1,119 @@
+"""
+Tests for the headless rules and the automated players
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameRound, generate_hint, hint_bounds, optimal_guess
+from bots import BinarySearchPlayer, RandomPlayer, StrategyTipPlayer, evaluate, play_round
+
+
+class TestEngine:
+    """Test cases for the headless round rules"""
+
+    def test_guess_feedback(self):
+        """Guesses narrow the possible range"""
+        game_round = GameRound(42)
+
+        assert game_round.guess(50) == "high"
+        assert game_round.max_possible == 49
+        assert game_round.guess(25) == "low"
+        assert game_round.min_possible == 26
+        assert game_round.guess(42) == "correct"
+        assert game_round.won
+        assert not game_round.active
+
+    def test_round_lost_after_attempts(self):
+        """The round ends after the last attempt"""
+        game_round = GameRound(100, attempts=2)
+        game_round.guess(0)
+        game_round.guess(1)
+
+        assert not game_round.active
+        assert not game_round.won
+        with pytest.raises(ValueError):
+            game_round.guess(2)
+
+    def test_out_of_range_guess(self):
+        """Out of range guesses are rejected without using an attempt"""
+        game_round = GameRound(10)
+        with pytest.raises(ValueError):
+            game_round.guess(101)
+        assert game_round.attempts_left == 7
+
+    def test_hint_bounds_match_hint_text(self):
+        """Structured hint buckets always contain the secret"""
+        for level in range(4):
+            for number in range(101):
+                low, high = hint_bounds(number, level)
+                assert low <= number <= high
+                assert str(low) in generate_hint(number, level) or level == 0
+
+    def test_hints_run_out(self):
+        """Hints can only be spent while some are left"""
+        game_round = GameRound(30, hints=1)
+        message, bounds = game_round.hint()
+
+        assert "less than 50" in message
+        assert bounds == (0, 49)
+        with pytest.raises(ValueError):
+            game_round.hint()
+
+    def test_optimal_guess_skips_previous(self):
+        """The strategy suggestion avoids numbers already guessed"""
+        assert optimal_guess(0, 100, []) == 50
+        assert optimal_guess(25, 75, [50, 62]) == 51
+
+
+class TestBots:
+    """Test cases for the reference bots and the evaluator"""
+
+    def test_binary_search_always_wins(self):
+        """Binary search finds every secret in 0-100 within 7 attempts"""
+        player = BinarySearchPlayer()
+        for secret in range(101):
+            assert play_round(player, secret).won
+
+    def test_strategy_player_always_wins(self):
+        """The Strategy Tip heuristic finds every secret"""
+        player = StrategyTipPlayer()
+        for secret in range(101):
+            assert play_round(player, secret).won
+
+    def test_strategy_player_uses_hints_when_short(self):
+        """The heuristic spends hints when attempts cannot cover the range"""
+        game_round = play_round(StrategyTipPlayer(), 77, attempts=4)
+        assert game_round.hints_left < 3
+
+    def test_random_player_finishes(self):
+        """The random player always ends the round"""
+        player = RandomPlayer(seed=1)
+        for secret in (0, 50, 100):
+            assert not play_round(player, secret).active
+
+    def test_evaluate_report(self):
+        """The evaluator reports win rate, attempts and throughput"""
+        report = evaluate("binary", rounds=2000, seed=3, workers=1)
+
+        assert report["rounds"] == 2000
+        assert report["win_rate"] == 100.0
+        assert 1 <= report["mean_attempts"] <= 7
+        assert report["rounds_per_sec"] > 0
+
+    def test_evaluate_is_deterministic_across_workers(self):
+        """Results depend on the seed, not on how chunks are scheduled"""
+        serial = evaluate("random", rounds=3000, seed=5, workers=1, chunk_size=1000)
+        parallel = evaluate("random", rounds=3000, seed=5, workers=2, chunk_size=1000)
+
+        assert serial["win_rate"] == parallel["win_rate"]
+        assert serial["mean_attempts"] == parallel["mean_attempts"]
+
+    def test_unknown_bot(self):
+        """Unknown bot names are rejected"""
+        with pytest.raises(ValueError):
+            evaluate("oracle", rounds=10)
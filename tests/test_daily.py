@@ -0,0 +1,195 @@
+"""
+Tests for the daily challenge, its solution cache and streaks
+"""
+
+import pytest
+import sys
+import os
+from datetime import date, timedelta
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from daily import (DailyPlay, DailyResults, SolutionCache, compare, daily_secret, daily_seed, solve,
+                   strategy_path)
+from engine import GameRound, GameSession
+from events import EventBus, RoundEnded
+from rules import DEFAULT_RULES, Rules
+
+DAY = date(2026, 10, 19)
+
+
+class TestDailySecret:
+    """Test cases for the date-derived secret and its solution"""
+
+    def test_same_day_same_secret(self):
+        """The seed depends only on the date, and a seeded session starts on the day's secret"""
+        assert daily_seed(DAY) == daily_seed(date(2026, 10, 19))
+        assert daily_seed(DAY) != daily_seed(DAY + timedelta(days=1))
+        session = GameSession(seed=daily_seed(DAY))
+        session.new_session(1)
+        assert session.round.secret_number == daily_secret(DAY)
+
+    def test_solution_is_the_best_strategy_path(self):
+        """The solution replays as a winning round and no hint count does better"""
+        for offset in range(60):
+            day = DAY + timedelta(days=offset)
+            solution = solve(day)
+            game_round = GameRound(solution.secret)
+            for _ in range(solution.hints):
+                game_round.hint()
+            low, high = game_round.hint_range
+            assert list(solution.guesses) == strategy_path(solution.secret, low, high)
+            results = [game_round.guess(guess) for guess in solution.guesses]
+            assert results[-1] == "correct" and solution.attempts == len(solution.guesses)
+
+            for hints in range(DEFAULT_RULES.hints + 1):
+                low, high = DEFAULT_RULES.hint_bounds(solution.secret, hints - 1) if hints else (0, 100)
+                assert len(strategy_path(solution.secret, low, high)) >= solution.attempts
+
+    def test_hint_messages(self):
+        """The hint path is the hints a player would see"""
+        solution = solve(DAY)
+        assert solution.hint_messages() == [DEFAULT_RULES.hint_message(solution.secret, level)
+                                            for level in range(solution.hints)]
+
+    def test_compare(self):
+        """Results are phrased against the midpoint solution's attempt count"""
+        solution = solve(DAY)
+        assert compare(solution, True, solution.attempts + 1).startswith(
+            f"📅 You took {solution.attempts + 1}, the midpoint solution took {solution.attempts} (")
+        assert compare(solution, True, solution.attempts).endswith("perfect!")
+        assert f"needed {solution.attempts}" in compare(solution, False, 7)
+
+
+def repeat_day():
+    """A day whose session draws the daily number again within its first ten rounds"""
+    day = date(2026, 1, 1)
+    while True:
+        secrets = GameSession(seed=daily_seed(day)).secret_stream.take(10)
+        if secrets[0] in secrets[1:]:
+            return day
+        day += timedelta(days=1)
+
+
+class TestDailyPlay:
+    """Test cases for picking the scored round of a daily game"""
+
+    def play(self, day, restart_first_round=False):
+        """Play ten rounds from the daily seed, winning every round, and score them"""
+        bus = EventBus()
+        session = GameSession(bus, seed=daily_seed(day))
+        daily = DailyPlay(day, solve(day), DailyResults())
+        scored = []
+        bus.subscribe(RoundEnded, lambda event: daily.is_daily_round(event) and scored.append(
+            (event.round_number, daily.finish(event))))
+        session.new_session(10)
+        if restart_first_round:
+            session.start_round()
+        for round_number in range(10):
+            session.make_guess(session.round.secret_number)
+            if round_number < 9:
+                session.start_round()
+        return daily, scored
+
+    def test_only_the_first_round_counts(self):
+        """A later round that draws the same number is not the challenge"""
+        day = repeat_day()
+        daily, scored = self.play(day)
+        assert scored == [(1, True)]
+        assert daily.results.result(day) == (True, 1, 0)
+
+    def test_restarted_first_round_is_not_scored(self):
+        """Without a finished first round, nothing is recorded for the day"""
+        day = repeat_day()
+        daily, scored = self.play(day, restart_first_round=True)
+        assert scored == []
+        assert daily.results.result(day) is None
+
+
+class TestSolutionCache:
+    """Test cases for the on-disk solution cache"""
+
+    def test_round_trip(self, tmp_path):
+        """Saved solutions come back without being solved again"""
+        path = str(tmp_path / "solutions.dat")
+        cache = SolutionCache()
+        assert cache.precompute(DAY, 30) == 30
+        assert cache.precompute(DAY, 31) == 1
+        cache.save(path)
+        assert not cache.changed
+
+        loaded = SolutionCache.load(path)
+        assert len(loaded) == 31
+        for offset in range(31):
+            day = DAY + timedelta(days=offset)
+            assert loaded.get(day) == cache.get(day)
+        assert not loaded.changed
+        assert loaded.to_bytes() == cache.to_bytes()
+
+    def test_rules_get_their_own_solutions(self):
+        """A different profile is solved separately"""
+        narrow = Rules({"min_number": 1, "max_number": 10,
+                        "hint_levels": [{"cuts": [6], "message": "{low}-{high}"}]})
+        cache = SolutionCache()
+        solution = cache.get(DAY, narrow)
+        assert 1 <= solution.secret <= 10 and solution.hints <= 1
+        assert cache.get(DAY) == solve(DAY)
+        assert len(cache) == 2
+
+    def test_unreadable_file(self, tmp_path):
+        """A damaged cache is just empty"""
+        path = tmp_path / "solutions.dat"
+        path.write_bytes(b"junk")
+        assert len(SolutionCache.load(str(path))) == 0
+
+
+class TestDailyResults:
+    """Test cases for results and streaks"""
+
+    def play(self, results, first_day, outcomes):
+        for offset, won in enumerate(outcomes):
+            if won is not None:
+                results.record(first_day + timedelta(days=offset), won, 4, 1)
+
+    def test_first_play_counts(self):
+        """Only the first result of a day is kept"""
+        results = DailyResults()
+        assert results.result(DAY) is None
+        assert results.record(DAY, True, 5, 2)
+        assert not results.record(DAY, False, 7, 0)
+        assert results.result(DAY) == (True, 5, 2)
+
+    @pytest.mark.parametrize("outcomes, today_offset, current, best", [
+        ([True, True, False, True, True, True], 5, 3, 3),
+        ([True, True, False, True, True, True], 6, 3, 3),
+        ([True, True, False, True, True, True], 7, 0, 3),
+        ([True, True, True, None, True], 4, 1, 3),
+        ([True, True, True, True, False], 4, 0, 4),
+        ([True], -1, 0, 1),
+    ])
+    def test_streaks(self, outcomes, today_offset, current, best):
+        """Streaks count days won in a row; today still counts as open until it is played"""
+        results = DailyResults()
+        self.play(results, DAY, outcomes)
+        today = DAY + timedelta(days=today_offset)
+        assert results.current_streak(today) == current
+        assert results.best_streak() == best
+
+    def test_years_of_history(self, tmp_path):
+        """Days before the first result grow the table backwards and everything survives a save"""
+        results = DailyResults()
+        start = DAY - timedelta(days=3 * 365)
+        self.play(results, start + timedelta(days=100), [True] * 500)
+        self.play(results, start, [offset % 7 != 6 for offset in range(100)])
+        assert results.first_day == start
+        assert results.best_streak() == 2 + 500
+        summary = results.summary(DAY)
+        assert (summary["played"], summary["wins"]) == (600, 586)
+
+        path = str(tmp_path / "results.dat")
+        results.save(path)
+        loaded = DailyResults.load(path)
+        assert loaded.summary(DAY) == summary
+        assert loaded.result(start + timedelta(days=6)) == (False, 4, 1)
+        assert len(results.to_bytes()) < 2 * 3 * 365 + 20
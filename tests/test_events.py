@@ -0,0 +1,155 @@
+"""
+Tests for the event bus and the event-publishing game session
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameSession
+from events import (EventBus, GuessEvaluated, HintGiven, InvalidGuess, RoundEnded,
+                    RoundStarted, SessionEnded, SessionStarted)
+
+
+@pytest.fixture
+def recorded_session():
+    """A seeded session whose events are collected in a list"""
+    bus = EventBus()
+    events = []
+    bus.subscribe_all(events.append)
+    return GameSession(bus, seed=11), events
+
+
+class TestEventBus:
+    """Test cases for subscribing and publishing"""
+
+    def test_typed_subscription(self):
+        """Handlers only receive the event type they subscribed to"""
+        bus = EventBus()
+        hints = []
+        bus.subscribe(HintGiven, hints.append)
+
+        bus.publish(RoundStarted(1, 1))
+        bus.publish(HintGiven(1, 0, "The number is less than 50", 2))
+
+        assert len(hints) == 1
+        assert hints[0].message == "The number is less than 50"
+
+    def test_unsubscribe(self):
+        """Unsubscribed handlers stop receiving events"""
+        bus = EventBus()
+        received = []
+        unsubscribe = bus.subscribe_all(received.append)
+
+        bus.publish(RoundStarted(1, 1))
+        unsubscribe()
+        bus.publish(RoundStarted(2, 2))
+
+        assert len(received) == 1
+
+    def test_events_are_immutable(self):
+        """Events can be shared between consumers safely"""
+        event = RoundStarted(1, 3)
+        with pytest.raises(Exception):
+            event.round_number = 2
+
+
+class TestGameSession:
+    """Test cases for the headless session publishing events"""
+
+    def test_new_session_events(self, recorded_session):
+        """Starting a session publishes the session and first round"""
+        session, events = recorded_session
+        session.new_session(3)
+
+        assert isinstance(events[0], SessionStarted)
+        assert events[0].total_rounds == 3
+        assert events[0].seed == 11
+        assert isinstance(events[1], RoundStarted)
+        assert session.game_active
+
+    def test_guess_events(self, recorded_session):
+        """Guesses publish their evaluation"""
+        session, events = recorded_session
+        session.new_session(1)
+        secret = session.round.secret_number
+        guess = 0 if secret > 0 else 100
+
+        session.make_guess(guess)
+
+        evaluated = [e for e in events if isinstance(e, GuessEvaluated)]
+        assert evaluated[0].guess == guess
+        assert evaluated[0].attempts_left == 6
+
+    def test_out_of_range_is_rejected(self, recorded_session):
+        """Out of range guesses publish InvalidGuess and keep the attempt"""
+        session, events = recorded_session
+        session.new_session(1)
+
+        assert session.make_guess(150) is None
+        assert isinstance(events[-1], InvalidGuess)
+        assert session.round.attempts_left == 7
+
+    def test_win_ends_round_and_session(self, recorded_session):
+        """Winning the last round ends the session"""
+        session, events = recorded_session
+        session.new_session(1)
+
+        assert session.make_guess(session.round.secret_number) == "correct"
+
+        round_ended = [e for e in events if isinstance(e, RoundEnded)][0]
+        assert round_ended.won
+        assert not round_ended.has_next_round
+        assert isinstance(events[-1], SessionEnded)
+        assert events[-1].wins == 1
+
+    def test_next_round_is_left_to_the_caller(self, recorded_session):
+        """A finished round with more to play waits for start_round"""
+        session, events = recorded_session
+        session.new_session(2)
+        session.make_guess(session.round.secret_number)
+
+        assert session.current_round == 2
+        assert not session.game_active
+        session.start_round()
+        assert session.game_active
+        assert isinstance(events[-1], RoundStarted)
+
+    def test_loss_after_all_attempts(self, recorded_session):
+        """Using every attempt loses the round"""
+        session, events = recorded_session
+        session.new_session(1)
+        secret = session.round.secret_number
+        wrong = [n for n in range(101) if n != secret][:7]
+
+        for number in wrong:
+            session.make_guess(number)
+
+        round_ended = [e for e in events if isinstance(e, RoundEnded)][0]
+        assert not round_ended.won
+        assert round_ended.attempts_used == 7
+        assert session.make_guess(secret) is None
+
+    def test_hints(self, recorded_session):
+        """Hints publish HintGiven until they run out"""
+        session, events = recorded_session
+        session.new_session(1)
+
+        messages = [session.get_hint() for _ in range(4)]
+
+        assert messages[3] is None
+        hints = [e for e in events if isinstance(e, HintGiven)]
+        assert [h.hint_level for h in hints] == [0, 1, 2]
+        assert hints[-1].hints_left == 0
+
+    def test_seeded_sessions_repeat(self):
+        """Sessions with the same seed play the same secrets"""
+        first = GameSession(seed=3)
+        second = GameSession(seed=3)
+        first.new_session(5)
+        second.new_session(5)
+
+        assert first.round.secret_number == second.round.secret_number
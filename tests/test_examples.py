@@ -12,8 +12,6 @@ import os
 # Add the parent directory to the path so we can import game
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from game import GuessingGameGUI
-
 
 class TestExampleUsage:
     """Example tests showing how to use the testing framework"""
@@ -37,7 +35,7 @@ class TestExampleUsage:
         assert error is None
         
         # Test invalid input
-        result, error = game.sanitize_input("not_a_number")
+        result, error = game.sanitize_input("not_num")
         assert result is None
         assert error is not None
         assert "valid number" in error
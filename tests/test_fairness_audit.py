@@ -0,0 +1,122 @@
+"""
+Tests for the fairness audit of secret numbers and hint buckets
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import HINT_CUTS, MAX_HINTS, MAX_NUMBER, MIN_NUMBER, optimal_guess
+from fairness_audit import (SecretTally, audit, bucket_difficulty, chi_square_p_value,
+                            chi_square_test, draw_batches, hint_text_mismatches,
+                            midpoint_attempts, runs_test)
+from rules import Rules
+
+
+def naive_runs(values):
+    """Runs above/below 50, skipping 50, counted one value at a time"""
+    symbols = [value > 50 for value in values if value != 50]
+    return 1 + sum(1 for first, second in zip(symbols, symbols[1:]) if first != second)
+
+
+class TestFairnessAudit:
+    """Test cases for the batched audit statistics"""
+
+    def test_tally_matches_naive_counts(self):
+        """Batched counting agrees with a value-by-value count across batch boundaries"""
+        tally = SecretTally()
+        values = []
+        for batch in draw_batches(20000, 777, seed=5):
+            tally.add(batch)
+            values.extend(batch)
+
+        assert tally.total == 20000
+        assert tally.counts == [values.count(value) for value in range(MIN_NUMBER, MAX_NUMBER + 1)]
+        assert tally.runs == naive_runs(values)
+        assert tally.above == sum(1 for value in values if value > 50)
+
+    def test_batches_follow_the_game_stream(self):
+        """The default generator is the game's own seeded stream"""
+        from secret_stream import SecretNumberStream
+
+        drawn = b"".join(draw_batches(1000, 300, seed=9))
+        assert list(drawn) == SecretNumberStream(MIN_NUMBER, MAX_NUMBER, 9).prefetch(1000)
+
+    def test_chi_square_flags_bias(self):
+        """A generator that avoids one number fails the uniformity test"""
+        fair = [1000] * 101
+        biased = [1100] * 100 + [0]
+        assert chi_square_test(fair)[2] > 0.99
+        assert chi_square_test(biased)[2] < 1e-6
+
+    def test_chi_square_p_value_matches_tables(self):
+        """The approximation matches the tabulated 5% and 1% critical values for 100 df"""
+        assert chi_square_p_value(124.342, 100) == pytest.approx(0.05, abs=0.002)
+        assert chi_square_p_value(135.807, 100) == pytest.approx(0.01, abs=0.001)
+
+    def test_runs_test_flags_patterns(self):
+        """Strict alternation and long streaks both fail the runs test"""
+        alternating = SecretTally()
+        alternating.add(bytes([10, 90] * 5000))
+        streaky = SecretTally()
+        streaky.add(bytes([10] * 5000 + [90] * 5000))
+
+        assert runs_test(alternating)[3] < 1e-6
+        assert runs_test(streaky)[3] < 1e-6
+
+    def test_midpoint_attempts_match_strategy_tip(self):
+        """Attempt counts follow the Strategy Tip suggestion"""
+        for secret in range(MIN_NUMBER, MAX_NUMBER + 1):
+            low, high, previous = MIN_NUMBER, MAX_NUMBER, []
+            while True:
+                guess = optimal_guess(low, high, previous)
+                previous.append(guess)
+                if guess == secret:
+                    break
+                low, high = (guess + 1, high) if guess < secret else (low, guess - 1)
+            assert midpoint_attempts(secret, MIN_NUMBER, MAX_NUMBER) == len(previous)
+
+    def test_buckets_cover_the_range_at_every_level(self):
+        """Each hint level partitions the range, and shares add up"""
+        counts = [3] * 101
+        rows = bucket_difficulty(counts)
+        assert {row["hints"] for row in rows} == set(range(MAX_HINTS + 1))
+        for hints in range(MAX_HINTS + 1):
+            level = [row for row in rows if row["hints"] == hints]
+            assert sum(row["size"] for row in level) == 101
+            assert sum(row["share"] for row in level) == pytest.approx(1.0)
+            assert sum(row["fair_share"] for row in level) == pytest.approx(1.0)
+            for row in level:
+                assert row["drawn_mean_attempts"] == pytest.approx(row["mean_attempts"])
+        assert len([row for row in rows if row["hints"] == MAX_HINTS]) == len(HINT_CUTS[MAX_HINTS - 1]) + 1
+
+    def test_buckets_follow_the_rules(self):
+        """Only the hint counts and the range a profile allows get rows"""
+        rules = Rules({"min_number": 1, "max_number": 50, "attempts": 4, "hints": 1,
+                       "hint_levels": [{"cuts": [26], "message": "{low}-{high}"}]})
+        rows = bucket_difficulty([1] * 50, rules)
+        assert [(row["hints"], row["low"], row["high"]) for row in rows] == [(0, 1, 50), (1, 1, 25), (1, 26, 50)]
+        assert rows[0]["win_probability"] == pytest.approx(15 / 50)
+
+    def test_hint_wording_is_truthful(self):
+        """Every hint message range contains the secret it was given for"""
+        assert hint_text_mismatches() == []
+
+    def test_audit_passes_for_the_game_stream(self):
+        """A modest sample from the game generator passes every check"""
+        report = audit(count=200000, batch_size=50000, seed=3)
+        assert report["secrets"] == 200000
+        assert report["fair"]
+
+    def test_randint_generator(self):
+        """The randint comparison generator draws in range"""
+        report = audit(count=5000, batch_size=1000, seed=1, generator="randint")
+        assert sum(report["counts"]) == 5000
+
+    def test_wide_ranges_are_rejected(self):
+        """Ranges that do not fit in a byte cannot be packed"""
+        with pytest.raises(ValueError):
+            next(draw_batches(10, low=0, high=1000))
@@ -0,0 +1,54 @@
+"""
+Tests for the sanitizer fuzzing harness
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzz_inputs import GENERATORS, check_result, fuzz, run_batch
+
+
+class TestFuzzHarness:
+    """Test cases for the fuzzing harness"""
+
+    def test_small_fuzz_run_is_clean(self):
+        """A short seeded run finds no invariant violations"""
+        report = fuzz(count=4000, batch_size=500, seed=3)
+
+        assert report["failures"] == []
+        assert sum(stats["inputs"] for stats in report["sanitize_input"].values()) > 0
+        assert all(stats["seconds"] >= 0 for stats in report["sanitize_rounds_input"].values())
+
+    def test_every_family_generates_strings(self):
+        """Each input family produces strings"""
+        rng = random.Random(0)
+        for name, generator in GENERATORS.items():
+            assert isinstance(generator(rng), str), name
+
+    @pytest.mark.parametrize("result,ok", [
+        ((5, None), True),
+        ((None, "❌ Input cannot be empty!"), True),
+        ((None, None), False),
+        ((5, "❌ both"), False),
+        ((1000, None), False),
+        ((True, None), False),
+        ((None, "no emoji"), False),
+        (5, False),
+    ])
+    def test_check_result(self, result, ok):
+        """Broken results are reported"""
+        assert (check_result(result, -999, 999) is None) == ok
+
+    def test_escaping_exceptions_are_reported(self):
+        """Exceptions raised by a sanitizer become failures"""
+        def broken(text):
+            raise RuntimeError("boom")
+
+        elapsed, failures = run_batch(broken, ["1", "2"], 0, 10)
+        assert len(failures) == 2
+        assert "RuntimeError" in failures[0][1]
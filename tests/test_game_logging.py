@@ -0,0 +1,83 @@
+"""
+Tests for the queue-backed JSON lines logging pipeline
+"""
+
+import json
+import logging
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events import GuessEvaluated, RoundEnded
+from game_logging import DirectQueueHandler, GameLogger, JsonLinesFileHandler, SecondCache
+
+
+def read_records(path):
+    """Read every JSON line written to a log file"""
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+class TestGameLogging:
+    """Test cases for structured logging of attempts and events"""
+
+    def test_second_cache_reuses_text(self):
+        """The cached formatter only changes when the second does"""
+        clock = SecondCache("%H:%M:%S")
+        first = clock(1000.1)
+
+        assert clock(1000.9) is first
+        assert clock(1001.0) != first
+
+    def test_queue_handler_does_not_format(self):
+        """Records reach the queue without being formatted on the caller's thread"""
+        record = logging.makeLogRecord({"msg": "attempt %s", "args": (1,)})
+        handler = DirectQueueHandler(None)
+
+        prepared = handler.prepare(record)
+        assert prepared is record
+        assert prepared.msg == "attempt %s"
+
+    def test_attempts_and_events_written(self, tmp_path):
+        """Attempts and game events end up as JSON lines"""
+        path = str(tmp_path / "game.log.jsonl")
+        game_logger = GameLogger(path)
+        game_logger.log_attempt(42, True, round_number=3)
+        game_logger.log_attempt("abc", False, round_number=3)
+        game_logger.log_event(GuessEvaluated(3, 42, "low", 6, 43, 100))
+        game_logger.log_event(RoundEnded(3, True, 50, 2, 0, False))
+        game_logger.close()
+
+        records = read_records(path)
+        events = [record["event"] for record in records]
+        assert events[:4] == ["attempt", "attempt", "guess", "round_end"]
+        assert records[0]["guess"] == 42 and records[0]["valid"] is True
+        assert records[1]["guess"] == "abc" and records[1]["valid"] is False
+        assert records[2]["result"] == "low"
+        assert records[3]["won"] is True
+        assert all("time" in record for record in records)
+
+    def test_throughput_lines(self, tmp_path):
+        """A throughput line reports records per second"""
+        path = str(tmp_path / "throughput.jsonl")
+        handler = JsonLinesFileHandler(path)
+        for created in (10.1, 10.2, 10.3, 11.5):
+            handler.emit(logging.makeLogRecord({"msg": "attempt", "created": created, "msecs": 0.0}))
+        handler.close()
+
+        throughput = [record for record in read_records(path) if record["event"] == "throughput"]
+        assert throughput[0]["second"] == 10
+        assert throughput[0]["records_per_second"] == 3
+        assert throughput[1]["records_per_second"] == 1
+
+    def test_log_rotation(self, tmp_path):
+        """The sink rotates once the file grows past the limit"""
+        path = str(tmp_path / "rotating.jsonl")
+        game_logger = GameLogger(path, max_bytes=2000, backup_count=2)
+        for guess in range(200):
+            game_logger.log_attempt(guess, True, round_number=1)
+        game_logger.close()
+
+        assert os.path.exists(path + ".1")
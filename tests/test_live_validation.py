@@ -0,0 +1,62 @@
+"""
+Tests for keystroke-level guess validation
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import validate_guess
+from fuzz_inputs import GENERATORS
+from live_validation import LiveGuessValidator
+
+
+def typed(text):
+    """Validator state after typing text one character at a time"""
+    validator = LiveGuessValidator()
+    for char in text:
+        validator.edit("1", str(len(validator)), char, "")
+    return validator
+
+
+class TestLiveGuessValidator:
+    """Test cases for the incremental validator"""
+
+    @pytest.mark.parametrize("text", [
+        "", "42", "  7 ", "-5", "4a2", "101", "<script>", "12345678901", "abc",
+        "1000", "1-2", "-", "  ", "٣", "²", "   12345678   ", "--5",
+    ])
+    def test_matches_validate_guess(self, text):
+        """Typing gives the same verdict as validating the whole string"""
+        assert typed(text).result() == validate_guess(text)
+
+    def test_backspace_restores_previous_state(self):
+        """Deleting from the end undoes keystrokes in O(1)"""
+        validator = typed("42<")
+        assert validator.result()[1] == "❌ Invalid characters detected!"
+        validator.edit("0", "2", "<", "42")
+        assert validator.result() == (42, None)
+
+    def test_middle_edits_rebuild(self):
+        """Edits away from the end fall back to the proposed text"""
+        validator = typed("45")
+        validator.edit("1", "1", "0", "405")
+        assert validator.result() == validate_guess("405")
+        validator.edit("0", "0", "405", "")
+        assert len(validator) == 0
+
+    def test_fuzzed_typing_and_deleting(self):
+        """Random inputs with random backspaces agree with validate_guess"""
+        rng = random.Random(7)
+        generators = [generator for name, generator in GENERATORS.items() if name != "long"]
+        for _ in range(3000):
+            text = rng.choice(generators)(rng)
+            validator = typed(text)
+            assert validator.result() == validate_guess(text), text
+            keep = rng.randint(0, len(text))
+            validator.delete(len(text) - keep)
+            assert validator.result() == validate_guess(text[:keep]), text[:keep]
@@ -0,0 +1,139 @@
+"""
+Tests for lobby matchmaking and the timer wheel
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lobby import Lobby, TimerWheel, simulate
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimerWheel:
+    """Test cases for the hashed timer wheel"""
+
+    def test_timers_fire_after_their_delay(self):
+        """Keys come back once their tick has passed"""
+        wheel = TimerWheel(tick=1.0, slots=8)
+        wheel.schedule(3, "a")
+        wheel.schedule(1, "b")
+        assert wheel.advance(0.5) == []
+        assert wheel.advance(1.0) == ["b"]
+        assert wheel.advance(2.9) == []
+        assert wheel.advance(3.0) == ["a"]
+        assert wheel.active == 0
+
+    def test_delays_longer_than_the_wheel(self):
+        """Timers that wrap around the wheel wait for their own rotation"""
+        wheel = TimerWheel(tick=1.0, slots=4)
+        wheel.schedule(10, "late")
+        fired = []
+        for second in range(1, 12):
+            fired.extend((second, key) for key in wheel.advance(second))
+        assert fired == [(10, "late")]
+
+    def test_cancel_and_long_pause(self):
+        """Cancelled timers never fire, and a long pause fires everything due"""
+        wheel = TimerWheel(tick=1.0, slots=4)
+        handle = wheel.schedule(2, "cancelled")
+        wheel.schedule(3, "x")
+        wheel.schedule(50, "y")
+        wheel.schedule(500, "z")
+        wheel.cancel(handle)
+        assert sorted(wheel.advance(100)) == ["x", "y"]
+        assert wheel.active == 1
+
+
+class TestLobby:
+    """Test cases for rooms and races"""
+
+    def test_rooms_fill_in_arrival_order(self):
+        """Players are matched oldest first and share one secret"""
+        lobby = Lobby(room_size=3, seed=5)
+        assert lobby.join("ann") is None
+        assert lobby.join("bob") is None
+        room = lobby.join("cy")
+        assert list(room.rounds) == ["ann", "bob", "cy"]
+        assert len({game_round.secret_number for game_round in room.rounds.values()}) == 1
+        with pytest.raises(ValueError):
+            lobby.join("bob")
+
+    def test_fewest_attempts_wins(self):
+        """Standings rank winners by attempts and put losers last"""
+        results = []
+        lobby = Lobby(room_size=3, seed=1, on_room_finished=lambda room, standings: results.append(standings))
+        for player in ("ann", "bob", "cy"):
+            lobby.join(player)
+        secret = lobby.round_of("ann").secret_number
+
+        lobby.guess("bob", (secret + 1) % 101)
+        lobby.guess("bob", secret)
+        lobby.guess("ann", secret)
+        wrong = (secret + 50) % 101
+        for _ in range(7):
+            lobby.guess("cy", wrong)
+
+        standings = results[0]
+        assert [(row["player"], row["place"]) for row in standings] == [("ann", 1), ("bob", 2), ("cy", 3)]
+        assert not lobby.rooms and not lobby.player_rooms
+
+    def test_rules_are_enforced(self):
+        """Guesses and hints follow the normal round rules"""
+        lobby = Lobby(room_size=1, seed=2)
+        lobby.join("solo")
+        with pytest.raises(ValueError):
+            lobby.guess("solo", 500)
+        for _ in range(3):
+            lobby.hint("solo")
+        with pytest.raises(ValueError):
+            lobby.hint("solo")
+        with pytest.raises(ValueError):
+            lobby.guess("nobody", 5)
+
+    def test_deadline_closes_room(self):
+        """Rooms past their deadline are closed by the lobby tick"""
+        clock = FakeClock()
+        results = []
+        lobby = Lobby(room_size=2, round_seconds=30, seed=3, clock=clock,
+                      on_room_finished=lambda room, standings: results.append(room))
+        lobby.join("ann")
+        lobby.join("bob")
+        lobby.guess("ann", 0 if lobby.round_of("ann").secret_number else 1)
+
+        clock.now = 29
+        assert lobby.tick() == 0
+        clock.now = 30
+        assert lobby.tick() == 1
+        assert results[0].timed_out
+        assert lobby.wheel.active == 0
+
+    def test_leave(self):
+        """Leaving the queue or forfeiting both work"""
+        lobby = Lobby(room_size=2, seed=4)
+        lobby.join("ann")
+        lobby.leave("ann")
+        assert not lobby.waiting
+        lobby.join("ann")
+        lobby.join("bob")
+        lobby.leave("ann")
+        lobby.leave("bob")
+        assert not lobby.rooms
+
+    def test_simulate_many_rooms(self):
+        """Thousands of rooms finish through one wheel"""
+        report = simulate(rooms=2000, room_size=2, seed=1)
+        assert report["finished_rooms"] == 2000
+        assert report["players"] == 4000
@@ -0,0 +1,94 @@
+"""
+Tests for the message history buffer and export
+"""
+
+import json
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from message_history import MessageHistory, export_history, export_in_background, format_text
+
+
+class TestMessageHistory:
+    """Test cases for buffering and exporting messages"""
+
+    def test_append_and_snapshot(self):
+        """Messages are stored with structured fields"""
+        history = MessageHistory()
+        history.append("📈 25 is too low!", 3, "guess", timestamp=100.0)
+
+        snapshot = history.snapshot()
+        assert snapshot == ((100.0, 3, "guess", "📈 25 is too low!"),)
+
+    def test_snapshot_is_independent(self):
+        """Later messages and clears do not change an earlier snapshot"""
+        history = MessageHistory()
+        history.append("first", 1)
+        snapshot = history.snapshot()
+        history.append("second", 1)
+        history.clear()
+
+        assert len(snapshot) == 1
+        assert len(history) == 0
+
+    def test_format_text_has_timestamp(self):
+        """Text rendering matches the messages box format"""
+        line = format_text((0.0, 1, "info", "🎉 Welcome"))
+        assert line.startswith("[")
+        assert line.endswith("] [round 1] [info] 🎉 Welcome")
+
+    def test_export_jsonl(self, tmp_path):
+        """JSON lines exports keep the structured fields and emoji text"""
+        history = MessageHistory()
+        for round_number in range(1, 1000):
+            history.append(f"🎮 Round {round_number} started!", round_number, "round_start")
+            history.append("📉 80 is too high!", round_number, "guess")
+
+        path = tmp_path / "messages.jsonl"
+        count = export_history(history.snapshot(), str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == len(lines) == 1998
+        record = json.loads(lines[-1])
+        assert record["round"] == 999
+        assert record["event"] == "guess"
+        assert record["text"] == "📉 80 is too high!"
+        assert "timestamp" in record
+
+    def test_export_text(self, tmp_path):
+        """Plain text exports contain the rendered messages"""
+        history = MessageHistory()
+        history.append("💡 Hint: The number is less than 50", 1, "hint")
+
+        path = tmp_path / "messages.txt"
+        export_history(history.snapshot(), str(path))
+
+        assert "[round 1] [hint] 💡 Hint: The number is less than 50" in path.read_text(encoding="utf-8")
+        assert os.listdir(tmp_path) == ["messages.txt"]
+
+    def test_background_export_reports_result(self, tmp_path):
+        """The worker thread reports the number of exported messages"""
+        history = MessageHistory()
+        history.append("hello", 1)
+        results = []
+
+        thread = export_in_background(history.snapshot(), str(tmp_path / "out.txt"),
+                                      lambda count, error: results.append((count, error)))
+        thread.join(timeout=5)
+
+        assert results == [(1, None)]
+
+    def test_background_export_reports_error(self, tmp_path):
+        """Write errors are reported instead of raised on the worker"""
+        results = []
+        (tmp_path / "file").write_text("not a directory")
+        path = tmp_path / "file" / "out.txt"
+
+        thread = export_in_background((), str(path), lambda count, error: results.append((count, error)))
+        thread.join(timeout=5)
+
+        assert results[0][0] == 0
+        assert isinstance(results[0][1], OSError)
@@ -0,0 +1,105 @@
+"""
+Tests for the Prometheus metrics and the localhost endpoint
+"""
+
+import threading
+import urllib.request
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameSession
+from events import EventBus
+from metrics import Counter, GameMetrics, Histogram, error_types, start_metrics_server
+from rules import DEFAULT_RULES, Rules
+
+
+class TestMetrics:
+    """Test cases for counters, histograms and scraping"""
+
+    def test_counter_sums_thread_shards(self):
+        """Increments from many threads are all counted"""
+        counter = Counter("test_total", "Test counter")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.values() == {None: 40000}
+
+    def test_labeled_counter_render(self):
+        """Labels are rendered in Prometheus format"""
+        counter = Counter("hints_total", "Hints", "level")
+        counter.inc(1)
+        counter.inc(1)
+        counter.inc(2)
+
+        lines = counter.render()
+        assert "# TYPE hints_total counter" in lines
+        assert 'hints_total{level="1"} 2' in lines
+        assert 'hints_total{level="2"} 1' in lines
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram buckets count every observation at or below the bound"""
+        histogram = Histogram("latency_seconds", "Latency", (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        lines = histogram.render()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1.0"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_game_events_are_counted(self):
+        """A played session shows up in the game metrics"""
+        bus = EventBus()
+        metrics = GameMetrics()
+        metrics.subscribe(bus)
+        session = GameSession(bus, seed=2)
+        session.new_session(1)
+
+        session.reject_guess("abc", "❌ Please enter a valid number!")
+        session.make_guess(500)
+        session.get_hint()
+        session.make_guess(session.round.secret_number)
+
+        text = metrics.render()
+        assert "guessing_game_guesses_total 1" in text
+        assert 'guessing_game_invalid_inputs_total{error="not_a_number"} 1' in text
+        assert 'guessing_game_invalid_inputs_total{error="game_range"} 1' in text
+        assert 'guessing_game_hints_total{level="1"} 1' in text
+        assert 'guessing_game_rounds_total{outcome="win"} 1' in text
+        assert "guessing_game_round_duration_seconds_count 1" in text
+
+    def test_error_types_follow_the_rules(self):
+        """The length error is labelled with the message of the profile's own limit"""
+        rules = Rules({"max_number": 9999, "max_input": 99999, "max_input_length": 7})
+        assert error_types(DEFAULT_RULES)[DEFAULT_RULES.messages["too_long"]] == "too_long"
+        assert error_types(rules)["❌ Input too long! Maximum 7 characters."] == "too_long"
+        assert DEFAULT_RULES.messages["too_long"] not in error_types(rules)
+
+    def test_http_endpoint(self):
+        """The endpoint serves metrics on localhost"""
+        metrics = GameMetrics()
+        metrics.guesses.inc()
+        server = start_metrics_server(metrics, 0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert "guessing_game_guesses_total 1" in body
+        assert content_type.startswith("text/plain")
@@ -0,0 +1,78 @@
+"""
+Tests for the compact round history
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameSession
+from round_history import RoundHistory
+
+
+class TestRoundHistory:
+    """Test cases for the array-backed history"""
+
+    def test_round_trip(self):
+        """Recorded rounds read back unchanged"""
+        history = RoundHistory()
+        history.record(42, [50, 25, 37, 42], 1, True)
+        history.record(7, [50, 25, 12, 6, 9, 8, 10], 3, False)
+
+        assert len(history) == 2
+        assert history.round(0) == {"secret": 42, "guesses": [50, 25, 37, 42], "hints_used": 1, "won": True}
+        assert list(history.guesses(-1)) == [50, 25, 12, 6, 9, 8, 10]
+        assert list(history) == [(42, 4, 1, True), (7, 7, 3, False)]
+
+    def test_rounds_spanning_slabs(self):
+        """Guesses that cross a slab boundary are split into views"""
+        history = RoundHistory(slab_size=5)
+        history.record(1, [1, 2, 3], 0, True)
+        history.record(6, [4, 5, 6], 0, True)
+        history.record(0, [], 0, False)
+        history.record(9, [7, 8, 9, 10, 11, 12, 9], 2, True)
+
+        assert [len(view) for view in history.guess_views(1)] == [2, 1]
+        assert list(history.guesses(1)) == [4, 5, 6]
+        assert list(history.guesses(2)) == []
+        assert list(history.guesses(3)) == [7, 8, 9, 10, 11, 12, 9]
+        assert list(history.attempts()) == [3, 3, 0, 7]
+        assert all(len(slab) <= 5 for slab in history.slabs)
+
+    def test_index_errors(self):
+        """Out-of-range rounds raise IndexError"""
+        history = RoundHistory()
+        with pytest.raises(IndexError):
+            history.round(0)
+
+    def test_few_bytes_per_guess(self):
+        """A long session stays within a few bytes per guess"""
+        history = RoundHistory()
+        for round_number in range(100000):
+            history.record(43, [50, 25, 37, 43], round_number % 4, True)
+        assert history.nbytes() / history.total_guesses < 6
+
+    def test_session_records_finished_rounds(self):
+        """GameSession keeps every finished round and resets with a new session"""
+        session = GameSession(seed=9)
+        session.new_session(2)
+        secret = session.round.secret_number
+        session.get_hint()
+        session.make_guess(50 if secret != 50 else 49)
+        session.make_guess(secret)
+        session.start_round()
+        guess = 0
+        while session.game_active:
+            session.make_guess(guess)
+            guess += 1
+
+        assert len(session.history) == 2
+        first = session.history.round(0)
+        assert first["secret"] == secret and first["won"] and first["hints_used"] == 1
+        assert first["guesses"][-1] == secret
+
+        session.new_session(1)
+        assert len(session.history) == 0
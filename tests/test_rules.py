@@ -0,0 +1,201 @@
+"""
+Tests for rules profiles and their compiled tables
+"""
+
+import pytest
+import sys
+import os
+import json
+import random
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bots import BinarySearchPlayer, evaluate, play_round
+from engine import (GameRound, GameSession, generate_hint, hint_bounds, sanitize_input,
+                    sanitize_rounds_input, validate_guess)
+from fairness_audit import SecretTally, draw_batches, hint_text_mismatches
+from hint_oracle import advise, hint_bits
+from live_validation import LiveGuessValidator
+from rules import DEFAULT_RULES, Rules, RulesError, active_rules, load_rules, use_rules
+from session_stats import AttemptDistribution
+from strategy_analysis import hint_buckets
+
+CLASSROOM_TOML = """
+min_number = 1
+max_number = 50
+attempts = 6
+hints = 2
+max_rounds = 20
+
+[[hint_levels]]
+cuts = [26]
+message = "Between {low} and {high}"
+
+[[hint_levels]]
+cuts = [13, 26, 38]
+message = "From {low} to {high}"
+
+[messages]
+thinking = "Pick from {low} to {high}!"
+"""
+
+
+@pytest.fixture
+def classroom(tmp_path):
+    path = tmp_path / "classroom.toml"
+    path.write_text(CLASSROOM_TOML, encoding="utf-8")
+    return load_rules(str(path))
+
+
+@pytest.fixture
+def restore_rules():
+    yield
+    use_rules(None)
+
+
+class TestDefaultRules:
+    """Test cases for the built-in profile"""
+
+    def test_hint_messages_match_the_original_wording(self):
+        """The default tables keep every hint message the game always had"""
+        assert generate_hint(49, 0) == "The number is less than 50"
+        assert generate_hint(50, 0) == "The number is 50 or greater"
+        assert generate_hint(24, 1) == "The number is between 0 and 25"
+        assert generate_hint(12, 2) == "The number is between 0 and 12"
+        assert generate_hint(37, 2) == "The number is between 25 and 38"
+        assert generate_hint(100, 3) == "The number is between 94 and 100"
+        assert generate_hint(100, 9) == generate_hint(100, 3)
+
+    def test_bucket_tables_agree_with_the_cuts(self):
+        """Every number's bucket matches the cuts, including custom round ranges"""
+        for level, cuts in enumerate(DEFAULT_RULES.hint_cuts):
+            for number in range(DEFAULT_RULES.low, DEFAULT_RULES.high + 1):
+                low, high = hint_bounds(number, level)
+                assert low <= number <= high
+                assert low == DEFAULT_RULES.low or low in cuts
+                assert high == DEFAULT_RULES.high or high + 1 in cuts
+        assert hint_bounds(5, 0, -10, 200) == (-10, 49)
+        assert hint_bounds(80, 0, -10, 200) == (50, 200)
+
+    def test_label_colors(self):
+        """Attempts turn orange at four left and red at two; hints grey out at zero"""
+        assert [DEFAULT_RULES.attempt_color(left) for left in (7, 5, 4, 3, 2, 0)] == [
+            "#4CAF50", "#4CAF50", "#FF9800", "#FF9800", "#F44336", "#F44336"]
+        assert DEFAULT_RULES.hint_color(0) == "#757575"
+        assert DEFAULT_RULES.hint_color(3) == "#FF9800"
+
+    def test_messages(self):
+        """Messages are formatted once from the profile values"""
+        assert DEFAULT_RULES.messages["too_long"] == "❌ Input too long! Maximum 10 characters."
+        assert DEFAULT_RULES.messages["too_many_rounds"] == "❌ Maximum 999 rounds allowed!"
+        assert DEFAULT_RULES.range_message(0, 100) == "❌ Number must be between 0 and 100!"
+        assert DEFAULT_RULES.range_message(1, 10) == "❌ Number must be between 1 and 10!"
+
+
+class TestCustomRules:
+    """Test cases for loading and using another profile"""
+
+    def test_toml_profile(self, classroom):
+        """A partial TOML profile overrides only what it sets"""
+        assert (classroom.low, classroom.high, classroom.attempts, classroom.hints) == (1, 50, 6, 2)
+        assert classroom.max_input_length == 10
+        assert classroom.hint_message(20, 0) == "Between 1 and 25"
+        assert classroom.hint_message(40, 1) == "From 38 to 50"
+        assert classroom.messages["thinking"] == "Pick from 1 to 50!"
+        assert classroom.messages["opening_tip"] == "💡 Pro tip: Start with 25 to use binary search strategy!"
+
+    def test_json_profile(self, tmp_path):
+        """JSON profiles are read the same way"""
+        path = tmp_path / "short.json"
+        path.write_text(json.dumps({"attempts": 3, "attempt_colors": [{"min_left": 0, "color": "#123456"}]}))
+        rules = load_rules(str(path))
+        assert rules.attempts == 3
+        assert rules.attempt_colors == ("#123456",) * 4
+
+    def test_engine_follows_the_profile(self, classroom):
+        """Sessions, rounds and input checks use the profile's tables"""
+        session = GameSession(seed=3, rules=classroom)
+        session.new_session(1)
+        game_round = session.round
+        assert 1 <= game_round.secret_number <= 50
+        assert (game_round.attempts_left, game_round.hints_left) == (6, 2)
+
+        assert validate_guess("0", rules=classroom) == (None, "❌ Number must be between 1 and 50!")
+        assert session.make_guess(51) is None
+        assert sanitize_rounds_input("20", classroom) == (20, None)
+        assert sanitize_rounds_input("21", classroom) == (None, "❌ Maximum 20 rounds allowed!")
+        assert sanitize_rounds_input("100", classroom) == (None, "❌ Maximum 20 rounds allowed!")
+
+        message, bounds = game_round.hint()
+        assert message == classroom.hint_message(game_round.secret_number, 0)
+        assert bounds[0] <= game_round.secret_number <= bounds[1]
+
+    def test_active_rules_are_the_default(self, classroom, restore_rules):
+        """Components without their own rules use the active profile"""
+        use_rules(classroom)
+        assert active_rules() is classroom
+        assert GameRound(10).attempts_left == 6
+        assert sanitize_input("abcdefghijk") == (None, "❌ Input too long! Maximum 10 characters.")
+        use_rules(None)
+        assert active_rules() is DEFAULT_RULES
+
+    def test_tools_follow_the_active_profile(self, classroom, restore_rules):
+        """Bots, analysis, the hint oracle, the audit and the stats model read the active profile"""
+        use_rules(classroom)
+        game_round = play_round(BinarySearchPlayer(), 50)
+        assert game_round.won and (game_round.low, game_round.high) == (1, 50)
+        assert evaluate("binary", rounds=200, workers=1)["win_rate"] == 100.0
+        assert hint_buckets(50, 1) == [25, 25]
+        assert hint_bits(1, 50, 0) == pytest.approx(1.0)
+        assert advise(1, 50, 0, 6, 2)["guess"] == 25
+        assert AttemptDistribution().max_attempts == 6
+        assert len(SecretTally().counts) == 50
+        assert max(max(batch) for batch in draw_batches(5000, 1000)) == 49
+        assert hint_text_mismatches() == []
+
+    def test_live_validation_follows_the_profile(self):
+        """The keystroke validator agrees with validate_guess under another profile"""
+        rules = Rules({"min_number": -20, "max_number": 20, "min_input": -9999, "max_input": 9999,
+                       "max_input_length": 6,
+                       "hint_levels": [{"cuts": [0], "message": "{low}..{high}"}]})
+        rng = random.Random(1)
+        for _ in range(2000):
+            text = "".join(rng.choice(" -0123456789x") for _ in range(rng.randint(0, 9)))
+            validator = LiveGuessValidator(rules=rules)
+            validator.insert(text)
+            assert validator.result() == validate_guess(text, rules=rules), text
+
+    @pytest.mark.parametrize("profile, problem", [
+        ({"colour": "red"}, "Unknown rules setting"),
+        ({"attempts": 0}, "attempts"),
+        ({"attempts": True}, "attempts must be an integer"),
+        ({"min_number": 10, "max_number": 10}, "min_number"),
+        ({"max_input_length": 2}, "max_input_length"),
+        ({"max_number": 40000, "max_input": 99999}, "-32768..32767"),
+        ({"hints": 200}, "hints must be between"),
+        ({"max_number": 2000}, "min_input..max_input"),
+        ({"hint_levels": [{"cuts": [50], "message": "x"}, {"cuts": [25, 75], "message": "x"}]}, "include every cut"),
+        ({"hint_levels": [{"cuts": [0], "message": "x"}]}, "inside the game range"),
+        ({"hint_levels": [{"cuts": [50], "messages": ["only one"]}]}, "one message per bucket"),
+        ({"hint_levels": [{"cuts": [50], "message": "{middle}"}]}, "template"),
+        ({"attempt_colors": [{"min_left": 1, "color": "#FFFFFF"}]}, "cover 0 attempts"),
+        ({"hint_colors": {"available": "orange", "used_up": "#757575"}}, "hint_colors"),
+        ({"messages": {"greeting": "hi"}}, "Unknown message"),
+        ({"messages": {"thinking": 5}}, "messages.thinking must be a string"),
+        ({"hint_levels": [{"cuts": [50], "messages": ["low", 7]}]}, "must be strings"),
+        ({"hint_levels": [{"cuts": [50], "message": "{low.x}"}]}, "template"),
+        ({"hint_levels": [{"cuts": [50], "message": "{low[0]}"}]}, "template"),
+        ({"messages": {"thinking": "{attempts.real.x}"}}, "template"),
+    ])
+    def test_invalid_profiles_are_rejected(self, profile, problem):
+        """Mistakes in a profile are reported before anything uses it"""
+        with pytest.raises(RulesError, match=problem):
+            Rules(profile)
+
+    def test_unparsable_file(self, tmp_path):
+        """Syntax errors surface as RulesError"""
+        path = tmp_path / "broken.toml"
+        path.write_text("attempts = ", encoding="utf-8")
+        with pytest.raises(RulesError):
+            load_rules(str(path))
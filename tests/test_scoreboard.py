@@ -0,0 +1,133 @@
+"""
+Tests for the shared-memory scoreboard
+"""
+
+import multiprocessing
+import pytest
+import sys
+import os
+import uuid
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameSession
+from events import EventBus
+import scoreboard
+from scoreboard import SLOT, Scoreboard, ScoreboardError
+
+
+@pytest.fixture
+def board_name():
+    name = f"ngsb_test_{uuid.uuid4().hex[:12]}"
+    yield name
+    board = Scoreboard(name)
+    board.unlink()
+    board.close()
+
+
+def _hammer(name, rounds):
+    """Child process: record rounds keeping attempts == 3 * rounds and hints == wins"""
+    board = Scoreboard(name)
+    board.join("child")
+    for number in range(rounds):
+        board.record_round(number % 2 == 0, 3, number % 2 == 0)
+    board.close()
+
+
+class TestScoreboard:
+    """Test cases for the shared table"""
+
+    def test_processes_share_one_table(self, board_name):
+        """Every attached view sees the other processes' slots and totals"""
+        first = Scoreboard(board_name, slots=8)
+        second = Scoreboard(board_name, slots=64)
+        assert second.slots == 8
+
+        first.join("alice")
+        second.join("bob", pid=os.getpid() + 1)
+        first.record_round(True, 4, 1)
+        first.record_round(False, 7, 3)
+        second.record_round(True, 2)
+
+        rows = {row[7]: row for row in second.read()}
+        assert rows["alice"][1:6] == (os.getpid(), 1, 2, 11, 4)
+        assert rows["bob"][1:6] == (os.getpid() + 1, 1, 1, 2, 0)
+        totals = first.totals()
+        assert (totals["players"], totals["wins"], totals["rounds"], totals["attempts"]) == (2, 2, 3, 13)
+        assert totals["win_rate"] == pytest.approx(2 / 3)
+
+        second.close()
+        assert [row[7] for row in first.read()] == ["alice"]
+        first.close()
+
+    def test_dead_process_slots_are_reclaimed(self, board_name):
+        """A slot whose process is gone is claimed again, and a full table is an error"""
+        child = multiprocessing.Process(target=os.getpid)
+        child.start()
+        child.join()
+        ghost = Scoreboard(board_name, slots=2)
+        ghost.join("ghost", pid=child.pid)
+        live = Scoreboard(board_name)
+        live.join("live")
+        other = Scoreboard(board_name)
+        other.join("other", pid=os.getppid())
+        assert sorted(row[7] for row in live.read()) == ["live", "other"]
+        full = Scoreboard(board_name)
+        with pytest.raises(ScoreboardError):
+            full.join("full", pid=os.getppid())
+        for board in (ghost, live, other, full):
+            board.close()
+
+    def test_slot_mid_write_is_skipped(self, board_name):
+        """A reader never returns a slot whose sequence number is odd"""
+        board = Scoreboard(board_name, slots=4)
+        index = board.join("writer")
+        board.record_round(True, 3)
+        board._words[index * (SLOT.size // 8)] += 1
+        assert board.read(retries=3) == []
+        board._words[index * (SLOT.size // 8)] += 1
+        assert board.read()[0][2:4] == (1, 1)
+        board.close()
+
+    def test_rounds_from_the_event_bus(self, board_name):
+        """attach() records every round the engine finishes"""
+        board = Scoreboard(board_name, slots=4)
+        board.join("player")
+        session = GameSession(EventBus(), seed=5)
+        board.attach(session.bus)
+        session.new_session(2)
+        session.make_guess(session.round.secret_number)
+        session.start_round()
+        session.make_guess(session.round.secret_number)
+        totals = board.totals()
+        assert (totals["wins"], totals["rounds"], totals["attempts"]) == (2, 2, 2)
+        board.close()
+
+    def test_reads_stay_consistent_under_concurrent_writes(self, board_name):
+        """Seqlocks keep every snapshot of a slot whole while its process writes"""
+        board = Scoreboard(board_name, slots=16)
+        child = multiprocessing.Process(target=_hammer, args=(board_name, 20000))
+        child.start()
+        seen = 0
+        while child.is_alive():
+            for _, _, wins, rounds, attempts, hints, _, _ in board.read():
+                assert attempts == 3 * rounds
+                assert hints == wins == (rounds + 1) // 2
+                seen += 1
+        child.join()
+        assert child.exitcode == 0
+        assert seen > 0
+        board.close()
+
+    def test_unknown_segment_is_rejected(self, board_name, monkeypatch):
+        """Shared memory that is not a scoreboard is never used as one"""
+        from multiprocessing import shared_memory
+        monkeypatch.setattr(scoreboard, "ATTACH_TIMEOUT", 0.01)
+        other = shared_memory.SharedMemory(board_name + "_x", create=True, size=4096)
+        try:
+            with pytest.raises(ScoreboardError):
+                Scoreboard(board_name + "_x")
+        finally:
+            other.close()
+            other.unlink()
@@ -0,0 +1,97 @@
+"""
+Tests for the seeded secret number stream
+These tests only use the standard library and never touch the GUI
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from secret_stream import SecretNumberStream
+
+
+class TestSecretNumberStream:
+    """Test cases for reproducible secret number generation"""
+
+    def test_same_seed_same_session(self):
+        """Two streams with the same seed produce the same secrets"""
+        first = SecretNumberStream(0, 100, seed=1234)
+        second = SecretNumberStream(0, 100, seed=1234)
+
+        assert first.prefetch(999) == second.prefetch(999)
+
+    def test_different_seeds_differ(self):
+        """Different seeds produce different sessions"""
+        first = SecretNumberStream(0, 100, seed=1).prefetch(50)
+        second = SecretNumberStream(0, 100, seed=2).prefetch(50)
+
+        assert first != second
+
+    def test_secrets_in_range(self):
+        """Every secret lies within the inclusive range"""
+        stream = SecretNumberStream(0, 100, seed=7)
+        secrets = stream.prefetch(10000)
+
+        assert min(secrets) >= 0
+        assert max(secrets) <= 100
+        # With 10000 draws every value should show up
+        assert len(set(secrets)) == 101
+
+    def test_prefetch_matches_incremental_draws(self):
+        """Prefetching does not change the sequence of secrets"""
+        bulk = SecretNumberStream(0, 100, seed=99)
+        bulk.prefetch(20)
+        incremental = SecretNumberStream(0, 100, seed=99)
+
+        assert [bulk.next_secret() for _ in range(30)] == [incremental.next_secret() for _ in range(30)]
+
+    def test_take_consumes_secrets(self):
+        """Taken secrets are not handed out again"""
+        taken = SecretNumberStream(0, 100, seed=42)
+        incremental = SecretNumberStream(0, 100, seed=42)
+
+        assert taken.take(10) + taken.take(5) == [incremental.next_secret() for _ in range(15)]
+        assert taken.remaining() == 0
+
+    def test_remaining_count(self):
+        """Remaining tracks how many prefetched secrets are left"""
+        stream = SecretNumberStream(0, 100, seed=5)
+        stream.prefetch(5)
+        stream.next_secret()
+        stream.next_secret()
+
+        assert stream.remaining() == 3
+
+    def test_handed_out_lets_a_new_stream_continue(self):
+        """Skipping handed_out secrets on a fresh stream continues the same sequence"""
+        stream = SecretNumberStream(0, 100, seed=11)
+        stream.prefetch(5)
+        stream.next_secret()
+        stream.take(3)
+        stream.next_secret()
+        assert stream.handed_out == 5
+
+        resumed = SecretNumberStream(0, 100, seed=11)
+        resumed.take(stream.handed_out)
+        assert [resumed.next_secret() for _ in range(4)] == [stream.next_secret() for _ in range(4)]
+
+    def test_seed_is_reported_when_not_given(self):
+        """A seed is chosen and exposed when none is provided"""
+        stream = SecretNumberStream(0, 100)
+        replay = SecretNumberStream(0, 100, seed=stream.seed)
+
+        assert isinstance(stream.seed, int)
+        assert stream.prefetch(10) == replay.prefetch(10)
+
+    def test_single_value_range(self):
+        """A range with one value always returns that value"""
+        stream = SecretNumberStream(42, 42, seed=0)
+        assert stream.prefetch(3) == [42, 42, 42]
+
+    def test_invalid_range(self):
+        """An inverted range is rejected"""
+        with pytest.raises(ValueError):
+            SecretNumberStream(10, 5)
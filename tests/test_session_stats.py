@@ -0,0 +1,60 @@
+"""
+Tests for the session statistics model
+"""
+
+import subprocess
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_stats import AttemptDistribution, performance_feedback
+
+
+class TestAttemptDistribution:
+    """Test cases for the incremental chart data"""
+
+    def test_only_changed_slots_are_redrawn(self):
+        """Recording a round marks just its bar"""
+        distribution = AttemptDistribution(max_attempts=7)
+        assert distribution.take_changes() == list(range(8))
+
+        distribution.record(True, 3)
+        distribution.record(False, 7)
+        assert distribution.take_changes() == [2, 7]
+        assert distribution.take_changes() == []
+        assert distribution.wins == 1 and distribution.rounds == 2
+
+    def test_growing_ceiling_redraws_every_bar(self):
+        """Bars are rescaled only when the ceiling doubles"""
+        distribution = AttemptDistribution(max_attempts=7)
+        distribution.take_changes()
+        for _ in range(4):
+            distribution.record(True, 4)
+        assert distribution.ceiling == 4
+        assert distribution.take_changes() == [3]
+
+        distribution.record(True, 4)
+        assert distribution.ceiling == 8
+        assert distribution.take_changes() == list(range(8))
+
+    def test_reset(self):
+        """A new session clears the counts"""
+        distribution = AttemptDistribution()
+        distribution.record(True, 1)
+        distribution.reset()
+        assert distribution.rounds == 0
+
+    def test_feedback(self):
+        """Feedback matches the old statistics dialog"""
+        assert performance_feedback(80) == "🎉 Excellent performance!"
+        assert performance_feedback(50) == "👍 Good job!"
+        assert performance_feedback(10) == "💪 Keep practicing!"
+
+    def test_model_needs_no_tk(self):
+        """The model imports on a machine without Tk"""
+        code = ("import sys; sys.modules['tkinter'] = sys.modules['customtkinter'] = None; "
+                "import session_stats")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
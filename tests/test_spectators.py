@@ -0,0 +1,111 @@
+"""
+Tests for the spectator broadcast hub using localhost sockets
+"""
+
+import json
+import socket
+import sys
+import os
+import time
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events import EventBus, GuessEvaluated, HintGiven, SessionStarted
+from spectators import SpectatorHub, serialize_event
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+def read_lines(sock, count, timeout=5.0):
+    """Read count JSON lines from a spectator socket"""
+    sock.settimeout(timeout)
+    data = b""
+    while data.count(b"\n") < count:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+class TestSpectatorHub:
+    """Test cases for the spectator fan-out"""
+
+    def test_serialize_event(self):
+        """Events become one JSON line with their kind"""
+        line = serialize_event(HintGiven(2, 0, "The number is less than 50", 2))
+        assert line.endswith(b"\n")
+        assert json.loads(line) == {"event": "hint", "round_number": 2, "hint_level": 0,
+                                    "message": "The number is less than 50", "hints_left": 2}
+
+    def test_seed_is_never_broadcast(self):
+        """The session seed would give away every secret, so spectators do not get it"""
+        assert json.loads(serialize_event(SessionStarted(5, 123456789))) == {"event": "session_start",
+                                                                             "total_rounds": 5}
+
+    def test_every_spectator_gets_every_event(self):
+        """Bus events reach all connected spectators in order"""
+        hub = SpectatorHub()
+        bus = EventBus()
+        hub.attach(bus)
+        clients = [socket.create_connection(hub.address) for _ in range(20)]
+        try:
+            wait_for(lambda: hub.spectator_count == 20)
+            for guess in range(10):
+                bus.publish(GuessEvaluated(1, guess, "low", 6, guess + 1, 100))
+
+            for client in clients:
+                lines = read_lines(client, 10)
+                assert [line["guess"] for line in lines] == list(range(10))
+        finally:
+            for client in clients:
+                client.close()
+            hub.close()
+
+    def test_slow_spectator_is_dropped(self):
+        """A spectator that never reads is disconnected while fast ones keep up"""
+        hub = SpectatorHub(max_buffer=4096, send_buffer_size=4096)
+        slow = socket.socket()
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow.connect(hub.address)
+        fast = socket.create_connection(hub.address)
+        try:
+            wait_for(lambda: hub.spectator_count == 2)
+            payload = b"x" * 1000 + b"\n"
+            received = 0
+            fast.settimeout(5)
+            for _ in range(2000):
+                hub.publish_bytes(payload)
+                # The fast spectator drains as it goes; publishing never blocks on the slow one
+                while received < hub.events_published * len(payload) - 2048:
+                    received += len(fast.recv(65536))
+
+            wait_for(lambda: hub.dropped == 1)
+            assert hub.spectator_count == 1
+            while received < 2000 * len(payload):
+                received += len(fast.recv(65536))
+            assert received == 2000 * len(payload)
+        finally:
+            slow.close()
+            fast.close()
+            hub.close()
+
+    def test_closed_spectators_are_removed(self):
+        """Disconnecting spectators are forgotten without counting as dropped"""
+        hub = SpectatorHub()
+        client = socket.create_connection(hub.address)
+        try:
+            wait_for(lambda: hub.spectator_count == 1)
+            client.close()
+            wait_for(lambda: hub.spectator_count == 0)
+            assert hub.dropped == 0
+        finally:
+            hub.close()
@@ -0,0 +1,122 @@
+"""
+Tests for the main-loop stall watchdog
+"""
+
+import sys
+import os
+import time
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stall_watchdog import StallWatchdog, describe_handler
+
+
+class FakeRoot:
+    """Collects after() callbacks so the test decides when the 'main loop' runs"""
+
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, delay, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def pump(self):
+        jobs, self.jobs = self.jobs, []
+        for callback in jobs:
+            callback()
+
+
+def make_guess(duration):
+    """Stands in for a slow Tk handler"""
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        pass
+
+
+def fake_module(path, source):
+    """Functions whose frames report a file name like a real tkinter module"""
+    namespace = {}
+    exec(compile(source, os.path.join(os.sep, "lib", *path.split("/")), "exec"), namespace)
+    return namespace
+
+
+class TestStallWatchdog:
+    """Test cases for stall detection"""
+
+    def test_stall_is_sampled_with_handler(self):
+        """A busy handler is reported once with its name and stack"""
+        root = FakeRoot()
+        reports = []
+        watchdog = StallWatchdog(root, threshold=0.1, interval=0.02,
+                                 on_stall=lambda *report: reports.append(report), app_files=[__file__])
+        watchdog.start()
+        try:
+            make_guess(0.4)
+            root.pump()
+        finally:
+            watchdog.stop()
+
+        assert len(reports) == 1
+        seconds, handler, stack = reports[0]
+        assert seconds > 0.1
+        # The outermost frame from the app files is the callback that is still running
+        assert handler == "test_stall_is_sampled_with_handler"
+        assert "make_guess" in stack
+
+    def test_healthy_loop_reports_nothing(self):
+        """Regular beats keep the watchdog quiet and record drift"""
+        root = FakeRoot()
+        reports = []
+        watchdog = StallWatchdog(root, threshold=0.2, interval=0.01, on_stall=lambda *report: reports.append(report))
+        watchdog.start()
+        try:
+            for _ in range(20):
+                time.sleep(0.01)
+                root.pump()
+        finally:
+            watchdog.stop()
+
+        assert reports == []
+        assert watchdog.beats >= 20
+        assert watchdog.max_drift < 0.2
+
+    def test_handler_below_tk_dispatch(self):
+        """Module code that started the main loop is not mistaken for the handler"""
+        tk = fake_module("tkinter/__init__.py", """
+def mainloop(callback):
+    return callback()
+
+def __call__(callback):
+    return callback()
+""")
+        captured = {}
+
+        def make_guess():
+            captured["frame"] = sys._getframe()
+
+        def run():
+            tk["mainloop"](lambda: tk["__call__"](make_guess))
+
+        run()
+        assert describe_handler(captured["frame"], {os.path.abspath(__file__)}) == "make_guess"
+
+    def test_dialog_frames_win(self):
+        """A stall inside a messagebox is attributed to the dialog"""
+        messagebox = fake_module("tkinter/messagebox.py", """
+import sys
+
+def _show(captured):
+    captured["frame"] = sys._getframe()
+
+def showinfo(captured):
+    _show(captured)
+""")
+        captured = {}
+        messagebox["showinfo"](captured)
+
+        assert describe_handler(captured["frame"], {os.path.abspath(__file__)}) == "messagebox.showinfo"
@@ -0,0 +1,89 @@
+"""
+Tests for the closed-form strategy analysis
+"""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import HINT_CUTS, MAX_NUMBER, MIN_NUMBER, hint_bounds, optimal_guess
+from strategy_analysis import analyze, attempt_distribution, hint_buckets, mean_attempts, win_probability
+
+
+def simulated_attempts(secret, low, high):
+    """Play one secret with the Strategy Tip policy and count the guesses"""
+    previous = []
+    while True:
+        guess = optimal_guess(low, high, previous)
+        previous.append(guess)
+        if guess == secret:
+            return len(previous)
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+class TestStrategyAnalysis:
+    """Test cases for the closed-form analysis"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 10, 64, 101, 257])
+    def test_distribution_matches_simulation(self, size):
+        """Counting over the tree agrees with playing every secret"""
+        expected = {}
+        for secret in range(size):
+            attempts = simulated_attempts(secret, 0, size - 1)
+            expected[attempts] = expected.get(attempts, 0) + 1
+
+        distribution = attempt_distribution(size)
+        assert sum(distribution) == size
+        assert {index + 1: count for index, count in enumerate(distribution) if count} == expected
+
+    def test_game_range_with_seven_attempts_always_wins(self):
+        """101 numbers fit in seven midpoint guesses"""
+        assert len(attempt_distribution(101)) == 7
+        assert win_probability(101, 7) == 1.0
+        assert win_probability(101, 6) < 1.0
+
+    def test_game_hint_buckets_follow_hint_table(self):
+        """Buckets for the game range match the hints the game actually gives"""
+        for hints, cuts in enumerate(HINT_CUTS, start=1):
+            buckets = hint_buckets(MAX_NUMBER - MIN_NUMBER + 1, hints)
+            assert len(buckets) == len(cuts) + 1
+            assert sum(buckets) == MAX_NUMBER - MIN_NUMBER + 1
+            sizes = sorted({high - low + 1 for low, high in
+                            (hint_bounds(n, hints - 1, MIN_NUMBER, MAX_NUMBER) for n in range(101))})
+            assert sorted(set(buckets)) == sizes
+
+    def test_hints_never_hurt(self):
+        """Each extra hint keeps or raises the win probability"""
+        for size in (10, 1000, 10 ** 6):
+            chances = [win_probability(size, 7, hints) for hints in range(4)]
+            assert chances == sorted(chances)
+
+    def test_billion_range_is_fast_and_exact(self):
+        """10^9 secrets are counted exactly without enumerating them"""
+        distribution = attempt_distribution(10 ** 9)
+        assert sum(distribution) == 10 ** 9
+        assert len(distribution) == 30
+        assert distribution[:3] == (1, 2, 4)
+
+    def test_analyze_rows(self):
+        """One row per configuration"""
+        rows = analyze(ranges=(10, 100), attempts=(3, 7), hints=(0, 1))
+        assert len(rows) == 8
+        assert rows[0]["range"] == 10 and rows[0]["attempts"] == 3 and rows[0]["hints"] == 0
+        assert rows[0]["win_probability"] == pytest.approx(7 / 10)
+
+    def test_mean_attempts_follow_the_limit_and_hints(self):
+        """The mean counts a lost round as every attempt and narrows with hints"""
+        # Ten secrets take 1, 2, 2, 3, 3, 3, 3, 4, 4, 4 guesses without a limit
+        assert mean_attempts(10) == pytest.approx(29 / 10)
+        assert mean_attempts(10, attempts=3) == pytest.approx((1 + 2 * 2 + 3 * 4 + 3 * 3) / 10)
+        assert mean_attempts(10, attempts=3, hints=1) < mean_attempts(10, attempts=3)
+        rows = analyze(ranges=(10,), attempts=(3,), hints=(0, 1))
+        assert [row["mean_attempts"] for row in rows] == [mean_attempts(10, 3, 0), mean_attempts(10, 3, 1)]
+        assert [row["worst_case"] for row in rows] == [3, 3]